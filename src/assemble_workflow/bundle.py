@@ -12,8 +12,11 @@ import subprocess
 import tarfile
 import tempfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 from paths.script_finder import ScriptFinder
+from system.parallel_gzip import ParallelGzipFile
+from system.process_runner import ProcessRunner
 
 """
 This class is responsible for executing the build of the full bundle and passing results to a bundle recorder.
@@ -36,33 +39,53 @@ class Bundle(ABC):
         self.bundle_recorder = bundle_recorder
         self.tmp_dir = tempfile.TemporaryDirectory()
         self.installed_plugins = []
-        self.min_tarball_path = self._copy_component(self.min_tarball, "bundle")
+        self.min_tarball_path = self._find_component(self.min_tarball, "bundle")
         self.__unpack_min_tarball(self.tmp_dir.name)
 
     def install_plugins(self):
         for plugin in self.plugins:
             logging.info(f"Installing {plugin.name}")
             self.install_plugin(plugin)
-        plugins_path = os.path.join(self.archive_path, "plugins")
-        if os.path.isdir(plugins_path):
-            self.installed_plugins = os.listdir(plugins_path)
+        self._list_installed_plugins()
 
     @abstractmethod
     def install_plugin(self, plugin):
+        self._post_install_plugin(plugin)
+
+    def _post_install_plugin(self, plugin):
         post_install_script = ScriptFinder.find_install_script(plugin.name)
         self._execute(
             f'{post_install_script} -a "{self.artifacts_dir}" -o "{self.archive_path}"'
         )
 
-    def build_tar(self, dest):
-        tar_name = self.bundle_recorder.tar_name
-        with tarfile.open(tar_name, "w:gz") as tar:
-            tar.add(self.archive_path, arcname=os.path.basename(self.archive_path))
-        shutil.copyfile(tar_name, os.path.join(dest, tar_name))
+    def _post_install_plugins(self, plugins):
+        # each post-install script only touches its own plugin, so they can run side by side
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(self._post_install_plugin, plugins))
+
+    def _list_installed_plugins(self):
+        plugins_path = os.path.join(self.archive_path, "plugins")
+        if os.path.isdir(plugins_path):
+            self.installed_plugins = os.listdir(plugins_path)
+
+    def build_tar(self, dest, compresslevel=9):
+        tar_path = os.path.join(dest, self.bundle_recorder.tar_name)
+        logging.info(f"Writing {tar_path}")
+        # written to a temporary file and renamed into place, a failed build never leaves a partial tarball behind
+        tmp_path = tar_path + ".tmp"
+        try:
+            with ParallelGzipFile(tmp_path, compresslevel=compresslevel) as gz:
+                with tarfile.open(fileobj=gz, mode="w|") as tar:
+                    tar.add(self.archive_path, arcname=os.path.basename(self.archive_path))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, tar_path)
 
     def _execute(self, command):
         logging.info(f'Executing "{command}" in {self.archive_path}')
-        subprocess.check_call(command, cwd=self.archive_path, shell=True)
+        ProcessRunner.call(command, self.archive_path)
 
     def _copy_component(self, component, component_type):
         rel_path = self.__get_rel_path(component, component_type)
@@ -70,9 +93,34 @@ class Bundle(ABC):
         self.bundle_recorder.record_component(component, rel_path)
         return tmp_path
 
+    def _find_component(self, component, component_type):
+        rel_path = self.__get_rel_path(component, component_type)
+        local_path = self.__get_component_file(rel_path)
+        self.bundle_recorder.record_component(component, rel_path)
+        return local_path
+
     def __unpack_min_tarball(self, dest):
-        with tarfile.open(self.min_tarball_path) as tar:
-            tar.extractall(dest)
+        # read the tarball as a stream, straight from the artifacts dir
+        pigz = shutil.which("pigz")
+        if pigz:
+            # decompress in a separate process, overlapping with extraction
+            logging.info(f"Extracting {self.min_tarball_path} with {pigz}")
+            runner = ProcessRunner([pigz, "-dc", self.min_tarball_path], stdout=subprocess.PIPE)
+            try:
+                with tarfile.open(fileobj=runner.process.stdout, mode="r|") as tar:
+                    tar.extractall(dest)
+            except BaseException:
+                runner.kill()
+                raise
+            finally:
+                runner.process.stdout.close()
+                runner.wait()
+            if runner.returncode != 0:
+                raise subprocess.CalledProcessError(runner.returncode, runner.command)
+        else:
+            logging.info(f"Extracting {self.min_tarball_path}")
+            with tarfile.open(self.min_tarball_path, mode="r|*") as tar:
+                tar.extractall(dest)
 
         self.archive_path = self.__get_archive_path(dest)
 
@@ -90,12 +138,16 @@ class Bundle(ABC):
         return next(iter(component.artifacts.get(component_type, [])), None)
 
     def __copy_component_files(self, rel_path, dest):
-        local_path = os.path.join(self.artifacts_dir, rel_path)
+        local_path = self.__get_component_file(rel_path)
         dest_path = os.path.join(dest, os.path.basename(local_path))
+        # rel path provided, in this case we copy it into dest
+        shutil.copyfile(local_path, dest_path)
+        return dest_path
+
+    def __get_component_file(self, rel_path):
+        local_path = os.path.join(self.artifacts_dir, rel_path)
         if os.path.isfile(local_path):
-            # rel path provided, in this case we copy it into dest
-            shutil.copyfile(local_path, dest_path)
-            return os.path.join(dest, os.path.basename(local_path))
+            return local_path
         else:
             raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), local_path)
 
@@ -4,14 +4,31 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import logging
 import os
 
 from assemble_workflow.bundle import Bundle
 
 
 class BundleOpenSearch(Bundle):
+    def install_plugins(self):
+        """
+        Install all plugins with a single opensearch-plugin invocation, which starts one JVM instead of one per plugin,
+        then run the post-install scripts of all plugins concurrently.
+        """
+        if self.plugins:
+            logging.info(f"Installing {', '.join(map(lambda plugin: plugin.name, self.plugins))}")
+            tmp_paths = [self._copy_component(plugin, "plugins") for plugin in self.plugins]
+            self.__install_plugin_files(tmp_paths)
+            self._post_install_plugins(self.plugins)
+        self._list_installed_plugins()
+
     def install_plugin(self, plugin):
         tmp_path = self._copy_component(plugin, "plugins")
-        cli_path = os.path.join(self.archive_path, "bin/opensearch-plugin")
-        self._execute(f"{cli_path} install --batch file:{tmp_path}")
+        self.__install_plugin_files([tmp_path])
         super().install_plugin(plugin)
+
+    def __install_plugin_files(self, tmp_paths):
+        cli_path = os.path.join(self.archive_path, "bin/opensearch-plugin")
+        plugin_files = " ".join(map(lambda tmp_path: f"file:{tmp_path}", tmp_paths))
+        self._execute(f"{cli_path} install --batch {plugin_files}")
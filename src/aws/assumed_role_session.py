@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+import boto3
+import botocore.session
+from botocore.config import Config
+from botocore.credentials import RefreshableCredentials
+
+"""
+A boto3 session with the credentials of an assumed role, shared by the whole process.
+Credentials are refreshed by botocore with a new sts:AssumeRole call shortly before they expire, so clients created from the
+session keep working for longer than the lifetime of a single set of credentials. Clients are created once per service and
+connection pool size and shared, since boto3 clients are thread-safe.
+"""
+
+
+class AssumedRoleSession:
+    DURATION_SECONDS = 3600
+
+    __sessions: Dict[Tuple[str, str], "AssumedRoleSession"] = {}
+    __sessions_lock = threading.Lock()
+
+    def __init__(self, role_arn, role_session_name):
+        self.role_arn = role_arn
+        self.role_session_name = role_session_name
+        self.__clients: Dict[Tuple[str, int], Any] = {}
+        self.__clients_lock = threading.Lock()
+        credentials = RefreshableCredentials.create_from_metadata(
+            metadata=self.__assume_role(),
+            refresh_using=self.__assume_role,
+            method="sts-assume-role",
+        )
+        botocore_session = botocore.session.get_session()
+        botocore_session._credentials = credentials
+        self.session = boto3.Session(botocore_session=botocore_session)
+
+    @classmethod
+    def get(cls, role_arn, role_session_name):
+        """
+        Return the session for a role, assuming the role the first time it is requested.
+        """
+        with cls.__sessions_lock:
+            key = (role_arn, role_session_name)
+            if key not in cls.__sessions:
+                cls.__sessions[key] = cls(role_arn, role_session_name)
+            return cls.__sessions[key]
+
+    @classmethod
+    def clear(cls):
+        with cls.__sessions_lock:
+            cls.__sessions.clear()
+
+    def client(self, service_name, max_pool_connections=10):
+        """
+        Return a shared client for a service, with a connection pool of the given size.
+        """
+        with self.__clients_lock:
+            key = (service_name, max_pool_connections)
+            if key not in self.__clients:
+                self.__clients[key] = self.session.client(
+                    service_name, config=Config(max_pool_connections=max_pool_connections)
+                )
+            return self.__clients[key]
+
+    def __assume_role(self):
+        logging.info(f"Assuming role {self.role_arn}")
+        response = boto3.client("sts").assume_role(
+            RoleArn=self.role_arn,
+            RoleSessionName=self.role_session_name,
+            DurationSeconds=self.DURATION_SECONDS,
+        )
+        credentials = response["Credentials"]
+        expiration = credentials["Expiration"]
+        return {
+            "access_key": credentials["AccessKeyId"],
+            "secret_key": credentials["SecretAccessKey"],
+            "token": credentials["SessionToken"],
+            # botocore parses the expiry time from a string when refreshing
+            "expiry_time": expiration.isoformat() if isinstance(expiration, datetime) else expiration,
+        }
@@ -4,28 +4,46 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import hashlib
 import logging
 import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
-import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
+from aws.assumed_role_session import AssumedRoleSession
+from aws.s3_cache import S3Cache
+
 
 class S3Bucket:
     AWS_ROLE_ARN = "AWS_ROLE_ARN"
     AWS_ROLE_SESSION_NAME = "AWS_ROLE_SESSION_NAME"
-
-    def __init__(self, bucket_name, role_arn=None, role_session_name=None):
+    S3_CACHE_PATH = "S3_CACHE_PATH"
+    S3_CACHE_SIZE = "S3_CACHE_SIZE"
+    PARALLEL = 16
+    # folders are downloaded one object per thread, so each object is transferred on a single thread
+    FOLDER_TRANSFER_CONFIG = TransferConfig(use_threads=False)
+    # objects over multipart_threshold are uploaded in multipart_chunksize parts, with parts uploaded concurrently
+    UPLOAD_TRANSFER_CONFIG = TransferConfig()
+
+    def __init__(self, bucket_name, role_arn=None, role_session_name=None, parallel=PARALLEL, cache=None):
         """
         Provides methods to download/upload files and folders to S3 bucket
 
         :param bucket_name: The s3 bucket name
         :param role_arn: the arn of the role that has permissions to access S3
         :param role_session_name: the aws role session name
+        :param parallel: the maximum number of objects transferred at the same time, and the size of the connection pool
+        :param cache: an S3Cache for downloaded objects, defaults to one in S3_CACHE_PATH when that is set
         """
         self.bucket_name = bucket_name
+        self.parallel = parallel
+        self.cache = cache if cache is not None else self.__get_cache()
         self.role_arn = (
             role_arn if role_arn is not None else os.environ.get(S3Bucket.AWS_ROLE_ARN)
         )
@@ -34,60 +52,50 @@ class S3Bucket:
             if role_session_name is not None
             else os.environ.get(S3Bucket.AWS_ROLE_SESSION_NAME)
         )
-        # TODO: later use for credential refereshing
-        assumed_role_creds = self.__sts_assume_role()
-        self.__s3_client, self.__s3_resource = self.__create_s3_clients(
-            assumed_role_creds
-        )
-
-    def __sts_assume_role(self):
         try:
-            sts_connection = boto3.client("sts")
-            response = sts_connection.assume_role(
-                RoleArn=self.role_arn,
-                RoleSessionName=self.role_session_name,
-                DurationSeconds=3600,
-            )
-            return response["Credentials"]
+            session = AssumedRoleSession.get(self.role_arn, self.role_session_name)
         except Exception as e:
             raise STSError(e)
+        # the client is thread-safe and shared by concurrent transfers, size its connection pool to match
+        self.__s3_client = session.client("s3", max_pool_connections=self.parallel)
 
-    def __create_s3_clients(self, assumed_role_cred):
-        s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=assumed_role_cred["AccessKeyId"],
-            aws_secret_access_key=assumed_role_cred["SecretAccessKey"],
-            aws_session_token=assumed_role_cred["SessionToken"],
-        )
-        s3_resource = boto3.resource(
-            "s3",
-            aws_access_key_id=assumed_role_cred["AccessKeyId"],
-            aws_secret_access_key=assumed_role_cred["SecretAccessKey"],
-            aws_session_token=assumed_role_cred["SessionToken"],
-        )
-        return s3_client, s3_resource
-
-    def download_folder(self, prefix, dest):
+    @staticmethod
+    def __get_cache():
+        path = os.environ.get(S3Bucket.S3_CACHE_PATH)
+        if not path:
+            return None
+        size = os.environ.get(S3Bucket.S3_CACHE_SIZE)
+        return S3Cache(path, int(size) if size else S3Cache.MAX_SIZE)
+
+    def download_folder(self, prefix, dest, transfer_config=FOLDER_TRANSFER_CONFIG):
         """
-        Download the contents of a folder directory
+        Download the contents of a folder directory.
+        Objects are downloaded concurrently on up to `parallel` threads, while the following pages of the listing are fetched.
 
         :param prefix: The folder path inside the bucket
         :param dest: local destination to download the folder at
+        :param transfer_config: the boto3 TransferConfig used for each object
         """
-        bucket = self.__s3_resource.Bucket(self.bucket_name)
         s3_path = urlparse(prefix).path.lstrip("/")
         local_dir = Path(dest)
-        s3_response = bucket.objects.filter(Prefix=s3_path)
-        for obj in s3_response:
-            target = (
-                obj.key
-                if local_dir is None
-                else local_dir / Path(obj.key).relative_to(s3_path)
-            )
-            target.parent.mkdir(parents=True, exist_ok=True)
-            if obj.key[-1] == "/":
-                continue
-            self.__download(bucket, obj.key, str(target))
+        paginator = self.__s3_client.get_paginator("list_objects_v2")
+        with ThreadPoolExecutor(max_workers=self.parallel) as executor:
+            futures = []
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=s3_path):
+                for obj in page.get("Contents", []):
+                    key = obj["Key"]
+                    target = local_dir / Path(key).relative_to(s3_path)
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    if key[-1] == "/":
+                        continue
+                    futures.append(
+                        executor.submit(self.__download_object, key, str(target), transfer_config, obj.get("ETag"))
+                    )
+            for future in futures:
+                future.result()
+        if self.cache:
+            self.cache.evict()
+        logging.info(f"Downloaded {len(futures)} object(s) from s3://{self.bucket_name}/{s3_path}")
 
     def download_file(self, key, dest):
         """
@@ -96,20 +104,43 @@ class S3Bucket:
         :param key: The s3 key for the object to download
         :param dest: local destination
         """
-        bucket = self.__s3_resource.Bucket(self.bucket_name)
         local_dir = Path(dest)
         file_name = key.split("/")[-1]
         target = Path(local_dir) / Path(file_name)
-        return self.__download(bucket, key, str(target))
+        self.__download_object(key, str(target))
+        if self.cache:
+            self.cache.evict()
 
-    @staticmethod
-    def __download(bucket, key, path):
+    def __download_object(self, key, path, transfer_config=None, etag=None):
         try:
-            bucket.download_file(key, path)
+            if self.cache:
+                self.__download_cached(key, path, etag)
+            else:
+                self.__s3_client.download_file(self.bucket_name, key, path, Config=transfer_config)
         except ClientError as e:
             logging.error(f"Failed to download s3 key: {key} from path: {path}")
             raise S3DownloadError(e)
 
+    def __download_cached(self, key, path, etag):
+        # objects under immutable prefixes are used from the cache as they are, others are validated with their current ETag
+        if etag is None and not S3Cache.is_immutable(key):
+            etag = self.__s3_client.head_object(Bucket=self.bucket_name, Key=key)["ETag"]
+        cached = self.cache.get(self.bucket_name, key, etag)
+        if cached is None:
+            if etag is None:
+                etag = self.__s3_client.head_object(Bucket=self.bucket_name, Key=key)["ETag"]
+            logging.debug(f"Downloading s3://{self.bucket_name}/{key} into the cache")
+            cached = self.cache.put(self.bucket_name, key, etag, lambda tmp_path: self.__get_object(key, etag, tmp_path))
+        else:
+            logging.debug(f"Using cached s3://{self.bucket_name}/{key}")
+        shutil.copyfile(cached, path)
+
+    def __get_object(self, key, etag, path):
+        # download_file does not accept IfMatch, get_object fails with a ClientError if the object no longer has this ETag
+        response = self.__s3_client.get_object(Bucket=self.bucket_name, Key=key, IfMatch=etag)
+        with open(path, "wb") as f:
+            shutil.copyfileobj(response["Body"], f, 1024 * 1024)
+
     def upload_file(self, key, source):
         """
         Upload a file to s3.
@@ -123,6 +154,71 @@ class S3Bucket:
             logging.error(f"Failed to upload s3 key: {key} from local source: {source}")
             raise S3UploadError(e)
 
+    def upload_folder(self, source, prefix, transfer_config=UPLOAD_TRANSFER_CONFIG):
+        """
+        Upload the contents of a local folder, skipping files that are already in s3 with the same size and ETag.
+        Files are uploaded concurrently on up to `parallel` threads, and large files are uploaded in parts.
+
+        :param source: local path of the folder
+        :param prefix: The folder path inside the bucket
+        :param transfer_config: the boto3 TransferConfig used for each file, its multipart settings are also used to compute
+        the ETags of local files
+        :returns the keys of the uploaded files
+        """
+        s3_path = urlparse(prefix).path.strip("/")
+        remote = {}
+        paginator = self.__s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=s3_path):
+            for obj in page.get("Contents", []):
+                remote[obj["Key"]] = obj
+
+        files = []
+        for dir, dirs, file_names in os.walk(source):
+            for file_name in file_names:
+                path = os.path.join(dir, file_name)
+                key = "/".join(filter(None, [s3_path, Path(os.path.relpath(path, source)).as_posix()]))
+                files.append((path, key))
+
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=self.parallel) as executor:
+            results = list(executor.map(lambda file: self.__sync_file(file[0], file[1], remote.get(file[1]), transfer_config), files))
+
+        uploaded = [key for key, size in results if size is not None]
+        uploaded_size = sum(map(lambda result: result[1] or 0, results))
+        elapsed = max(time.time() - start, 0.001)
+        logging.info(
+            f"Uploaded {len(uploaded)} file(s) to s3://{self.bucket_name}/{s3_path}, {uploaded_size} bytes in {elapsed:.1f}s "
+            f"({uploaded_size / elapsed / 1024 / 1024:.1f} MB/s), skipped {len(results) - len(uploaded)} unchanged file(s)"
+        )
+        return uploaded
+
+    def __sync_file(self, path, key, remote, transfer_config):
+        size = os.path.getsize(path)
+        if remote is not None and remote["Size"] == size and remote["ETag"].strip('"') == self.__etag(path, transfer_config):
+            logging.debug(f"Skipping unchanged {path}")
+            return key, None
+        logging.debug(f"Uploading {path} to s3://{self.bucket_name}/{key}")
+        try:
+            self.__s3_client.upload_file(path, self.bucket_name, key, Config=transfer_config)
+        except ClientError as e:
+            logging.error(f"Failed to upload s3 key: {key} from local source: {path}")
+            raise S3UploadError(e)
+        return key, size
+
+    @staticmethod
+    def __etag(path, transfer_config):
+        """
+        Compute the ETag s3 gives to a file uploaded with transfer_config: the MD5 of the file, or for multipart uploads the MD5
+        of the concatenated MD5s of all parts, followed by the number of parts.
+        """
+        md5s = []
+        with open(path, "rb") as f:
+            if os.path.getsize(path) < transfer_config.multipart_threshold:
+                return hashlib.md5(f.read()).hexdigest()
+            for chunk in iter(lambda: f.read(transfer_config.multipart_chunksize), b""):
+                md5s.append(hashlib.md5(chunk).digest())
+        return f"{hashlib.md5(b''.join(md5s)).hexdigest()}-{len(md5s)}"
+
 
 class S3Error(Exception):
     """Base class for S3 Errors"""
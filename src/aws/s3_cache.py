@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+
+from system.file_lock import FileLock
+
+"""
+A local cache of downloaded S3 objects, keyed by bucket, key and ETag.
+Each object is stored in <path>/<sha256(bucket/key)>/<etag>, so a new version of an object replaces the previous one.
+Objects are written to a temporary file and renamed into place, so concurrent readers only ever see complete files.
+The least recently used objects are evicted once the cache grows over its maximum size.
+Objects are only ever removed while holding the cache lock, and removing an object that another process already removed is
+not an error, since several agents may share the cache.
+"""
+
+
+class S3Cache:
+    MAX_SIZE = 20 * 1024 * 1024 * 1024
+    # build outputs are never overwritten once uploaded
+    IMMUTABLE_KEY = re.compile(r"^builds/[^/]+/[^/]+/")
+
+    def __init__(self, path, max_size=MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+        os.makedirs(self.path, exist_ok=True)
+
+    @classmethod
+    def is_immutable(cls, key):
+        return cls.IMMUTABLE_KEY.match(key) is not None
+
+    def get(self, bucket, key, etag=None):
+        """
+        Return the path of a cached object, or None.
+        :param etag: the ETag the cached object must have, or None to accept any cached version of an immutable object.
+        """
+        if etag is None:
+            names = self.__entries(self.__entry_dir(bucket, key))
+            if not names:
+                return None
+            path = os.path.join(self.__entry_dir(bucket, key), names[0])
+        else:
+            path = self.__entry_path(bucket, key, etag)
+        try:
+            # mark as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, bucket, key, etag, download):
+        """
+        Add an object to the cache and return its path.
+        :param download: called with a temporary path to download the object to.
+        """
+        entry_dir = self.__entry_dir(bucket, key)
+        os.makedirs(entry_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=entry_dir, prefix=".")
+        os.close(fd)
+        try:
+            download(tmp_path)
+            path = self.__entry_path(bucket, key, etag)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with FileLock(self.__lock_path()):
+            for name in self.__entries(entry_dir):
+                if name != os.path.basename(path):
+                    logging.debug(f"Removing previous version of s3://{bucket}/{key} from {entry_dir}")
+                    self.__remove(os.path.join(entry_dir, name))
+        return path
+
+    def evict(self):
+        """
+        Remove the least recently used objects until the cache is no larger than its maximum size.
+        """
+        with FileLock(self.__lock_path()):
+            files = []
+            for entry_dir in os.scandir(self.path):
+                if not entry_dir.is_dir():
+                    continue
+                for name in self.__entries(entry_dir.path):
+                    try:
+                        stat = os.stat(os.path.join(entry_dir.path, name))
+                    except FileNotFoundError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, os.path.join(entry_dir.path, name)))
+
+            size = sum(map(lambda file: file[1], files))
+            for _, file_size, path in sorted(files):
+                if size <= self.max_size:
+                    break
+                logging.debug(f"Evicting {path} from the s3 cache")
+                self.__remove(path)
+                size -= file_size
+
+    def __lock_path(self):
+        return os.path.join(self.path, ".lock")
+
+    def __entry_dir(self, bucket, key):
+        return os.path.join(self.path, hashlib.sha256(f"{bucket}/{key}".encode()).hexdigest())
+
+    def __entry_path(self, bucket, key, etag):
+        return os.path.join(self.__entry_dir(bucket, key), etag.strip('"'))
+
+    @staticmethod
+    def __remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def __entries(entry_dir):
+        try:
+            return [name for name in os.listdir(entry_dir) if not name.startswith(".")]
+        except FileNotFoundError:
+            return []
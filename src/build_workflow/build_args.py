@@ -14,6 +14,10 @@ class BuildArgs:
     snapshot: bool
     component: str
     keep: bool
+    parallel: int
+    git_cache: str
+    build_cache: str
+    link_artifacts: bool
 
     def __init__(self):
         parser = argparse.ArgumentParser(description="Build an OpenSearch Bundle")
@@ -30,6 +34,32 @@ class BuildArgs:
         parser.add_argument(
             "-c", "--component", type=str, help="Rebuild a single component."
         )
+        parser.add_argument(
+            "-p",
+            "--parallel",
+            type=int,
+            default=1,
+            help="Number of components to build concurrently.",
+        )
+        parser.add_argument(
+            "--git-cache",
+            dest="git_cache",
+            type=str,
+            help="Keep a mirror of every component repository in this directory and reuse it on subsequent runs.",
+        )
+        parser.add_argument(
+            "--build-cache",
+            dest="build_cache",
+            type=str,
+            help="Restore components whose inputs are unchanged from this directory instead of building them.",
+        )
+        parser.add_argument(
+            "--link-artifacts",
+            dest="link_artifacts",
+            action="store_true",
+            default=False,
+            help="Hard-link or clone artifacts into the output directory instead of copying them.",
+        )
         parser.add_argument(
             "--keep",
             dest="keep",
@@ -52,6 +82,10 @@ class BuildArgs:
         self.snapshot = args.snapshot
         self.component = args.component
         self.keep = args.keep
+        self.parallel = args.parallel
+        self.git_cache = args.git_cache
+        self.build_cache = args.build_cache
+        self.link_artifacts = args.link_artifacts
         self.script_path = sys.argv[0].replace("/src/run_build.py", "/build.sh")
 
     def component_command(self, name):
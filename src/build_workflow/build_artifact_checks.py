@@ -3,7 +3,10 @@
 # The OpenSearch Contributors require contributions made to
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
+import logging
+from concurrent.futures import ThreadPoolExecutor
 
+from build_workflow.build_artifact_check import BuildArtifactCheck
 from build_workflow.opensearch.build_artifact_check_maven import \
     BuildArtifactOpenSearchCheckMaven
 from build_workflow.opensearch.build_artifact_check_plugin import \
@@ -13,6 +16,13 @@ from build_workflow.opensearch_dashboards.build_artifact_check_plugin import \
 
 
 class BuildArtifactChecks:
+    class BuildArtifactsInvalidError(Exception):
+        def __init__(self, errors):
+            self.errors = errors
+            super().__init__(
+                "\n".join([f"{len(errors)} artifact(s) are invalid."] + list(map(str, errors)))
+            )
+
     TYPES = {
         "OpenSearch": {
             "plugins": BuildArtifactOpenSearchCheckPlugin,
@@ -42,3 +52,26 @@ class BuildArtifactChecks:
         instance = cls.create(target, artifact_type)
         if instance:
             instance.check(path)
+
+    @classmethod
+    def check_all(cls, target, artifact_type, paths):
+        """
+        Check many artifacts of the same type concurrently with a single checker.
+        Raises BuildArtifactsInvalidError listing every invalid artifact, once all of them have been checked.
+        """
+        instance = cls.create(target, artifact_type)
+        if not instance or not paths:
+            return
+
+        def check(path):
+            try:
+                instance.check(path)
+            except BuildArtifactCheck.BuildArtifactInvalidError as e:
+                logging.error(str(e))
+                return e
+
+        with ThreadPoolExecutor() as executor:
+            errors = [error for error in executor.map(check, paths) if error]
+
+        if errors:
+            raise BuildArtifactChecks.BuildArtifactsInvalidError(errors)
@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import threading
+import uuid
+
+"""
+This class is responsible for caching the artifacts produced by component builds on local disk, so that a component whose
+inputs have not changed is restored instead of being built again.
+Entries are keyed by a hash of everything that goes into a component build: the component name, repository, resolved commit
+and working directory, the contents of the build script, the target name, version, snapshot flag and architecture, and the
+keys of the components it was built against. A component whose dependencies were not built with a known key in the same run,
+e.g. because they were not built at all, is never cached.
+Restoring a component also installs its maven publications into the maven local repository, which its build would have
+published to, so that the components built against it resolve them.
+"""
+
+
+class BuildCache:
+    # a unique snapshot file name in a remote repository layout, e.g. opensearch-1.1.0-20211015.123456-1.jar
+    UNIQUE_SNAPSHOT = re.compile(r"^(.+)-\d{8}\.\d{6}-\d+((?:-[^.]+)?\..+)$")
+
+    def __init__(self, path, maven_local=None):
+        """
+        :param maven_local: The maven local repository to install restored maven publications into, defaults to ~/.m2/repository.
+        """
+        self.path = os.path.realpath(path)
+        self.maven_local = maven_local or os.path.join(os.path.expanduser("~"), ".m2", "repository")
+        self.keys = {}
+        self.lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+
+    def key(self, component_name, git_repo, build_script, target, dependencies=[]):
+        """
+        Compute the cache key of a component build, or None if the component cannot be cached.
+        :param dependencies: The names of the components this component is built against.
+        """
+        hash = hashlib.sha256()
+        with self.lock:
+            for dependency in sorted(dependencies):
+                if dependency not in self.keys:
+                    logging.info(f"Not caching {component_name}, {dependency} has no cache key in this build")
+                    return None
+                hash.update(f"{dependency}={self.keys[dependency]}\0".encode())
+
+        for part in [
+            component_name,
+            git_repo.url,
+            git_repo.sha,
+            git_repo.working_subdirectory or "",
+            target.name,
+            target.version,
+            str(target.snapshot),
+            target.arch,
+        ]:
+            hash.update(f"{part}\0".encode())
+
+        with open(build_script, "rb") as f:
+            hash.update(f.read())
+
+        return hash.hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.path, key)
+
+    def restore(self, component_name, key, artifacts_path):
+        """
+        Restore cached artifacts into artifacts_path.
+        :returns True on a cache hit.
+        """
+        entry = self.entry_path(key)
+        if not os.path.isdir(entry):
+            logging.info(f"Build cache miss for {component_name} ({key})")
+            return False
+
+        logging.info(f"Build cache hit for {component_name} ({key}), restoring artifacts")
+        if os.path.isdir(artifacts_path):
+            shutil.rmtree(artifacts_path)
+        shutil.copytree(entry, artifacts_path)
+        self.__install_maven(component_name, os.path.join(artifacts_path, "maven"))
+        self.__record(component_name, key)
+        return True
+
+    def __install_maven(self, component_name, maven_path):
+        """
+        Install maven publications into the maven local repository. Unique snapshots are also installed with the non-unique
+        name publishToMavenLocal uses, e.g. opensearch-1.1.0-SNAPSHOT.jar, which is what maven local resolution looks for.
+        """
+        count = 0
+        for dir, dirs, files in os.walk(maven_path):
+            dest_dir = os.path.join(self.maven_local, os.path.relpath(dir, maven_path))
+            version = os.path.basename(dir)
+            for file_name in files:
+                os.makedirs(dest_dir, exist_ok=True)
+                dest_names = [file_name]
+                match = self.UNIQUE_SNAPSHOT.match(file_name) if version.endswith("-SNAPSHOT") else None
+                if match and match.group(1).endswith("-" + version[: -len("-SNAPSHOT")]):
+                    dest_names.append(f"{match.group(1)}-SNAPSHOT{match.group(2)}")
+                for dest_name in dest_names:
+                    # written to a temporary file and renamed into place, concurrent builds may be reading the repository
+                    tmp_path = os.path.join(dest_dir, f".{dest_name}.{uuid.uuid4().hex}.tmp")
+                    shutil.copyfile(os.path.join(dir, file_name), tmp_path)
+                    os.replace(tmp_path, os.path.join(dest_dir, dest_name))
+                    count += 1
+        if count:
+            logging.info(f"Installed {count} maven file(s) of {component_name} into {self.maven_local}")
+
+    def store(self, component_name, key, artifacts_path):
+        """
+        Store the artifacts of a successful build. Entries are written to a temporary directory and renamed into place,
+        so concurrent builds never observe a partial entry.
+        """
+        entry = self.entry_path(key)
+        if not os.path.isdir(entry):
+            staging = f"{entry}.{uuid.uuid4().hex}.tmp"
+            if os.path.isdir(artifacts_path):
+                shutil.copytree(artifacts_path, staging)
+            else:
+                os.makedirs(staging)
+            try:
+                os.rename(staging, entry)
+                logging.info(f"Stored {component_name} in build cache ({key})")
+            except OSError:
+                # another build stored the same entry first
+                shutil.rmtree(staging)
+        self.__record(component_name, key)
+
+    def __record(self, component_name, key):
+        with self.lock:
+            self.keys[component_name] = key
@@ -6,26 +6,39 @@
 
 import logging
 import os
-import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from build_workflow.build_artifact_checks import BuildArtifactChecks
 from manifests.build_manifest import BuildManifest
+from system.copy_file import copy_file
 
 
 class BuildRecorder:
-    def __init__(self, target):
-        self.build_manifest = self.BuildManifestBuilder(target)
+    def __init__(self, target, link_artifacts=False, component_names=[]):
+        """
+        :param target: The BuildTarget being built.
+        :param link_artifacts: Hard-link or clone artifacts into the output directory instead of copying them, see copy_file.
+        :param component_names: The components to build, in input manifest order, which is the order of the build manifest
+        regardless of the order in which concurrent builds finish. Other components follow in the order they were recorded.
+        """
+        self.build_manifest = self.BuildManifestBuilder(target, component_names)
         self.target = target
         self.name = target.name
+        self.link_artifacts = link_artifacts
+        # components may be built concurrently, see BuildScheduler
+        self.lock = threading.Lock()
+        self.output_dirs = set()
 
     def record_component(self, component_name, git_repo):
-        self.build_manifest.append_component(
-            component_name,
-            self.target.component_version,
-            git_repo.url,
-            git_repo.ref,
-            git_repo.sha,
-        )
+        with self.lock:
+            self.build_manifest.append_component(
+                component_name,
+                self.target.component_version,
+                git_repo.url,
+                git_repo.ref,
+                git_repo.sha,
+            )
 
     def record_artifact(
         self, component_name, artifact_type, artifact_path, artifact_file
@@ -33,21 +46,47 @@ class BuildRecorder:
         logging.info(
             f"Recording {artifact_type} artifact for {component_name}: {artifact_path} (from {artifact_file})"
         )
-        # Ensure the target directory exists
-        dest_file = os.path.join(self.target.output_dir, artifact_path)
-        dest_dir = os.path.dirname(dest_file)
-        os.makedirs(dest_dir, exist_ok=True)
         # Check artifact
         BuildArtifactChecks.check(self.target, artifact_type, artifact_file)
         # Copy the file
-        shutil.copyfile(artifact_file, dest_file)
+        self.__copy_artifact(artifact_path, artifact_file)
         # Notify the recorder
-        self.build_manifest.append_artifact(
-            component_name, artifact_type, artifact_path
+        with self.lock:
+            self.build_manifest.append_artifact(
+                component_name, artifact_type, artifact_path
+            )
+
+    def record_artifacts(self, component_name, artifact_type, artifacts):
+        """
+        Record many artifacts of the same type, given as a list of (artifact_path, artifact_file) tuples.
+        All artifacts are checked, concurrently, before any of them is copied, and all invalid artifacts are reported at once.
+        """
+        logging.info(
+            f"Recording {len(artifacts)} {artifact_type} artifact(s) for {component_name}"
         )
+        BuildArtifactChecks.check_all(
+            self.target, artifact_type, [artifact_file for _, artifact_file in artifacts]
+        )
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(lambda artifact: self.__copy_artifact(*artifact), artifacts))
+        with self.lock:
+            for artifact_path, _ in artifacts:
+                self.build_manifest.append_artifact(
+                    component_name, artifact_type, artifact_path
+                )
+
+    def __copy_artifact(self, artifact_path, artifact_file):
+        # Ensure the target directory exists, once per directory
+        dest_file = os.path.join(self.target.output_dir, artifact_path)
+        dest_dir = os.path.dirname(dest_file)
+        if dest_dir not in self.output_dirs:
+            os.makedirs(dest_dir, exist_ok=True)
+            self.output_dirs.add(dest_dir)
+        copy_file(artifact_file, dest_file, self.link_artifacts)
 
     def get_manifest(self):
-        return self.build_manifest.to_manifest()
+        with self.lock:
+            return self.build_manifest.to_manifest()
 
     def write_manifest(self):
         manifest_path = os.path.join(self.target.output_dir, "manifest.yml")
@@ -55,7 +94,7 @@ class BuildRecorder:
         logging.info(f"Created build manifest {manifest_path}")
 
     class BuildManifestBuilder:
-        def __init__(self, target):
+        def __init__(self, target, component_names=[]):
             self.data = {}
             self.data["build"] = {}
             self.data["build"]["id"] = target.build_id
@@ -64,6 +103,7 @@ class BuildRecorder:
             self.data["build"]["architecture"] = target.arch
             self.data["schema-version"] = "1.0"
             self.components_hash = {}
+            self.component_indexes = {name: index for index, name in enumerate(component_names)}
 
         def append_component(self, name, version, repository_url, ref, commit_id):
             component = {
@@ -85,7 +125,9 @@ class BuildRecorder:
 
         def to_manifest(self):
             # The build manifest expects `components` to be a list, not a hash, so we need to munge things a bit
-            components = self.components_hash.values()
+            components = sorted(
+                self.components_hash.values(), key=lambda component: self.component_indexes.get(component["name"], len(self.component_indexes))
+            )
             if len(components) > 0:
                 self.data["components"] = list(components)
             return BuildManifest(self.data)
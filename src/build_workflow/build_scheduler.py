@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+"""
+This class is responsible for ordering component builds according to their dependencies and running independent builds concurrently.
+A component declares the components it needs with `depends_on` in the input manifest. A component that declares nothing is
+assumed to depend on every component listed before it, which preserves the manifest order for manifests without dependencies.
+Dependencies on components that are not being built (e.g. when rebuilding a single component) do not hold up a build, they
+are listed in skipped_dependencies instead, e.g. so that a component built against artifacts from an earlier run is not cached.
+"""
+
+
+class BuildScheduler:
+    class CyclicDependencyError(Exception):
+        def __init__(self, names):
+            self.names = names
+            super().__init__(f"Cyclic dependency between components: {', '.join(names)}")
+
+    def __init__(self, components, parallel=1, manifest_components=None):
+        """
+        Construct a new BuildScheduler instance.
+        :param components: The input manifest components to build, in manifest order.
+        :param parallel: The maximum number of components to build at the same time.
+        :param manifest_components: All the input manifest components, in manifest order, defaults to components.
+        """
+        self.components = components
+        self.parallel = max(1, parallel)
+        (self.dependencies, self.skipped_dependencies) = self.__get_dependencies(components, manifest_components or components)
+
+    @staticmethod
+    def __get_dependencies(components, manifest_components):
+        manifest_names = list(map(lambda component: component.name, manifest_components))
+        names = set(map(lambda component: component.name, components))
+        dependencies = {}
+        skipped_dependencies = {}
+        for component in components:
+            declared = getattr(component, "depends_on", None)
+            if declared is None:
+                declared = manifest_names[: manifest_names.index(component.name)]
+            dependencies[component.name] = set(declared) & names
+            skipped_dependencies[component.name] = set(declared) - names
+        return (dependencies, skipped_dependencies)
+
+    def run(self, build):
+        """
+        Call build(component) for every component, starting each one as soon as its dependencies have been built.
+        No new builds are started after a failure; builds already running are allowed to finish and the first error is raised.
+        """
+        components = {component.name: component for component in self.components}
+        pending = {name: set(dependencies) for name, dependencies in self.dependencies.items()}
+        running = {}
+        error = None
+
+        with ThreadPoolExecutor(max_workers=self.parallel) as executor:
+            while pending or running:
+                if error is None:
+                    for name in [name for name, dependencies in pending.items() if not dependencies]:
+                        if len(running) >= self.parallel:
+                            break
+                        del pending[name]
+                        running[executor.submit(build, components[name])] = name
+
+                if not running:
+                    if error is not None:
+                        break
+                    raise BuildScheduler.CyclicDependencyError(list(pending.keys()))
+
+                done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    if future.exception() is not None:
+                        error = error or future.exception()
+                        continue
+                    logging.debug(f"Finished building {name}")
+                    for dependencies in pending.values():
+                        dependencies.discard(name)
+
+        if error is not None:
+            raise error
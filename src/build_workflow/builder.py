@@ -4,6 +4,7 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import logging
 import os
 
 from paths.script_finder import ScriptFinder
@@ -12,21 +13,26 @@ from paths.script_finder import ScriptFinder
 This class is responsible for executing the build for a component and passing the results to a build recorder.
 It will notify the build recorder of build information such as repository and git ref, and any artifacts generated by the build.
 Artifacts found in "<build root>/artifacts/<maven|plugins|libs|bundle>" will be recognized and recorded.
+When a build cache is given, artifacts of a previous build with identical inputs are restored instead of running the build.
 """
 
 
 class Builder:
-    def __init__(self, component_name, git_repo, build_recorder):
+    def __init__(self, component_name, git_repo, build_recorder, build_cache=None, dependencies=[]):
         """
         Construct a new Builder instance.
         :param component_name: The name of the component to build.
         :param git_repo: A GitRepository instance containing the checked-out code.
         :param build_recorder: The build recorder that will capture build information and artifacts.
+        :param build_cache: An optional BuildCache to restore artifacts from and store them into.
+        :param dependencies: The names of the components this component is built against, part of the build cache key.
         """
 
         self.component_name = component_name
         self.git_repo = git_repo
         self.build_recorder = build_recorder
+        self.build_cache = build_cache
+        self.dependencies = dependencies
         self.output_path = "artifacts"
         self.artifacts_path = os.path.join(
             self.git_repo.working_directory, self.output_path
@@ -37,17 +43,26 @@ class Builder:
             target.name, self.component_name, self.git_repo.working_directory
         )
         build_command = f"{build_script} -v {target.version} -a {target.arch} -s {str(target.snapshot).lower()} -o {self.output_path}"
-        self.git_repo.execute(build_command)
+        key = self.build_cache.key(self.component_name, self.git_repo, build_script, target, self.dependencies) if self.build_cache else None
+        if key and self.build_cache.restore(self.component_name, key, self.artifacts_path):
+            logging.info(f"Skipped building {self.component_name}, restored from build cache")
+        else:
+            self.git_repo.execute(build_command)
+            if key:
+                self.build_cache.store(self.component_name, key, self.artifacts_path)
         self.build_recorder.record_component(self.component_name, self.git_repo)
 
     def export_artifacts(self):
         for artifact_type in ["maven", "bundle", "plugins", "libs", "core-plugins"]:
+            artifacts = []
             for dir, dirs, files in os.walk(
                 os.path.join(self.artifacts_path, artifact_type)
             ):
                 for file_name in files:
                     absolute_path = os.path.join(dir, file_name)
                     relative_path = os.path.relpath(absolute_path, self.artifacts_path)
-                    self.build_recorder.record_artifact(
-                        self.component_name, artifact_type, relative_path, absolute_path
-                    )
+                    artifacts.append((relative_path, absolute_path))
+            if artifacts:
+                self.build_recorder.record_artifacts(
+                    self.component_name, artifact_type, artifacts
+                )
@@ -10,12 +10,19 @@ import logging
 
 class CheckoutArgs:
     manifest: str
+    git_cache: str
 
     def __init__(self):
         parser = argparse.ArgumentParser(description="Checkout an OpenSearch Bundle")
         parser.add_argument(
             "manifest", type=argparse.FileType("r"), help="Manifest file."
         )
+        parser.add_argument(
+            "--git-cache",
+            dest="git_cache",
+            type=str,
+            help="Keep a mirror of every component repository in this directory and reuse it on subsequent runs.",
+        )
         parser.add_argument(
             "-v",
             "--verbose",
@@ -29,3 +36,4 @@ class CheckoutArgs:
         args = parser.parse_args()
         self.logging_level = args.logging_level
         self.manifest = args.manifest
+        self.git_cache = args.git_cache
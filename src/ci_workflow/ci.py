@@ -4,12 +4,14 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+from ci_workflow.ci_check_gradle_dependencies import CiCheckGradleDependencies
 from ci_workflow.ci_check_gradle_dependencies_opensearch import \
     CiCheckGradleDependenciesOpenSearchVersion
 from ci_workflow.ci_check_gradle_properties_version import \
     CiCheckGradlePropertiesVersion
 from ci_workflow.ci_check_gradle_publish_to_maven_local import \
     CiCheckGradlePublishToMavenLocal
+from ci_workflow.ci_gradle import CiGradle
 
 """
 This class is responsible for sanity checking the OpenSearch bundle.
@@ -30,22 +32,33 @@ class Ci:
                 f"Invalid check {check}, must be one of {Ci.CHECKS.keys()}."
             )
 
-    def __init__(self, component, git_repo, target):
+    def __init__(self, component, git_repo, target, gradle_cache=None):
         """
         Construct a new instance of Ci.
         :param component: The component to sanity-check.
         :param git_repo: A GitRepository instance containing the checked-out code.
         :param target: Ci target.
+        :param gradle_cache: An optional directory to cache gradle introspection results in.
         """
 
         self.component = component
         self.git_repo = git_repo
         self.target = target
+        self.gradle_cache = gradle_cache
 
     def check(self):
+        klasses = []
         for check in self.component.checks:
-            klass = Ci.CHECKS[check.name]
+            klass = Ci.CHECKS.get(check.name)
             if klass is None:
                 raise Ci.InvalidCheckError(check)
-            instance = klass(self.component, self.git_repo, self.target, check.args)
+            klasses.append(klass)
+
+        # checks of the same component share a single gradle introspection
+        projects = dict.fromkeys(
+            check.args or "" for check, klass in zip(self.component.checks, klasses) if issubclass(klass, CiCheckGradleDependencies)
+        )
+        gradle = CiGradle(self.git_repo, self.target, projects, self.gradle_cache)
+        for check, klass in zip(self.component.checks, klasses):
+            instance = klass(self.component, self.git_repo, self.target, check.args, gradle)
             instance.check()
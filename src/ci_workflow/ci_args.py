@@ -12,6 +12,9 @@ import sys
 class CiArgs:
     manifest: str
     snapshot: bool
+    git_cache: str
+    gradle_cache: str
+    parallel: int
 
     def __init__(self):
         parser = argparse.ArgumentParser(
@@ -30,6 +33,25 @@ class CiArgs:
         parser.add_argument(
             "-c", "--component", type=str, help="Rebuild a single component."
         )
+        parser.add_argument(
+            "-p",
+            "--parallel",
+            type=int,
+            default=1,
+            help="Number of components to check concurrently.",
+        )
+        parser.add_argument(
+            "--git-cache",
+            dest="git_cache",
+            type=str,
+            help="Keep a mirror of every component repository in this directory and reuse it on subsequent runs.",
+        )
+        parser.add_argument(
+            "--gradle-cache",
+            dest="gradle_cache",
+            type=str,
+            help="Keep the gradle properties and dependencies of every checked commit in this directory and reuse them on subsequent runs.",
+        )
         parser.add_argument(
             "--keep",
             dest="keep",
@@ -50,6 +72,9 @@ class CiArgs:
         self.snapshot = args.snapshot
         self.component = args.component
         self.keep = args.keep
+        self.parallel = args.parallel
+        self.git_cache = args.git_cache
+        self.gradle_cache = args.gradle_cache
         self.logging_level = args.logging_level
         self.script_path = sys.argv[0].replace("/src/run_ci.py", "/ci.sh")
 
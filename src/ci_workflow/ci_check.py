@@ -6,13 +6,19 @@
 
 from abc import ABC, abstractmethod
 
+from ci_workflow.ci_gradle import CiGradle
+
 
 class CiCheck(ABC):
-    def __init__(self, component, git_repo, target, args=None):
+    def __init__(self, component, git_repo, target, args=None, gradle=None):
+        """
+        :param gradle: The CiGradle shared by the checks of the component, created for this check when None.
+        """
         self.component = component
         self.git_repo = git_repo
         self.target = target
         self.args = args
+        self.gradle = gradle or CiGradle(git_repo, target)
 
     @abstractmethod
     def check(self):
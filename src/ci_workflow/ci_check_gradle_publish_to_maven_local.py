@@ -9,12 +9,4 @@ from ci_workflow.ci_check import CiCheck
 
 class CiCheckGradlePublishToMavenLocal(CiCheck):
     def check(self):
-        cmd = " ".join(
-            [
-                "./gradlew publishToMavenLocal",
-                f"-Dopensearch.version={self.target.opensearch_version}",
-                f"-Dbuild.snapshot={str(self.target.snapshot).lower()}",
-            ]
-        )
-
-        self.git_repo.execute(cmd)
+        self.gradle.execute("publishToMavenLocal")
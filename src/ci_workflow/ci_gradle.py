@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import json
+import logging
+import os
+import re
+
+from system.process_runner import ProcessRunner
+from system.properties_file import PropertiesFile
+
+"""
+This class runs the gradle tasks of the checks of a single component against a CiTarget.
+The properties of the root project and the compileOnly dependencies of all projects the checks need are introspected with a
+single gradle invocation. Its result is kept as JSON, optionally on disk, keyed by the repository commit, the opensearch version,
+snapshot and the projects, so re-checking an unchanged component does not run gradle at all.
+"""
+
+
+class CiGradle:
+    TASK = re.compile(r"^> Task (\S+)")
+    # lines that end the output of the last task
+    TRAILER = re.compile(r"^(> |BUILD SUCCESSFUL|BUILD FAILED|Deprecated Gradle features)")
+
+    def __init__(self, git_repo, target, projects=[], cache_dir=None):
+        """
+        Construct a new CiGradle instance.
+        :param git_repo: A GitRepository instance containing the checked-out code.
+        :param target: Ci target.
+        :param projects: The gradle projects to introspect the dependencies of, "" being the root project.
+        :param cache_dir: An optional directory to keep introspection results in.
+        """
+        self.git_repo = git_repo
+        self.target = target
+        self.projects = list(projects)
+        self.cache_dir = cache_dir
+        self.__introspection = None
+
+    def command(self, *tasks):
+        return " ".join(
+            [
+                f"{ProcessRunner.gradlew()} {' '.join(tasks)}",
+                f"-Dopensearch.version={self.target.opensearch_version}",
+                f"-Dbuild.snapshot={str(self.target.snapshot).lower()}",
+            ]
+        )
+
+    def execute(self, *tasks):
+        self.git_repo.execute(self.command(*tasks))
+
+    def properties(self):
+        return PropertiesFile(self.__introspect()["properties"])
+
+    def dependencies(self, project=""):
+        """
+        Return the compileOnly dependency tree of a project as printed by gradle.
+        """
+        project = project or ""
+        if project not in self.projects:
+            self.projects.append(project)
+        return self.__introspect()["dependencies"][project]
+
+    def __introspect(self):
+        if self.__introspection is None or not set(self.projects) <= self.__introspection["dependencies"].keys():
+            self.__introspection = self.__load() or self.__store(self.__run())
+        return self.__introspection
+
+    def __run(self):
+        tasks = ["properties"]
+        for project in self.projects:
+            tasks.append(f"{project}:dependencies --configuration compileOnly")
+        sections = self.__split(self.git_repo.output(self.command(*tasks, "--console=plain")), len(tasks))
+        return {
+            "properties": PropertiesFile(sections.get(":properties", "")).properties,
+            "dependencies": {project: sections.get(self.__task_path(project), "") for project in self.projects},
+        }
+
+    @classmethod
+    def __split(cls, output, tasks):
+        """
+        Split the output of gradle into the output of each task, keyed by task path.
+        """
+        sections = {}
+        task = None
+        for line in output.split("\n"):
+            match = cls.TASK.match(line)
+            if match:
+                task = match.group(1)
+                sections[task] = []
+            elif task and cls.TRAILER.match(line):
+                task = None
+            elif task:
+                sections[task].append(line)
+        if not sections and tasks == 1:
+            # a single task without a header, e.g. with --quiet
+            return {":properties": output}
+        return {task: "\n".join(lines) for task, lines in sections.items()}
+
+    @staticmethod
+    def __task_path(project):
+        return ":" + f"{project}:dependencies".lstrip(":")
+
+    def __cache_path(self):
+        sha = getattr(self.git_repo, "sha", None)
+        if not self.cache_dir or not isinstance(sha, str):
+            return None
+        key = json.dumps(
+            [
+                self.git_repo.url,
+                sha,
+                self.git_repo.working_subdirectory,
+                self.target.opensearch_version,
+                self.target.snapshot,
+                sorted(self.projects),
+            ]
+        )
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    def __load(self):
+        path = self.__cache_path()
+        if path is None or not os.path.isfile(path):
+            return None
+        logging.info(f"Using cached gradle introspection {path}")
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def __store(self, introspection):
+        path = self.__cache_path()
+        if path is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(introspection, f)
+            os.replace(tmp_path, path)
+        return introspection
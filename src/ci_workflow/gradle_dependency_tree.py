@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+from system.properties_file import PropertiesFile
+
+"""
+This class is a gradle dependency tree, parsed in a single pass from the output of `gradle dependencies`, e.g.
+
+    +--- org.opensearch:opensearch:1.1.0-SNAPSHOT
+    |    +--- org.opensearch:opensearch-core:1.1.0-SNAPSHOT
+    |    \\--- org.apache.lucene:lucene-core:8.9.0 -> 8.10.1
+    +--- project :spi
+    \\--- org.opensearch:opensearch-core:1.1.0-SNAPSHOT (*)
+
+Each dependency is indexed by its path of group:artifact names from the root, joined by "/", and by its group:artifact.
+The version of a dependency is the resolved one, after "->". Repeated subtrees are marked (*) and constraints (c); a
+constraint is only indexed by path when no real dependency has the same path.
+"""
+
+
+class GradleDependencyTree:
+    # each level of the tree is indented by 5 characters, e.g. "|    " or "     "
+    INDENT = 5
+    MARKER = "--- "
+    FLAGS = {"*", "c", "n"}
+
+    class Dependency:
+        __slots__ = ["name", "requested", "version", "omitted", "constraint", "children", "parent"]
+
+        def __init__(self, name, requested=None, version=None, omitted=False, constraint=False, parent=None):
+            self.name = name
+            self.requested = requested
+            self.version = version
+            self.omitted = omitted
+            self.constraint = constraint
+            self.children = []
+            self.parent = parent
+
+        @property
+        def path(self):
+            names = []
+            dependency = self
+            while dependency is not None:
+                names.append(dependency.name)
+                dependency = dependency.parent
+            return "/".join(reversed(names))
+
+    def __init__(self, lines=""):
+        """
+        Parse a dependency tree.
+        :param lines: The output of `gradle dependencies`, as a string or an iterable of lines.
+        """
+        self.dependencies = []
+        self.__by_path = {}
+        self.__by_name = {}
+        self.__parse(lines.split("\n") if isinstance(lines, str) else lines)
+
+    def __parse(self, lines):
+        # the ancestors of the current line, with their paths
+        stack = []
+        for line in lines:
+            # "|    +--- group:artifact:version", the marker is preceded by "+" or "\\"
+            marker = line.find(self.MARKER)
+            if marker < 1 or line[marker - 1] not in "+\\":
+                continue
+
+            depth = min((marker - 1) // self.INDENT, len(stack))
+            del stack[depth:]
+            parent, parent_path = stack[-1] if stack else (None, None)
+            dependency = self.__dependency(line[marker + len(self.MARKER):].rstrip(), parent)
+
+            if parent is None:
+                self.dependencies.append(dependency)
+            else:
+                parent.children.append(dependency)
+            path = f"{parent_path}/{dependency.name}" if parent_path else dependency.name
+            stack.append((dependency, path))
+
+            existing = self.__by_path.get(path)
+            if existing is None or (existing.constraint and not dependency.constraint):
+                self.__by_path[path] = dependency
+            self.__by_name.setdefault(dependency.name, []).append(dependency)
+
+    def __dependency(self, value, parent):
+        if value.endswith(" FAILED"):
+            value = value[: -len(" FAILED")]
+
+        # e.g. "(*)" for a repeated subtree, or "(c)" for a constraint
+        flag = None
+        if value.endswith(")") and value[-4:-2] == " (" and value[-2] in self.FLAGS:
+            flag = value[-2]
+            value = value[:-4]
+
+        value, _, resolved = value.partition(" -> ")
+        parts = value.split(":", 2)
+        if len(parts) < 2 or " " in parts[0]:
+            # e.g. "project :spi"
+            name, requested = value, None
+        else:
+            name = f"{parts[0]}:{parts[1]}"
+            requested = parts[2] if len(parts) == 3 else None
+        return GradleDependencyTree.Dependency(name, requested, resolved or requested, flag == "*", flag == "c", parent)
+
+    def __len__(self):
+        return len(self.__by_path)
+
+    def get(self, path):
+        """
+        Return the dependency at a path, e.g. "org.opensearch:opensearch/org.opensearch:opensearch-core", or None.
+        """
+        return self.__by_path.get(path)
+
+    def find(self, name):
+        """
+        Return all occurrences of a group:artifact in the tree, in order.
+        """
+        return list(self.__by_name.get(name, []))
+
+    def get_value(self, path, default_value=None):
+        dependency = self.get(path)
+        return dependency.version if dependency is not None else default_value
+
+    def check_value(self, path, expected):
+        dependency = self.get(path)
+        if dependency is None:
+            raise PropertiesFile.UnexpectedKeyValueError(path, expected)
+        if dependency.version != expected:
+            raise PropertiesFile.UnexpectedKeyValueError(path, expected, dependency.version)
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import threading
+
+from system.file_lock import FileLock
+from system.process_runner import ProcessRunner
+
+
+class GitCache:
+    """
+    This class keeps a persistent bare mirror of every Git repository URL it is asked for under a cache directory.
+    Refs are fetched into the mirror, which only downloads objects that are not cached yet, and checkouts borrow objects
+    from the mirror through Git alternates instead of downloading them again.
+    Mirrors are locked while they are updated, so a cache directory can be shared by concurrent threads and processes.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.realpath(path)
+        self.__locks = {}
+        self.__locks_lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+
+    def mirror_path(self, url):
+        return os.path.join(self.path, hashlib.sha1(url.encode()).hexdigest() + ".git")
+
+    def checkout(self, url, ref, dir):
+        """
+        Fetch a ref into the mirror of url and make its objects available to the initialized Git repository in dir.
+        :returns the commit ID that ref resolved to, which can then be checked out in dir.
+        """
+        mirror = self.mirror_path(url)
+        with self.__lock(mirror), FileLock(mirror + ".lock"):
+            sha = self.__fetch(mirror, url, ref)
+            with open(os.path.join(dir, ".git", "objects", "info", "alternates"), "a") as alternates:
+                alternates.write(os.path.join(mirror, "objects") + "\n")
+            if os.path.isfile(os.path.join(mirror, "shallow")):
+                shutil.copyfile(os.path.join(mirror, "shallow"), os.path.join(dir, ".git", "shallow"))
+        return sha
+
+    def __lock(self, mirror):
+        with self.__locks_lock:
+            return self.__locks.setdefault(mirror, threading.Lock())
+
+    def __fetch(self, mirror, url, ref):
+        if not os.path.isdir(mirror):
+            self.__execute(f"git init --bare {mirror}", self.path)
+            self.__execute(f"git remote add origin {url}", mirror)
+        self.__execute(f"git fetch --depth 1 origin {ref}", mirror)
+        sha = ProcessRunner.output("git rev-parse FETCH_HEAD", mirror).strip()
+        # keep the commit reachable, so that it's not garbage-collected and its objects are not downloaded again by the next fetch
+        self.__execute(f"git update-ref refs/cache/{sha} {sha}", mirror)
+        logging.info(f"Cached {url}@{ref} in {mirror} at {sha}")
+        return sha
+
+    def __execute(self, command, cwd):
+        logging.info(f'Executing "{command}" in {cwd}')
+        ProcessRunner.call(command, cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
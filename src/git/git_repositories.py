@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from git.git_repository import GitRepository
+
+
+class GitRepositories:
+    """
+    This class checks out the repositories of many manifest components at once, each into a directory named after the component.
+    Checkouts run on a pool of threads and can share a GitCache.
+    """
+
+    PARALLEL = 8
+
+    def __init__(self, work_dir, parallel=PARALLEL, cache=None):
+        """
+        :param work_dir: The directory to check out components into.
+        :param parallel: The maximum number of repositories to check out at the same time.
+        :param cache: An optional GitCache to fetch objects through.
+        """
+        self.work_dir = work_dir
+        self.parallel = max(1, parallel)
+        self.cache = cache
+
+    def checkout(self, components):
+        """
+        Check out all components and return a dictionary of component name to GitRepository, in component order.
+        """
+        with ThreadPoolExecutor(max_workers=self.parallel) as executor:
+            repos = list(executor.map(self.__checkout, components))
+        return dict(zip(map(lambda component: component.name, components), repos))
+
+    def __checkout(self, component):
+        logging.info(f"Checking out {component.name}")
+        return GitRepository(
+            component.repository,
+            component.ref,
+            os.path.join(self.work_dir, component.name),
+            component.working_directory,
+            cache=self.cache,
+        )
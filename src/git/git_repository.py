@@ -10,17 +10,24 @@ import subprocess
 import tempfile
 from pathlib import Path
 
+from system.process_runner import ProcessRunner
+
 
 class GitRepository:
     """
     This class checks out a Git repository at a particular ref into an empty named directory (or temporary a directory if no named directory is given).
     Temporary directories will be automatically deleted when the GitRepository object goes out of scope; named directories will be left alone.
     Clients can obtain the actual commit ID by querying the "sha" attribute, and the temp directory name with "dir".
+    When a GitCache is given, objects are fetched into and borrowed from the cache instead of being downloaded into the checkout.
     """
 
-    def __init__(self, url, ref, directory=None, working_subdirectory=None):
+    # seconds after which listing remote refs, which transfers no objects, is considered hung
+    LS_REMOTE_TIMEOUT = 60
+
+    def __init__(self, url, ref, directory=None, working_subdirectory=None, cache=None):
         self.url = url
         self.ref = ref
+        self.cache = cache
         if directory is None:
             self.temp_dir = tempfile.TemporaryDirectory()
             self.dir = os.path.realpath(self.temp_dir.name)
@@ -36,11 +43,45 @@ class GitRepository:
         # Check out the repository
         self.execute_silent("git init", self.dir)
         self.execute_silent(f"git remote add origin {self.url}", self.dir)
-        self.execute_silent(f"git fetch --depth 1 origin {self.ref}", self.dir)
-        self.execute_silent("git checkout FETCH_HEAD", self.dir)
+        if self.cache:
+            sha = self.cache.checkout(self.url, self.ref, self.dir)
+            self.execute_silent(f"git checkout {sha}", self.dir)
+        else:
+            self.execute_silent(f"git fetch --depth 1 origin {self.ref}", self.dir)
+            self.execute_silent("git checkout FETCH_HEAD", self.dir)
         self.sha = self.output("git rev-parse HEAD", self.dir)
         logging.info(f"Checked out {self.url}@{self.ref} into {self.dir} at {self.sha}")
 
+    @classmethod
+    def from_directory(cls, url, directory, working_subdirectory=None):
+        """
+        Open an existing checkout, e.g. one made by an earlier process, without fetching anything.
+        """
+        repo = cls.__new__(cls)
+        repo.url = url
+        repo.cache = None
+        repo.temp_dir = None
+        repo.dir = directory
+        repo.working_subdirectory = working_subdirectory
+        repo.sha = repo.output("git rev-parse HEAD", directory)
+        repo.ref = repo.sha
+        return repo
+
+    @classmethod
+    def ls_remote(cls, url, pattern):
+        """
+        List the refs of a remote repository that match a pattern, e.g. "HEAD" or "refs/heads/*".
+        Environment variables in the url, e.g. ${GITHUB_TOKEN}, are expanded as they would be by the shell in a checkout.
+        :returns a dict of ref names to commit IDs, in the order git lists them.
+        """
+        logging.info(f"Listing {pattern} of {url}")
+        refs = {}
+        command = ["git", "ls-remote", os.path.expandvars(url), pattern]
+        for line in ProcessRunner.output(command, timeout=cls.LS_REMOTE_TIMEOUT).splitlines():
+            sha, ref = line.split("\t", 1)
+            refs[ref] = sha
+        return refs
+
     @property
     def working_directory(self):
         if self.working_subdirectory:
@@ -51,23 +92,17 @@ class GitRepository:
     def execute_silent(self, command, cwd=None):
         cwd = cwd or self.working_directory
         logging.info(f'Executing "{command}" in {cwd}')
-        subprocess.check_call(
-            command,
-            cwd=cwd,
-            shell=True,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        ProcessRunner.call(command, cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
     def output(self, command, cwd=None):
         cwd = cwd or self.working_directory
         logging.info(f'Executing "{command}" in {cwd}')
-        return subprocess.check_output(command, cwd=cwd, shell=True).decode().strip()
+        return ProcessRunner.output(command, cwd).strip()
 
     def execute(self, command, cwd=None):
         cwd = cwd or self.working_directory
         logging.info(f'Executing "{command}" in {cwd}')
-        subprocess.check_call(command, cwd=cwd, shell=True)
+        ProcessRunner.call(command, cwd)
 
     def path(self, subdirname=None):
         dirname = self.dir
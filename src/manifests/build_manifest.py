@@ -86,6 +86,14 @@ class BuildManifest(Manifest):
         self.components = list(
             map(lambda entry: self.Component(entry), data.get("components", []))
         )
+        self.components_by_name = {component.name: component for component in self.components}
+        self.artifacts_by_type: dict = {}
+        self.components_by_artifact = {}
+        for component in self.components:
+            for artifact_type, paths in component.artifacts.items():
+                self.artifacts_by_type.setdefault(artifact_type, []).extend(paths)
+                for path in paths:
+                    self.components_by_artifact[path] = component
 
     def __to_dict__(self):
         return {
@@ -97,10 +105,7 @@ class BuildManifest(Manifest):
         }
 
     def get_component(self, component_name):
-        component = next(
-            iter(filter(lambda comp: comp.name == component_name, self.components)),
-            None,
-        )
+        component = self.components_by_name.get(component_name, None)
         if component is None:
             raise BuildManifest.ComponentNotFoundError(
                 f"{component_name} not found in build manifest.yml"
@@ -128,6 +133,8 @@ class BuildManifest(Manifest):
         pass
 
     class Build:
+        __slots__ = ["name", "version", "architecture", "id"]
+
         def __init__(self, data):
             self.name = data["name"]
             self.version = data["version"]
@@ -143,12 +150,14 @@ class BuildManifest(Manifest):
             }
 
     class Component:
+        __slots__ = ["name", "repository", "ref", "commit_id", "artifacts", "version"]
+
         def __init__(self, data):
             self.name = data["name"]
             self.repository = data["repository"]
             self.ref = data["ref"]
             self.commit_id = data["commit_id"]
-            self.artifacts = data.get("artifacts", [])
+            self.artifacts = data.get("artifacts", {})
             self.version = data["version"]
 
         def __to_dict__(self):
@@ -66,6 +66,8 @@ class BundleManifest(Manifest):
         self.components = list(
             map(lambda entry: self.Component(entry), data["components"])
         )
+        self.components_by_name = {component.name: component for component in self.components}
+        self.components_by_location = {component.location: component for component in self.components}
 
     def __to_dict__(self):
         return {
@@ -102,6 +104,8 @@ class BundleManifest(Manifest):
         return f"bundles/{opensearch_version}/{build_id}/{architecture}/manifest.yml"
 
     class Build:
+        __slots__ = ["name", "version", "architecture", "location", "id"]
+
         def __init__(self, data):
             self.name = data["name"]
             self.version = data["version"]
@@ -119,6 +123,8 @@ class BundleManifest(Manifest):
             }
 
     class Component:
+        __slots__ = ["name", "repository", "ref", "commit_id", "location"]
+
         def __init__(self, data):
             self.name = data["name"]
             self.repository = data["repository"]
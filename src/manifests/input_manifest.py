@@ -19,6 +19,7 @@ components:
     repository: URL of git repository
     ref: git ref to build (sha, branch, or tag)
     working_directory: optional relative directory to run commands in
+    depends_on: optional list of names of components that must be built first
     checks: CI checks
       - check1
       - ...
@@ -48,6 +49,7 @@ class InputManifest(Manifest):
                     "ref": {"required": True, "type": "string"},
                     "repository": {"required": True, "type": "string"},
                     "working_directory": {"type": "string"},
+                    "depends_on": {"type": "list", "schema": {"type": "string"}},
                     "checks": {
                         "type": "list",
                         "schema": {"anyof": [{"type": "string"}, {"type": "dict"}]},
@@ -64,6 +66,16 @@ class InputManifest(Manifest):
         self.components = list(
             map(lambda entry: self.Component(entry), data["components"])
         )
+        self.components_by_name = {component.name: component for component in self.components}
+        self.__check_dependencies()
+
+    def __check_dependencies(self):
+        for component in self.components:
+            for dependency in component.depends_on or []:
+                if dependency not in self.components_by_name:
+                    raise ValueError(
+                        f"Invalid dependency of {component.name}: {dependency} is not a component"
+                    )
 
     def __to_dict__(self):
         return {
@@ -75,6 +87,8 @@ class InputManifest(Manifest):
         }
 
     class Build:
+        __slots__ = ["name", "version"]
+
         def __init__(self, data):
             self.name = data["name"]
             self.version = data["version"]
@@ -83,11 +97,14 @@ class InputManifest(Manifest):
             return {"name": self.name, "version": self.version}
 
     class Component:
+        __slots__ = ["name", "repository", "ref", "working_directory", "depends_on", "checks"]
+
         def __init__(self, data):
             self.name = data["name"]
             self.repository = data["repository"]
             self.ref = data["ref"]
             self.working_directory = data.get("working_directory", None)
+            self.depends_on = data.get("depends_on", None)
             self.checks = list(
                 map(lambda entry: InputManifest.Check(entry), data.get("checks", []))
             )
@@ -99,11 +116,14 @@ class InputManifest(Manifest):
                     "repository": self.repository,
                     "ref": self.ref,
                     "working_directory": self.working_directory,
+                    "depends_on": self.depends_on,
                     "checks": list(map(lambda check: check.__to_dict__(), self.checks)),
                 }
             )
 
     class Check:
+        __slots__ = ["name", "args"]
+
         def __init__(self, data):
             if isinstance(data, dict):
                 if len(data) != 1:
@@ -4,20 +4,33 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import threading
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Tuple
 
 import yaml
 from cerberus import Validator  # type:ignore
 
+# the libyaml bindings are much faster than the pure python loader on large build manifests
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type:ignore
+
 
 class Manifest(ABC):
     SCHEMA = {
         "schema-version": {"required": True, "type": "string", "allowed": ["1.0"]}
     }
 
+    # one compiled validator per manifest class; a cerberus validator keeps the state of the last validation, hence the lock
+    __validators: Dict[type, Tuple[Any, threading.Lock]] = {}
+    __validators_lock = threading.Lock()
+
     @classmethod
     def from_file(cls, file):
-        return cls(yaml.safe_load(file))
+        return cls(yaml.load(file, Loader=SafeLoader))
 
     @classmethod
     def from_path(cls, path):
@@ -44,7 +57,7 @@ class Manifest(ABC):
 
     def to_file(self, path):
         with open(path, "w") as file:
-            yaml.safe_dump(self.to_dict(), file)
+            yaml.dump(self.to_dict(), file, Dumper=SafeDumper)
 
     @abstractmethod
     def __init__(self, data):
@@ -56,6 +69,14 @@ class Manifest(ABC):
         return self.SCHEMA
 
     def validate(self, data):
-        v = Validator(self.schema)
-        if not v.validate(data):
-            raise ValueError(f"Invalid manifest schema: {v.errors}")
+        v, lock = self.__validator()
+        with lock:
+            if not v.validate(data):
+                raise ValueError(f"Invalid manifest schema: {v.errors}")
+
+    def __validator(self):
+        with Manifest.__validators_lock:
+            key = type(self)
+            if key not in Manifest.__validators:
+                Manifest.__validators[key] = (Validator(self.schema), threading.Lock())
+            return Manifest.__validators[key]
@@ -11,9 +11,15 @@ from sortedcontainers import SortedDict  # type: ignore
 
 
 class Manifests(SortedDict):
+    """
+    Manifests sorted by version, with the version taken from each filename.
+    A manifest is only parsed the first time it is accessed, after which it is cached.
+    """
+
     def __init__(self, klass, files):
         super(Manifests, self).__init__()
         self.klass = klass
+        self.__files = {}
         self.__append__(files)
 
     def __append__(self, files):
@@ -24,8 +30,24 @@ class Manifests(SortedDict):
                 raise ValueError(f"Invalid file: {basename}")
 
             version = match.group(1)
-            manifest = self.klass.from_path(filename)
+            self.__files[version] = filename
+            self.__setitem__(version, None)
+
+    def __getitem__(self, version):
+        manifest = super(Manifests, self).__getitem__(version)
+        if manifest is None:
+            manifest = self.klass.from_path(self.__files[version])
             self.__setitem__(version, manifest)
+        return manifest
+
+    def get(self, version, default=None):
+        return self[version] if version in self else default
+
+    def values(self):
+        return list(map(self.__getitem__, self.keys()))
+
+    def items(self):
+        return list(map(lambda version: (version, self[version]), self.keys()))
 
     @property
     def manifests_path(self):
@@ -35,11 +57,11 @@ class Manifests(SortedDict):
 
     @property
     def versions(self):
-        return list(map(lambda manifest: manifest.build.version, self.values()))
+        return list(self.keys())
 
     @property
     def latest(self):
         if len(self) == 0:
             raise RuntimeError("No manifests found")
 
-        return self.values()[-1]
+        return self[self.keys()[-1]]
@@ -82,6 +82,7 @@ class TestManifest(Manifest):
         self.components = list(
             map(lambda entry: self.Component(entry), data["components"])
         )
+        self.components_by_name = {component.name: component for component in self.components}
 
     def __to_dict__(self):
         return {
@@ -92,6 +93,8 @@ class TestManifest(Manifest):
         }
 
     class Component:
+        __slots__ = ["name", "working_directory", "integ_test", "bwc_test"]
+
         def __init__(self, data):
             self.name = data["name"]
             self.working_directory = data.get("working-directory", None)
@@ -5,8 +5,8 @@
 # compatible open source license.
 
 import re
-import subprocess
 
+from git.git_repository import GitRepository
 from manifests.manifest import Manifest
 
 
@@ -21,13 +21,7 @@ class Component:
     def branches(self, uri):
         """Return main or any x.y branches."""
         branches = ["main"]
-        remote_branches = (
-            subprocess.check_output(
-                f"git ls-remote {uri} refs/heads/* | cut -f2 | cut -d/ -f3", shell=True
-            )
-            .decode()
-            .split("\n")
-        )
+        remote_branches = [ref.split("/")[2] for ref in GitRepository.ls_remote(uri, "refs/heads/*")]
         branches.extend(filter(lambda b: re.match(r"[\d]+.[\dx]*", b), remote_branches))
         return branches
 
@@ -9,6 +9,8 @@ import subprocess
 
 from git.git_repository import GitRepository
 from manifests_workflow.component import Component
+from manifests_workflow.static_version import StaticVersion
+from system.process_runner import ProcessRunner
 from system.properties_file import PropertiesFile
 
 
@@ -22,6 +24,7 @@ class ComponentOpenSearch(Component):
         branch="main",
         snapshot=False,
         working_directory=None,
+        opensearch_min=None,
     ):
         return ComponentOpenSearch(
             name,
@@ -33,11 +36,20 @@ class ComponentOpenSearch(Component):
             ),
             opensearch_version,
             snapshot,
+            opensearch_min,
         )
 
-    def __init__(self, name, repo, opensearch_version, snapshot=False):
+    def __init__(self, name, repo, opensearch_version, snapshot=False, opensearch_min=None):
+        """
+        :param opensearch_min: The ComponentOpenSearchMin to build against, published to its maven local repository when gradle needs it.
+        """
         super().__init__(name, repo, snapshot)
         self.opensearch_version = opensearch_version
+        self.opensearch_min = opensearch_min
+
+    @property
+    def maven_local(self):
+        return self.opensearch_min.maven_local if self.opensearch_min else None
 
     @property
     def properties(self):
@@ -47,19 +59,30 @@ class ComponentOpenSearch(Component):
                 "opensearch.version": self.opensearch_version,
                 "build.snapshot": str(self.snapshot).lower(),
             },
+            self.maven_local,
         )
         return PropertiesFile(self.git_repo.output(cmd))
 
     @property
     def version(self):
+        version = StaticVersion(self.git_repo.working_directory).plugin(self.opensearch_version, self.snapshot)
+        if version:
+            return version
         try:
+            if self.opensearch_min:
+                self.opensearch_min.publish_to_maven_local()
             return self.properties.get_value("version")
         except subprocess.CalledProcessError as err:
             logging.warn(f"Error getting version of {self.name}: {str(err)}, ignored")
             return None
 
     @classmethod
-    def gradle_cmd(self, target, props={}):
-        cmd = [f"./gradlew {target}"]
+    def gradle_cmd(self, target, props={}, maven_local=None):
+        """
+        :param maven_local: A maven local repository to use instead of ~/.m2/repository.
+        """
+        cmd = [f"{ProcessRunner.gradlew()} {target}"]
         cmd.extend([f"-D{k}={v}" for k, v in props.items()])
+        if maven_local:
+            cmd.append(f"-Dmaven.repo.local={maven_local}")
         return " ".join(cmd)
@@ -4,20 +4,27 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import os
+import threading
+
 from git.git_repository import GitRepository
 from manifests_workflow.component import Component
 from manifests_workflow.component_opensearch import ComponentOpenSearch
+from manifests_workflow.static_version import StaticVersion
 from system.properties_file import PropertiesFile
 
 
 class ComponentOpenSearchMin(Component):
-    def __init__(self, repo, snapshot=False):
+    def __init__(self, repo, snapshot=False, maven_local=None):
         super().__init__(
             "OpenSearch",
             repo,
             snapshot,
             ["gradle:publish", "gradle:properties:version"],
         )
+        self.maven_local = maven_local
+        self.__published = False
+        self.__publish_lock = threading.Lock()
 
     @classmethod
     def branches(self):
@@ -35,27 +42,42 @@ class ComponentOpenSearchMin(Component):
 
     @classmethod
     def checkout(self, path, branch="main", snapshot=False):
+        # each branch publishes into its own maven local repository, so that branches can be built concurrently
         return ComponentOpenSearchMin(
             GitRepository(
                 "https://github.com/opensearch-project/OpenSearch.git", branch, path
             ),
             snapshot,
+            os.path.realpath(path) + "-maven",
         )
 
     def publish_to_maven_local(self):
+        with self.__publish_lock:
+            if not self.__published:
+                self.__publish_to_maven_local()
+                self.__published = True
+
+    def __publish_to_maven_local(self):
         cmd = ComponentOpenSearch.gradle_cmd(
-            "publishToMavenLocal", {"build.snapshot": str(self.snapshot).lower()}
+            "publishToMavenLocal",
+            {"build.snapshot": str(self.snapshot).lower()},
+            self.maven_local,
         )
         self.git_repo.execute_silent(cmd)
 
     @property
     def properties(self):
         cmd = ComponentOpenSearch.gradle_cmd(
-            "properties", {"build.snapshot": str(self.snapshot).lower()}
+            "properties",
+            {"build.snapshot": str(self.snapshot).lower()},
+            self.maven_local,
         )
         return PropertiesFile(self.git_repo.output(cmd))
 
     @property
     def version(self):
+        version = StaticVersion(self.git_repo.working_directory).opensearch(self.snapshot)
+        if version:
+            return version
         self.publish_to_maven_local()
         return self.properties.get_value("version")
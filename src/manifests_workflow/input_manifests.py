@@ -9,6 +9,7 @@ import logging
 import os
 import re
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 from manifests.input_manifest import InputManifest
 from manifests.manifests import Manifests
@@ -16,6 +17,8 @@ from system.temporary_directory import TemporaryDirectory
 
 
 class InputManifests(Manifests):
+    PARALLEL = 4
+
     def __init__(self, name):
         self.name = name
         self.prefix = name.lower().replace(" ", "-")
@@ -40,7 +43,12 @@ class InputManifests(Manifests):
         return results
 
     @abstractmethod
-    def update(self, min_klass, component_klass, keep=False):
+    def update(self, min_klass, component_klass, keep=False, parallel=PARALLEL):
+        """
+        Check out all branches of the min component and the main branch of every component of the latest manifest,
+        and write a manifest for each version that does not have one yet.
+        :param parallel: The maximum number of branches or components to check out and probe at the same time.
+        """
         known_versions = self.versions
         logging.info(f"Known versions: {known_versions}")
         main_versions = {}
@@ -48,45 +56,41 @@ class InputManifests(Manifests):
             logging.info(f"Checking out components into {work_dir}")
             os.chdir(work_dir)
 
-            # check out and build #main, 1.x, etc.
-            branches = min_klass.branches()
-            logging.info(f"Checking {self.name} {branches} branches")
-            for branch in branches:
-                c = min_klass.checkout(
-                    path=os.path.join(
-                        work_dir, f"{self.name.replace(' ', '')}/{branch}"
-                    ),
-                    branch=branch,
+            with ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+                # check out and build #main, 1.x, etc.
+                branches = min_klass.branches()
+                logging.info(f"Checking {self.name} {branches} branches")
+                probes = executor.map(
+                    lambda branch: self.__probe_branch(min_klass, work_dir, branch),
+                    branches,
                 )
-                version = c.version
-                logging.info(f"{self.name}#{branch} is version {version}")
-                if version not in main_versions.keys():
-                    main_versions[version] = [c]
-
-            if component_klass is not None:
-                # components can increment their own version first without incrementing min
-                manifest = self.latest
-                for component in manifest.components:
-                    if component.name == self.name:
-                        continue
-
-                    logging.info(f"Checking out {component.name}#main")
-                    component = component_klass.checkout(
-                        name=component.name,
-                        path=os.path.join(work_dir, component.name),
-                        version=manifest.build.version,
-                        branch="main",
-                    )
+                for branch, (c, version) in zip(branches, probes):
+                    logging.info(f"{self.name}#{branch} is version {version}")
+                    if version not in main_versions.keys():
+                        main_versions[version] = [c]
 
-                    component_version = component.version
-                    if component_version:
-                        release_version = ".".join(component_version.split(".")[:3])
-                        if release_version not in main_versions.keys():
-                            main_versions[release_version] = []
-                        main_versions[release_version].append(component)
-                        logging.info(
-                            f"{component.name}#main is version {release_version} (from {component_version})"
-                        )
+                if component_klass is not None:
+                    # components can increment their own version first without incrementing min
+                    manifest = self.latest
+                    # components build against the min artifacts of the same version, published by its branch
+                    min_components = main_versions.get(manifest.build.version, [])
+                    opensearch_min = min_components[0] if min_components else None
+                    components = list(filter(lambda component: component.name != self.name, manifest.components))
+                    probes = executor.map(
+                        lambda component: self.__probe_component(
+                            component_klass, work_dir, component, manifest.build.version, opensearch_min
+                        ),
+                        components,
+                    )
+                    for component, component_version in probes:
+                        if component_version:
+                            release_version = ".".join(component_version.split(".")[:3])
+                            if release_version not in main_versions.keys():
+                                main_versions[release_version] = []
+                            main_versions[release_version].append(component)
+                            logging.info(
+                                f"{component.name}#main is version {release_version} (from {component_version})"
+                            )
 
             # summarize
             logging.info("Found versions on main:")
@@ -98,6 +102,24 @@ class InputManifests(Manifests):
             for release_version in sorted(main_versions.keys() - known_versions):
                 self.write_manifest(release_version, main_versions[release_version])
 
+    def __probe_branch(self, min_klass, work_dir, branch):
+        c = min_klass.checkout(
+            path=os.path.join(work_dir, f"{self.name.replace(' ', '')}/{branch}"),
+            branch=branch,
+        )
+        return c, c.version
+
+    def __probe_component(self, component_klass, work_dir, component, opensearch_version, opensearch_min):
+        logging.info(f"Checking out {component.name}#main")
+        c = component_klass.checkout(
+            name=component.name,
+            path=os.path.join(work_dir, component.name),
+            opensearch_version=opensearch_version,
+            branch="main",
+            opensearch_min=opensearch_min,
+        )
+        return c, c.version
+
     def write_manifest(self, version, components=[]):
         logging.info(f"Creating new version: {version}")
         data = {
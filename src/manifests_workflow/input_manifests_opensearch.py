@@ -17,9 +17,10 @@ class InputManifestsOpenSearch(InputManifests):
     def files(self):
         return InputManifests.files("opensearch")
 
-    def update(self, keep=False):
+    def update(self, keep=False, parallel=InputManifests.PARALLEL):
         super().update(
             min_klass=ComponentOpenSearchMin,
             component_klass=ComponentOpenSearch,
             keep=keep,
+            parallel=parallel,
         )
@@ -17,7 +17,7 @@ class InputManifestsOpenSearchDashboards(InputManifests):
     def files(self):
         return InputManifests.files("opensearch-dashboards")
 
-    def update(self, keep=False):
+    def update(self, keep=False, parallel=InputManifests.PARALLEL):
         super().update(
-            min_klass=ComponentOpenSearchDashboardsMin, component_klass=None, keep=keep
+            min_klass=ComponentOpenSearchDashboardsMin, component_klass=None, keep=keep, parallel=parallel
         )
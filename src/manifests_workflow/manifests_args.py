@@ -7,6 +7,7 @@
 import argparse
 import logging
 
+from manifests_workflow.input_manifests import InputManifests
 from manifests_workflow.input_manifests_opensearch import \
     InputManifestsOpenSearch
 from manifests_workflow.input_manifests_opensearch_dashboards import \
@@ -31,6 +32,13 @@ class ManifestsArgs:
             action="store_true",
             help="Do not delete the working temporary directory.",
         )
+        parser.add_argument(
+            "-p",
+            "--parallel",
+            type=int,
+            default=InputManifests.PARALLEL,
+            help=f"Number of branches or components to check out and build concurrently, default is {InputManifests.PARALLEL}.",
+        )
         parser.add_argument(
             "-v",
             "--verbose",
@@ -44,6 +52,7 @@ class ManifestsArgs:
         self.logging_level = args.logging_level
         self.action = args.action
         self.keep = args.keep
+        self.parallel = args.parallel
         self.manifests = ManifestsArgs.__get_manifests(args.type)
 
     @classmethod
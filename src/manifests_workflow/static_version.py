@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+import os
+import re
+
+from system.properties_file import PropertiesFile
+
+"""
+This class reads the version of a component from its build files, without running gradle.
+It understands buildSrc/version.properties of OpenSearch, a version in gradle.properties, and the idioms plugins use in build.gradle
+to derive their version from opensearch_version. Whenever the build files do not match exactly one known idiom the version is
+ambiguous, None is returned, and callers fall back to asking gradle.
+"""
+
+
+class StaticVersion:
+    # an assignment to the project version, but not to opensearch_version, toolVersion, project.version, etc.
+    VERSION_ASSIGNMENT = re.compile(r"(?<![\w.])version\s*=\s*(.+)$", re.MULTILINE)
+    # an assignment of the project version to itself, e.g. in a pom
+    PROJECT_VERSION = re.compile(r"""^(?:project\.version|"\$\{project\.version\}"|"\$version"|version)$""")
+    COMMENTS = re.compile(r"/\*.*?\*/|^\s*//[^\n]*", re.DOTALL | re.MULTILINE)
+
+    OPENSEARCH_BUILD = re.compile(r"""opensearch_build\s*=\s*opensearch_version\.replaceAll\(""")
+    OPENSEARCH_BUILD_PATCH = re.compile(r"""opensearch_build\s*\+=\s*['"]\.0['"]""")
+    OPENSEARCH_VERSION_DEFAULT = re.compile(r"""System\.getProperty\(\s*['"]opensearch\.version['"]\s*,\s*['"]([^'"]+)['"]\s*\)""")
+    SNAPSHOT_SUFFIX = re.compile(r"""\+=\s*['"]-SNAPSHOT['"]""")
+
+    # the value of a version assignment, and the version it yields given build.gradle and the release version of opensearch
+    RULES = [
+        # version = '1.2.0.0'
+        (re.compile(r"""^['"](\d+(?:\.\d+)+)['"]$"""), lambda match, build_gradle, release: match.group(1)),
+        # version = opensearch_version.tokenize('-')[0] + '.0'
+        (
+            re.compile(r"""^opensearch_version\.tokenize\(['"]-['"]\)\[0\]\s*\+\s*['"]\.0['"]$"""),
+            lambda match, build_gradle, release: release and f"{release}.0",
+        ),
+        # version = "${opensearch_build}", with opensearch_build = opensearch_version.replaceAll(...) and opensearch_build += ".0"
+        (
+            re.compile(r"""^(?:"\$\{opensearch_build\}"|"\$opensearch_build"|opensearch_build)$"""),
+            lambda match, build_gradle, release: f"{release}.0"
+            if all([release, StaticVersion.OPENSEARCH_BUILD.search(build_gradle), StaticVersion.OPENSEARCH_BUILD_PATCH.search(build_gradle)])
+            else None,
+        ),
+    ]
+
+    def __init__(self, path):
+        """
+        :param path: The working directory of the component.
+        """
+        self.path = path
+
+    def opensearch(self, snapshot=False):
+        """
+        Return the version of OpenSearch from buildSrc/version.properties, or None.
+        """
+        properties = self.__properties("buildSrc/version.properties")
+        version = properties.get_value("opensearch") if properties else None
+        if not version:
+            return None
+        version = version.split("-")[0]
+        return f"{version}-SNAPSHOT" if snapshot else version
+
+    def plugin(self, opensearch_version=None, snapshot=False):
+        """
+        Return the version of a plugin from gradle.properties or build.gradle, or None if it cannot be read unambiguously.
+        :param opensearch_version: The version of OpenSearch the plugin is built against, defaults to the one in build.gradle.
+        """
+        properties = self.__properties("gradle.properties")
+        version = properties.get_value("version") if properties else None
+        if version:
+            return version
+
+        build_gradle = self.__read("build.gradle")
+        if build_gradle is None:
+            return None
+        build_gradle = self.COMMENTS.sub("", build_gradle)
+
+        if opensearch_version is None:
+            match = self.OPENSEARCH_VERSION_DEFAULT.search(build_gradle)
+            opensearch_version = match.group(1) if match else None
+        release = opensearch_version.split("-")[0] if opensearch_version else None
+
+        versions = set()
+        for assignment in self.VERSION_ASSIGNMENT.finditer(build_gradle):
+            value = assignment.group(1).strip()
+            if not self.PROJECT_VERSION.match(value):
+                versions.add(self.__evaluate(value, build_gradle, release))
+
+        if len(versions) != 1 or None in versions:
+            logging.debug(f"Ambiguous version in {os.path.join(self.path, 'build.gradle')}: {versions}")
+            return None
+
+        version = versions.pop()
+        if snapshot and self.SNAPSHOT_SUFFIX.search(build_gradle):
+            version += "-SNAPSHOT"
+        return version
+
+    def __evaluate(self, value, build_gradle, release):
+        for pattern, version in self.RULES:
+            match = pattern.match(value)
+            if match:
+                return version(match, build_gradle, release) or None
+        return None
+
+    def __read(self, name):
+        try:
+            with open(os.path.join(self.path, name), "r") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def __properties(self, name):
+        data = self.__read(name)
+        return PropertiesFile(data) if data is not None else None
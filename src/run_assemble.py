@@ -22,6 +22,14 @@ from system import console
 def main():
     parser = argparse.ArgumentParser(description="Assemble an OpenSearch Bundle")
     parser.add_argument("manifest", type=argparse.FileType("r"), help="Manifest file.")
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        choices=range(1, 10),
+        default=9,
+        metavar="[1-9]",
+        help="Gzip compression level of the bundle, from 1 (fastest) to 9 (smallest).",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -77,7 +85,7 @@ def main():
 
         #  Save a copy of the manifest inside of the tar
         bundle_recorder.write_manifest(bundle.archive_path)
-        bundle.build_tar(output_dir)
+        bundle.build_tar(output_dir, args.compression_level)
 
         bundle_recorder.write_manifest(output_dir)
 
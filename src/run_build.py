@@ -11,10 +11,13 @@ import os
 import sys
 
 from build_workflow.build_args import BuildArgs
+from build_workflow.build_cache import BuildCache
 from build_workflow.build_recorder import BuildRecorder
+from build_workflow.build_scheduler import BuildScheduler
 from build_workflow.build_target import BuildTarget
 from build_workflow.builder import Builder
-from git.git_repository import GitRepository
+from git.git_cache import GitCache
+from git.git_repositories import GitRepositories
 from manifests.input_manifest import InputManifest
 from system import console
 from system.temporary_directory import TemporaryDirectory
@@ -24,6 +27,8 @@ def main():
     args = BuildArgs()
     console.configure(level=args.logging_level)
     manifest = InputManifest.from_file(args.manifest)
+    cache = GitCache(args.git_cache) if args.git_cache else None
+    build_cache = BuildCache(args.build_cache) if args.build_cache else None
 
     with TemporaryDirectory(keep=args.keep) as work_dir:
         output_dir = os.path.join(os.getcwd(), "artifacts")
@@ -41,28 +46,37 @@ def main():
 
         os.makedirs(target.output_dir, exist_ok=True)
 
-        build_recorder = BuildRecorder(target)
-
         logging.info(
             f"Building {manifest.build.name} ({target.arch}) into {target.output_dir}"
         )
 
+        components = []
         for component in manifest.components:
 
             if args.component and args.component != component.name:
                 logging.info(f"Skipping {component.name}")
                 continue
 
+            components.append(component)
+
+        build_recorder = BuildRecorder(target, args.link_artifacts, [component.name for component in components])
+
+        repos = GitRepositories(work_dir, cache=cache).checkout(components)
+        scheduler = BuildScheduler(components, args.parallel, manifest.components)
+
+        def build(component):
             logging.info(f"Building {component.name}")
-            repo = GitRepository(
-                component.repository,
-                component.ref,
-                os.path.join(work_dir, component.name),
-                component.working_directory,
-            )
+            repo = repos[component.name]
 
             try:
-                builder = Builder(component.name, repo, build_recorder)
+                builder = Builder(
+                    component.name,
+                    repo,
+                    build_recorder,
+                    build_cache,
+                    # dependencies that are not being built have no cache key, so the component is not cached
+                    scheduler.dependencies[component.name] | scheduler.skipped_dependencies[component.name],
+                )
                 builder.build(target)
                 builder.export_artifacts()
             except:
@@ -71,6 +85,8 @@ def main():
                 )
                 raise
 
+        scheduler.run(build)
+
         build_recorder.write_manifest()
 
     logging.info("Done.")
@@ -11,7 +11,8 @@ import os
 import sys
 
 from checkout_workflow.checkout_args import CheckoutArgs
-from git.git_repository import GitRepository
+from git.git_cache import GitCache
+from git.git_repositories import GitRepositories
 from manifests.input_manifest import InputManifest
 from system import console
 from system.temporary_directory import TemporaryDirectory
@@ -21,21 +22,14 @@ def main():
     args = CheckoutArgs()
     console.configure(level=args.logging_level)
     manifest = InputManifest.from_file(args.manifest)
+    cache = GitCache(args.git_cache) if args.git_cache else None
 
     with TemporaryDirectory(keep=True) as work_dir:
         logging.info(f"Checking out into {work_dir}")
 
         os.chdir(work_dir)
 
-        for component in manifest.components:
-
-            logging.info(f"Checking out {component.name}")
-            GitRepository(
-                component.repository,
-                component.ref,
-                os.path.join(work_dir, component.name),
-                component.working_directory,
-            )
+        GitRepositories(work_dir, cache=cache).checkout(manifest.components)
 
     logging.info(f"Done, checked out into {work_dir}.")
 
@@ -10,10 +10,12 @@ import logging
 import os
 import sys
 
+from build_workflow.build_scheduler import BuildScheduler
 from ci_workflow.ci import Ci
 from ci_workflow.ci_args import CiArgs
 from ci_workflow.ci_target import CiTarget
-from git.git_repository import GitRepository
+from git.git_cache import GitCache
+from git.git_repositories import GitRepositories
 from manifests.input_manifest import InputManifest
 from system import console
 from system.temporary_directory import TemporaryDirectory
@@ -23,6 +25,7 @@ def main():
     args = CiArgs()
     console.configure(level=args.logging_level)
     manifest = InputManifest.from_file(args.manifest)
+    cache = GitCache(args.git_cache) if args.git_cache else None
 
     target = CiTarget(version=manifest.build.version, snapshot=args.snapshot)
 
@@ -33,22 +36,21 @@ def main():
 
         logging.info(f"Sanity testing {manifest.build.name}")
 
+        components = []
         for component in manifest.components:
 
             if args.component and args.component != component.name:
                 logging.info(f"Skipping {component.name}")
                 continue
 
-            logging.info(f"Sanity checking {component.name}")
-            repo = GitRepository(
-                component.repository,
-                component.ref,
-                os.path.join(work_dir, component.name),
-                component.working_directory,
-            )
+            components.append(component)
+
+        repos = GitRepositories(work_dir, cache=cache).checkout(components)
 
+        def check(component):
+            logging.info(f"Sanity checking {component.name}")
             try:
-                ci = Ci(component, repo, target)
+                ci = Ci(component, repos[component.name], target, args.gradle_cache)
                 ci.check()
             except:
                 logging.error(
@@ -56,6 +58,9 @@ def main():
                 )
                 raise
 
+        # components are checked in dependency order, since checks resolve the artifacts that earlier components publish
+        BuildScheduler(components, args.parallel).run(check)
+
     logging.info("Done.")
 
 
@@ -36,10 +36,6 @@ def main():
     console.configure(level=args.logging_level)
     test_manifest_path = os.path.join(os.path.dirname(__file__), 'test_workflow/config/test_manifest.yml')
     test_manifest = TestManifest.from_path(test_manifest_path)
-    integ_test_config = dict()
-    for component in test_manifest.components:
-        if component.integ_test is not None:
-            integ_test_config[component.name] = component
     with TemporaryDirectory(keep=args.keep) as work_dir:
         logging.info("Switching to temporary work_dir: " + work_dir)
         test_recorder = TestRecorder(args.test_run_id, "integ-test", work_dir)
@@ -52,10 +48,11 @@ def main():
         DependencyInstaller(build_manifest.build).install_all_maven_dependencies()
         all_results = TestSuiteResults()
         for component in bundle_manifest.components:
-            if component.name in integ_test_config.keys():
+            test_config = test_manifest.components_by_name.get(component.name)
+            if test_config is not None and test_config.integ_test is not None:
                 test_suite = IntegTestSuite(
                     component,
-                    integ_test_config[component.name],
+                    test_config,
                     bundle_manifest,
                     build_manifest,
                     work_dir,
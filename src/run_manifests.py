@@ -23,7 +23,7 @@ def main():
                 logging.info(f"{manifest.build.name} {manifest.build.version}")
     elif args.action == "update":
         for klass in args.manifests:
-            klass().update(keep=args.keep)
+            klass().update(keep=args.keep, parallel=args.parallel)
 
     logging.info("Done.")
 
@@ -12,6 +12,7 @@ import os
 import sys
 
 from manifests.build_manifest import BuildManifest
+from sign_workflow.signature_state import SignatureState
 from sign_workflow.signer import Signer
 from system import console
 
@@ -23,6 +24,24 @@ def main():
     )
     parser.add_argument("--component", nargs="?", help="Component name")
     parser.add_argument("--type", nargs="?", help="Artifact type")
+    parser.add_argument(
+        "-p",
+        "--parallel",
+        type=int,
+        default=Signer.PARALLEL,
+        help=f"Number of artifacts to sign concurrently, default is {Signer.PARALLEL}.",
+    )
+    parser.add_argument(
+        "--signer-cache",
+        dest="signer_cache",
+        help="Keep the bootstrapped signer client in this directory and reuse it in later runs.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        default=False,
+        help="Sign all artifacts, including those already signed by a previous run.",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -38,8 +57,9 @@ def main():
 
     manifest = BuildManifest.from_file(args.manifest)
     basepath = os.path.dirname(os.path.abspath(args.manifest.name))
-    signer = Signer()
+    signer = Signer(args.parallel, args.signer_cache)
 
+    artifacts = []
     for component in manifest.components:
 
         if args.component and args.component != component.name:
@@ -52,7 +72,11 @@ def main():
             if args.type and args.type != artifact_type:
                 continue
 
-            signer.sign_artifacts(component.artifacts[artifact_type], basepath)
+            artifacts.extend(component.artifacts[artifact_type])
+
+    # sign the artifacts of all components together, to keep all workers busy
+    state = SignatureState(os.path.join(basepath, "signatures.yml"), reset=args.force)
+    signer.sign_artifacts(artifacts, basepath, state)
 
     logging.info("Done.")
 
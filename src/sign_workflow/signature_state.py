@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import os
+import threading
+
+import yaml
+
+"""
+This class records the artifacts a Signer has signed and verified, so that signing again only signs new or changed artifacts.
+The state file maps each artifact path, relative to the state file, to the sha256 of the artifact and of its signature.
+An artifact is signed if both hashes still match, which means its signature verified against the current content.
+"""
+
+
+class SignatureState:
+    def __init__(self, path, reset=False):
+        """
+        Construct a new SignatureState instance.
+        :param path: The state file, loaded if it exists.
+        :param reset: Ignore the artifacts recorded in an existing state file.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.artifacts = {}
+        if not reset and os.path.isfile(path):
+            with open(path, "r") as f:
+                self.artifacts = yaml.safe_load(f) or {}
+
+    def is_signed(self, location):
+        entry = self.artifacts.get(self.__key(location))
+        signature = location + ".asc"
+        if entry is None or not os.path.isfile(location) or not os.path.isfile(signature):
+            return False
+        return entry["sha256"] == self.__sha256(location) and entry["signature_sha256"] == self.__sha256(signature)
+
+    def record(self, location):
+        entry = {
+            "sha256": self.__sha256(location),
+            "signature_sha256": self.__sha256(location + ".asc"),
+        }
+        with self.lock:
+            self.artifacts[self.__key(location)] = entry
+
+    def write(self):
+        with self.lock:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w") as f:
+                yaml.safe_dump(self.artifacts, f)
+            os.replace(tmp_path, self.path)
+
+    def __key(self, location):
+        return os.path.relpath(location, os.path.dirname(os.path.abspath(self.path)))
+
+    @staticmethod
+    def __sha256(path):
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(chunk)
+        return sha.hexdigest()
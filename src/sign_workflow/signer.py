@@ -9,32 +9,146 @@
 import logging
 import os
 import pathlib
+import shutil
+from concurrent.futures import (FIRST_COMPLETED, ThreadPoolExecutor,
+                                as_completed, wait)
 
 from git.git_repository import GitRepository
+from system.file_lock import FileLock
 
 """
 This class is responsible for signing an artifact using the OpenSearch-signer-client and verifying its signature.
 The signed artifacts will be found in the same location as the original artifacts.
+Artifacts are signed concurrently, and signatures are verified in batches while the remaining artifacts are being signed.
 """
 
 
 class Signer:
+    class SigningError(Exception):
+        def __init__(self, failures):
+            self.failures = failures
+            super().__init__(
+                "\n".join([f"Failed to sign {len(failures)} artifact(s)."] + [f"{name}: {error}" for name, error in failures.items()])
+            )
 
     ACCEPTED_FILE_TYPES = [".zip", ".jar", ".war", ".pom", ".module", ".tar.gz"]
+    PARALLEL = 8
+    VERIFY_BATCH_SIZE = 100
 
-    def __init__(self):
-        self.git_repo = GitRepository(self.get_repo_url(), "HEAD", working_subdirectory="src")
+    def __init__(self, parallel=PARALLEL, cache_dir=None):
+        """
+        Construct a new Signer instance.
+        :param parallel: The maximum number of artifacts to sign at the same time.
+        :param cache_dir: An optional directory where the bootstrapped signer client is kept, by commit, and reused by later runs.
+        """
+        self.parallel = parallel
+        if cache_dir:
+            self.git_repo = self.__get_cached_client(cache_dir)
+        else:
+            self.git_repo = GitRepository(self.get_repo_url(), "HEAD", working_subdirectory="src")
+            self.__bootstrap()
+
+    def __bootstrap(self):
         self.git_repo.execute("./bootstrap")
         self.git_repo.execute("rm config.cfg")
 
-    def sign_artifacts(self, artifacts, basepath):
+    def __get_cached_client(self, cache_dir):
+        url = self.get_repo_url()
+        sha = GitRepository.ls_remote(url, "HEAD")["HEAD"]
+        client_dir = os.path.join(cache_dir, sha)
+        bootstrapped = os.path.join(client_dir, ".bootstrapped")
+        if not os.path.isfile(bootstrapped):
+            os.makedirs(cache_dir, exist_ok=True)
+            with FileLock(client_dir + ".lock"):
+                if not os.path.isfile(bootstrapped):
+                    # remove what a failed bootstrap may have left behind
+                    shutil.rmtree(client_dir, ignore_errors=True)
+                    self.git_repo = GitRepository(url, sha, directory=client_dir, working_subdirectory="src")
+                    # the remote url may contain the expanded GITHUB_TOKEN, which must not be kept in the cache
+                    self.git_repo.execute_silent("git remote remove origin", client_dir)
+                    self.__bootstrap()
+                    pathlib.Path(bootstrapped).touch()
+                    return self.git_repo
+        logging.info(f"Using signer client from {client_dir}")
+        return GitRepository.from_directory(url, client_dir, working_subdirectory="src")
+
+    def sign_artifacts(self, artifacts, basepath, state=None):
+        """
+        Sign and verify artifacts. No new artifacts are signed after the first failure, and a SigningError listing all failures
+        is raised once the signatures in progress are done.
+        :param state: An optional SignatureState, artifacts it has already signed are skipped, and newly verified signatures are
+        recorded in it and written out, including when signing fails.
+        """
+        locations = []
         for artifact in artifacts:
             if not self.is_valid_file_type(artifact):
                 logging.info(f"Skipping signing of file ${artifact}")
                 continue
-            location = os.path.join(basepath, artifact)
-            self.sign(location)
-            self.verify(location + ".asc")
+            locations.append(os.path.join(basepath, artifact))
+
+        failures = {}
+        remaining = iter(locations)
+        try:
+            with ThreadPoolExecutor(max_workers=self.parallel) as executor:
+                signing = {}
+                verifying = {}
+                signatures = []
+                while True:
+                    while not failures and len(signing) < self.parallel:
+                        location = next(remaining, None)
+                        if location is None:
+                            break
+                        signing[executor.submit(self.__sign, location, state)] = location
+                    if not signing:
+                        break
+
+                    done, _ = wait(signing.keys(), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        location = signing.pop(future)
+                        if future.exception() is not None:
+                            failures[location] = future.exception()
+                            continue
+                        if not future.result():
+                            continue
+                        signatures.append(location + ".asc")
+                        if len(signatures) >= self.VERIFY_BATCH_SIZE:
+                            verifying[executor.submit(self.verify_files, signatures)] = signatures
+                            signatures = []
+                if signatures:
+                    verifying[executor.submit(self.verify_files, signatures)] = signatures
+
+                for future in as_completed(verifying):
+                    unverified = {}
+                    if future.exception() is not None:
+                        unverified = self.__find_unverified(verifying[future])
+                        failures.update(unverified)
+                    if state:
+                        for signature in verifying[future]:
+                            if signature not in unverified:
+                                state.record(signature[:-len(".asc")])
+        finally:
+            if state:
+                state.write()
+
+        if failures:
+            raise Signer.SigningError(failures)
+
+    def __sign(self, location, state):
+        if state and state.is_signed(location):
+            logging.info(f"Skipping signing of {location}, already signed")
+            return False
+        self.sign(location)
+        return True
+
+    def __find_unverified(self, signatures):
+        # a batch failed to verify, verify each signature alone to report the ones that are invalid
+        failures = {}
+        for signature in signatures:
+            try:
+                self.verify(signature)
+            except Exception as e:
+                failures[signature] = e
+        return failures
 
     def is_valid_file_type(self, file_name):
         return any(
@@ -65,5 +179,8 @@ class Signer:
         self.git_repo.execute(" ".join(signing_cmd))
 
     def verify(self, filename):
-        verify_cmd = ["gpg", "--verify-files", filename]
+        self.verify_files([filename])
+
+    def verify_files(self, filenames):
+        verify_cmd = ["gpg", "--verify-files"] + filenames
         self.git_repo.execute(" ".join(verify_cmd))
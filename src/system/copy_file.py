@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import errno
+import logging
+import os
+import shutil
+
+# errors that mean the file system can't link or clone this file, rather than that something is wrong with it
+UNSUPPORTED_ERRORS = [errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP]
+
+
+def copy_file(source, dest, link=False):
+    """
+    Copy a file, replacing dest if it exists.
+    When link is true, dest is made a hard link to source if both are on the same device. Otherwise the contents are cloned
+    with copy_file_range, which is a copy-on-write reflink on file systems that support it and an in-kernel copy otherwise,
+    and a regular copy is only made when neither is available.
+    :returns the method that was used: "link", "clone" or "copy".
+    """
+    if link:
+        if os.path.lexists(dest):
+            os.remove(dest)
+        try:
+            os.link(source, dest)
+            return "link"
+        except OSError as e:
+            if e.errno not in UNSUPPORTED_ERRORS:
+                raise
+            logging.debug(f"Cannot link {source} to {dest}: {e}")
+
+        if _clone(source, dest):
+            return "clone"
+
+    shutil.copyfile(source, dest)
+    return "copy"
+
+
+def _clone(source, dest):
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return False
+
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        try:
+            size = os.fstat(src.fileno()).st_size
+            copied = 0
+            while copied < size:
+                count = copy_file_range(src.fileno(), dst.fileno(), size - copied)
+                if count == 0:
+                    break
+                copied += count
+            if copied == size:
+                return True
+        except OSError as e:
+            if e.errno not in UNSUPPORTED_ERRORS:
+                raise
+            logging.debug(f"Cannot clone {source} to {dest}: {e}")
+
+    os.remove(dest)
+    return False
@@ -5,20 +5,126 @@
 # compatible open source license.
 
 import logging
+import os
 import subprocess
+import sys
+import threading
+from collections import deque
 
+from system.process_runner import ProcessRunner
 
-def execute(command, dir, capture=True, raise_on_failure=True):
+
+def execute(command, dir, capture=True, raise_on_failure=True, timeout=None):
     """
     Execute a shell command inside a directory.
     :param command: The shell command to execute.
     :param dir: The full path to the directory that the command should be executed in.
+    :param timeout: The seconds after which the command is killed, see ProcessRunner.
     :returns a tuple containing the exit code, stdout, and stderr.
     """
     logging.info(f'Executing "{command}" in {dir}')
-    result = subprocess.run(
-        command, cwd=dir, shell=True, capture_output=capture, text=True
-    )
-    if raise_on_failure:
-        result.check_returncode()
-    return (result.returncode, result.stdout, result.stderr)
+    stream = subprocess.PIPE if capture else None
+    return ProcessRunner.run(command, dir, timeout, check=raise_on_failure, stdout=stream, stderr=stream, text=True)
+
+
+class StreamedOutput:
+    """
+    One output stream of a command, written line by line to a file that is rotated once it grows over max_bytes,
+    with only the last lines kept in memory for error reporting.
+    """
+
+    TAIL_LINES = 100
+    MAX_BYTES = 100 * 1024 * 1024
+    BACKUP_COUNT = 5
+
+    def __init__(self, path, console=None, tail_lines=TAIL_LINES, max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+        """
+        :param path: The file to write the stream to, rotated to path.1, path.2, etc.
+        :param console: An optional stream to also write every line to, e.g. sys.stdout.
+        """
+        self.path = path
+        self.console = console
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.lines = deque(maxlen=tail_lines)
+        self.file = open(self.path, "w")
+        # bytes written to the current file, tracked here because file.tell() flushes the write buffer on every call
+        self.size = 0
+
+    @property
+    def tail(self):
+        return "".join(self.lines)
+
+    @property
+    def paths(self):
+        """
+        The files the stream was written to, oldest first.
+        """
+        backups = [f"{self.path}.{index}" for index in range(self.backup_count, 0, -1)]
+        return [path for path in backups if os.path.isfile(path)] + [self.path]
+
+    def write(self, line):
+        size = len(line.encode())
+        if self.size + size > self.max_bytes and self.size > 0:
+            self.__rotate()
+        self.file.write(line)
+        self.size += size
+        self.lines.append(line)
+        if self.console is not None:
+            self.console.write(line)
+
+    def consume(self, pipe):
+        for line in pipe:
+            self.write(line)
+
+    def close(self):
+        self.file.close()
+
+    def __rotate(self):
+        self.file.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            if os.path.isfile(f"{self.path}.{index}"):
+                os.replace(f"{self.path}.{index}", f"{self.path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        self.file = open(self.path, "w")
+        self.size = 0
+
+
+def execute_streaming(command, dir, output_dir, raise_on_failure=True, console=True, timeout=None, **kwargs):
+    """
+    Execute a shell command inside a directory, streaming its output to files in output_dir, and to the console.
+    Unlike execute, the output is never held in memory as a whole, which matters for long running commands such as tests.
+    :param command: The shell command to execute.
+    :param dir: The full path to the directory that the command should be executed in.
+    :param output_dir: The directory to write stdout.txt and stderr.txt to.
+    :param timeout: The seconds after which the command is killed, see ProcessRunner.
+    :param kwargs: Passed to StreamedOutput, e.g. tail_lines or max_bytes.
+    :returns a tuple containing the exit code, and the StreamedOutput of stdout and stderr.
+    """
+    logging.info(f'Executing "{command}" in {dir}')
+    os.makedirs(output_dir, exist_ok=True)
+    stdout = StreamedOutput(os.path.join(output_dir, "stdout.txt"), sys.stdout if console else None, **kwargs)
+    stderr = StreamedOutput(os.path.join(output_dir, "stderr.txt"), sys.stderr if console else None, **kwargs)
+    try:
+        runner = ProcessRunner(command, dir, timeout, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors="replace")
+        try:
+            readers = [
+                threading.Thread(target=stdout.consume, args=(runner.process.stdout,)),
+                threading.Thread(target=stderr.consume, args=(runner.process.stderr,)),
+            ]
+            for reader in readers:
+                reader.start()
+            for reader in readers:
+                reader.join()
+            returncode = runner.wait()
+        except BaseException:
+            runner.kill()
+            raise
+    finally:
+        stdout.close()
+        stderr.close()
+
+    if raise_on_failure and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, command, stdout.tail, stderr.tail)
+    return (returncode, stdout, stderr)
@@ -0,0 +1,26 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import fcntl
+import logging
+import os
+from contextlib import contextmanager
+
+
+@contextmanager
+def FileLock(path):
+    """
+    Hold an exclusive lock on a file for the duration of the context, waiting for other processes to release it first.
+    The lock file is created if needed and left in place.
+    """
+    os.makedirs(os.path.dirname(os.path.realpath(path)), exist_ok=True)
+    with open(path, "a") as f:
+        logging.debug(f"Waiting for lock on {path}")
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield path
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import collections
+import gzip
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+"""
+A write-only file object that gzip-compresses its input on several threads.
+Input is split into fixed-size blocks, each block is compressed into its own gzip member, and members are written
+in order. A sequence of gzip members is a valid gzip file (RFC 1952) that gzip, tar and Python's gzip module all read
+as a single stream. zlib releases the GIL while compressing, so blocks are compressed in parallel.
+"""
+
+
+class ParallelGzipFile(io.RawIOBase):
+    BLOCK_SIZE = 4 * 1024 * 1024
+
+    def __init__(self, path, compresslevel=9, block_size=BLOCK_SIZE, workers=None):
+        """
+        Construct a new ParallelGzipFile instance.
+        :param path: The file to write, truncated if it exists.
+        :param compresslevel: The gzip compression level, from 1 (fastest) to 9 (smallest).
+        :param block_size: The size of uncompressed data in each gzip member.
+        :param workers: The number of threads compressing blocks, defaults to the number of CPUs.
+        """
+        super().__init__()
+        self.compresslevel = compresslevel
+        self.block_size = block_size
+        self.workers = workers or os.cpu_count() or 1
+        self.buffer = bytearray()
+        self.pending = collections.deque()
+        self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        self.file = open(path, "wb")
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buffer += data
+        while len(self.buffer) >= self.block_size:
+            self.__submit(bytes(self.buffer[:self.block_size]))
+            del self.buffer[:self.block_size]
+        return len(data)
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self.buffer:
+                self.__submit(bytes(self.buffer))
+                self.buffer.clear()
+            while self.pending:
+                self.file.write(self.pending.popleft().result())
+        finally:
+            self.executor.shutdown()
+            self.file.close()
+            super().close()
+
+    def __submit(self, block):
+        self.pending.append(self.executor.submit(gzip.compress, block, self.compresslevel))
+        # bound the memory used by blocks in flight, writing completed members in order
+        while len(self.pending) > 2 * self.workers:
+            self.file.write(self.pending.popleft().result())
@@ -0,0 +1,241 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+"""
+This class runs a command in its own process group, with an optional timeout, and measures it.
+When the command exits it is reaped with wait4, which reports the CPU time and peak RSS of the command and of the descendants it
+waited for, e.g. gradlew and the gradle client JVM, but not a gradle daemon that detached from it. When measurements are
+reported, gradle commands built with gradlew() run with --no-daemon, so that the build itself is measured; otherwise they reuse
+a warm daemon.
+A command that times out is killed along with its whole process group, so no orphaned child keeps the executor busy.
+
+Every measurement is logged, and appended as a JSON line to the file in PROCESS_REPORT_PATH when that is set.
+PROCESS_TIMEOUT sets a default timeout in seconds for commands that do not have their own. Long-running processes, such as a
+test cluster, are started with a timeout of 0 to never time out.
+"""
+
+
+class ProcessRunner:
+    PROCESS_REPORT_PATH = "PROCESS_REPORT_PATH"
+    PROCESS_TIMEOUT = "PROCESS_TIMEOUT"
+    # seconds to wait for a process group to exit after SIGTERM, before sending SIGKILL
+    KILL_TIMEOUT = 10
+    # ru_maxrss is in bytes on macOS, and in kilobytes elsewhere
+    RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+    __report_lock = threading.Lock()
+
+    class Measurement:
+        __slots__ = ["command", "cwd", "returncode", "wall_time", "cpu_time", "max_rss", "timed_out"]
+
+        def __init__(self, command, cwd, returncode, wall_time, cpu_time, max_rss, timed_out=False):
+            self.command = command
+            self.cwd = cwd
+            self.returncode = returncode
+            self.wall_time = wall_time
+            self.cpu_time = cpu_time
+            self.max_rss = max_rss
+            self.timed_out = timed_out
+
+        def to_dict(self):
+            return {name: getattr(self, name) for name in self.__slots__}
+
+        def __str__(self):
+            return (
+                f'"{self.command}" exited with {self.returncode}{" after timing out" if self.timed_out else ""} in {self.wall_time:.1f}s, '
+                f"using {self.cpu_time:.1f}s CPU and {self.max_rss / 1024 / 1024:.0f} MiB peak RSS"
+            )
+
+    def __init__(self, command, cwd=None, timeout=None, **kwargs):
+        """
+        Start a command.
+        :param command: A shell command, or a list of arguments.
+        :param cwd: The directory to run the command in.
+        :param timeout: The seconds after which the process group is killed, defaults to PROCESS_TIMEOUT or none, 0 for none.
+        :param kwargs: Passed to subprocess.Popen, e.g. stdout or stderr.
+        """
+        self.command = command
+        self.cwd = cwd
+        self.timeout = timeout if timeout is not None else self.__default_timeout()
+        # 0 for no timeout, regardless of PROCESS_TIMEOUT
+        self.timed_out = False
+        self.measurement = None
+        self.__lock = threading.Lock()
+        self.__start = time.monotonic()
+        self.process = subprocess.Popen(command, cwd=cwd, shell=isinstance(command, str), start_new_session=True, **kwargs)
+        self.__timer = None
+        if self.timeout:
+            self.__timer = threading.Timer(self.timeout, self.__expire)
+            self.__timer.daemon = True
+            self.__timer.start()
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    @property
+    def returncode(self):
+        return self.process.returncode
+
+    def wait(self, timeout=None):
+        """
+        Wait for the command to exit and measure it.
+        :param timeout: The seconds to wait for, raising subprocess.TimeoutExpired without killing the command after that.
+        :returns the exit code of the command.
+        :raises subprocess.TimeoutExpired if the command was killed because it exceeded its own timeout.
+        """
+        with self.__lock:
+            if self.measurement is None:
+                self.__reap(timeout)
+        if self.timed_out:
+            raise subprocess.TimeoutExpired(self.command, self.timeout)
+        return self.returncode
+
+    def communicate(self):
+        """
+        Read the streams that were opened with subprocess.PIPE on separate threads, and wait for the command to exit.
+        :returns a tuple containing the output of stdout and stderr, None for streams that were not piped.
+        """
+        outputs = {}
+
+        def read(name, pipe):
+            outputs[name] = pipe.read()
+            pipe.close()
+
+        readers = [
+            threading.Thread(target=read, args=(name, pipe))
+            for name, pipe in [("stdout", self.process.stdout), ("stderr", self.process.stderr)]
+            if pipe is not None
+        ]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        self.wait()
+        return (outputs.get("stdout"), outputs.get("stderr"))
+
+    def send_signal(self, signum):
+        """
+        Send a signal to the process group of the command.
+        """
+        try:
+            os.killpg(self.pid, signum)
+        except (ProcessLookupError, PermissionError):
+            # the process group has exited
+            pass
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+    def terminate(self, timeout=KILL_TIMEOUT):
+        """
+        Send SIGTERM to the process group of the command, then SIGKILL if it does not exit within timeout seconds.
+        :returns the exit code of the command.
+        """
+        logging.info(f"Sending SIGTERM to process group {self.pid}")
+        self.send_signal(signal.SIGTERM)
+        try:
+            return self.wait(timeout)
+        except subprocess.TimeoutExpired:
+            if self.measurement is not None:
+                raise
+            logging.info(f"Process group {self.pid} did not terminate after {timeout} seconds. Sending SIGKILL")
+            self.kill()
+            return self.wait(timeout)
+
+    def __expire(self):
+        if self.measurement is None:
+            logging.error(f'"{self.command}" timed out after {self.timeout} seconds, killing process group {self.pid}')
+            self.timed_out = True
+            self.kill()
+
+    def __reap(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            pid, status, rusage = os.wait4(self.pid, 0 if deadline is None else os.WNOHANG)
+            if pid != 0:
+                break
+            if time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(self.command, timeout)
+            time.sleep(0.1)
+        # the process is reaped, so Popen must not wait for it again
+        self.process.returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+        if self.__timer is not None:
+            self.__timer.cancel()
+        self.measurement = ProcessRunner.Measurement(
+            self.command if isinstance(self.command, str) else " ".join(self.command),
+            self.cwd,
+            self.returncode,
+            time.monotonic() - self.__start,
+            rusage.ru_utime + rusage.ru_stime,
+            rusage.ru_maxrss * self.RSS_UNIT,
+            self.timed_out,
+        )
+        logging.info(f"Executed {self.measurement}")
+        self.__report(self.measurement)
+
+    @classmethod
+    def __report(cls, measurement):
+        path = os.environ.get(cls.PROCESS_REPORT_PATH)
+        if not path:
+            return
+        with cls.__report_lock:
+            with open(path, "a") as f:
+                f.write(json.dumps(measurement.to_dict()) + "\n")
+
+    @classmethod
+    def __default_timeout(cls):
+        timeout = os.environ.get(cls.PROCESS_TIMEOUT)
+        return float(timeout) if timeout else None
+
+    @classmethod
+    def gradlew(cls):
+        """
+        :returns the gradle wrapper command to run gradle tasks with, with --no-daemon when PROCESS_REPORT_PATH is set.
+        """
+        return "./gradlew --no-daemon" if os.environ.get(cls.PROCESS_REPORT_PATH) else "./gradlew"
+
+    @classmethod
+    def run(cls, command, cwd=None, timeout=None, check=True, **kwargs):
+        """
+        Run a command to completion.
+        :param check: Raise subprocess.CalledProcessError if the command exits with a non-zero code.
+        :param kwargs: Passed to subprocess.Popen, streams opened with subprocess.PIPE are read into the result.
+        :returns a tuple containing the exit code, and the output of stdout and stderr.
+        """
+        runner = cls(command, cwd, timeout, **kwargs)
+        try:
+            (stdout, stderr) = runner.communicate()
+        except BaseException:
+            # e.g. KeyboardInterrupt, the command runs in its own process group and would not see it
+            runner.kill()
+            raise
+        if check and runner.returncode != 0:
+            raise subprocess.CalledProcessError(runner.returncode, command, stdout, stderr)
+        return (runner.returncode, stdout, stderr)
+
+    @classmethod
+    def call(cls, command, cwd=None, timeout=None, **kwargs):
+        """
+        Run a command, like subprocess.check_call.
+        """
+        return cls.run(command, cwd, timeout, **kwargs)[0]
+
+    @classmethod
+    def output(cls, command, cwd=None, timeout=None, **kwargs):
+        """
+        Run a command and return its stdout as text, like subprocess.check_output.
+        """
+        return cls.run(command, cwd, timeout, stdout=subprocess.PIPE, text=True, **kwargs)[1]
@@ -11,7 +11,7 @@ import logging
 import os
 
 from paths.script_finder import ScriptFinder
-from system.execute import execute
+from system.execute import execute_streaming
 from test_workflow.test_component import TestComponent
 
 
@@ -32,7 +32,7 @@ class BwcTestSuite:
             component_name, work_dir
         )
         cmd = f"{script}"
-        (status, stdout, stderr) = execute(cmd, work_dir, True, False)
+        (status, stdout, stderr) = execute_streaming(cmd, work_dir, os.path.join(work_dir, "bwc-test-output"), False)
         return (status, stdout, stderr)
 
     def component_bwc_tests(self, component):
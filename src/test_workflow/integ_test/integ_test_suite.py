@@ -11,7 +11,7 @@ import os
 from git.git_repository import GitRepository
 from paths.script_finder import ScriptFinder
 from paths.tree_walker import walk
-from system.execute import execute
+from system.execute import execute_streaming
 from test_workflow.dependency_installer import DependencyInstaller
 from test_workflow.integ_test.local_test_cluster import LocalTestCluster
 from test_workflow.test_recorder.test_result_data import TestResultData
@@ -125,18 +125,19 @@ class IntegTestSuite:
                 if self.test_config.working_directory is not None
                 else self.repo.dir
             )
-            (status, stdout, stderr) = execute(cmd, work_dir, True, False)
+            output_dir = os.path.join(self.work_dir, "integ-test-output", self.component.name, test_config)
+            (status, stdout, stderr) = execute_streaming(cmd, work_dir, output_dir, False)
             results_dir = os.path.join(
                 work_dir, "build", "reports", "tests", "integTest"
             )
             test_result_data = TestResultData(self.component.name, test_config, status, stdout, stderr,
                                               walk(results_dir))
             self.save_logs.save_test_result_data(test_result_data)
-            if stderr:
+            if stderr.tail:
                 logging.info(
                     "Integration test run failed for component " + self.component.name
                 )
-                logging.info(stderr)
+                logging.info(stderr.tail)
             return status
         else:
             logging.info(
@@ -7,15 +7,18 @@
 import logging
 import os
 import subprocess
+import threading
 import time
+from typing import List
 
-import psutil  # type: ignore
 import requests
 import yaml
 
 from aws.s3_bucket import S3Bucket
 from manifests.bundle_manifest import BundleManifest
 from paths.tree_walker import walk
+from system.execute import StreamedOutput
+from system.process_runner import ProcessRunner
 from test_workflow.test_cluster import ClusterCreationException, TestCluster
 from test_workflow.test_recorder.test_recorder import TestRecorder
 from test_workflow.test_recorder.test_result_data import TestResultData
@@ -39,25 +42,36 @@ class LocalTestCluster(TestCluster):
         self.bucket_name = s3_bucket_name
         self.additional_cluster_config = additional_cluster_config
         self.process = None
+        self.readers: List[threading.Thread] = []
         self.save_logs = test_recorder.local_cluster_logs
 
     def create_cluster(self):
         self.download()
-        self.stdout = open("stdout.txt", "w")
-        self.stderr = open("stderr.txt", "w")
+        # streamed to rotating files and recorded from there, like the output of the test scripts, never read into memory
+        self.stdout = StreamedOutput(os.path.join(self.work_dir, "stdout.txt"))
+        self.stderr = StreamedOutput(os.path.join(self.work_dir, "stderr.txt"))
         self.install_dir = f"opensearch-{self.manifest.build.version}"
         if not self.security_enabled:
             self.disable_security(self.install_dir)
         if self.additional_cluster_config is not None:
             self.__add_plugin_specific_config(self.additional_cluster_config,
                                               os.path.join(self.install_dir, "config", "opensearch.yml"))
-        self.process = subprocess.Popen(
+        # the cluster outlives the commands run against it, it is stopped by terminate_process and never times out
+        self.process = ProcessRunner(
             "./opensearch-tar-install.sh",
-            cwd=self.install_dir,
-            shell=True,
-            stdout=self.stdout,
-            stderr=self.stderr,
+            self.install_dir,
+            0,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
         )
+        self.readers = [
+            threading.Thread(target=self.stdout.consume, args=(self.process.process.stdout,), daemon=True),
+            threading.Thread(target=self.stderr.consume, args=(self.process.process.stderr,), daemon=True),
+        ]
+        for reader in self.readers:
+            reader.start()
         logging.info(f"Started OpenSearch with parent PID {self.process.pid}")
         self.wait_for_service()
 
@@ -93,14 +107,11 @@ class LocalTestCluster(TestCluster):
         bundle_name = self.__download_tarball_from_s3()
         logging.info(f'Downloaded bundle to {os.path.realpath(bundle_name)}')
         logging.info("Unpacking")
-        subprocess.check_call(f"tar -xzf {bundle_name}", shell=True)
+        ProcessRunner.call(f"tar -xzf {bundle_name}")
         logging.info("Unpacked")
 
     def disable_security(self, dir):
-        subprocess.check_call(
-            f'echo "plugins.security.disabled: true" >> {os.path.join(dir, "config", "opensearch.yml")}',
-            shell=True,
-        )
+        ProcessRunner.call(f'echo "plugins.security.disabled: true" >> {os.path.join(dir, "config", "opensearch.yml")}')
 
     def __add_plugin_specific_config(self, additional_config: dict, file):
         with open(file, "a") as yamlfile:
@@ -124,35 +135,17 @@ class LocalTestCluster(TestCluster):
         raise ClusterCreationException("Cluster is not available after 10 attempts")
 
     def terminate_process(self):
-        parent = psutil.Process(self.process.pid)
-        logging.debug("Checking for child processes")
-        child_processes = parent.children(recursive=True)
-        for child in child_processes:
-            logging.debug(f"Found child process with pid {child.pid}")
-            if child.pid != self.process.pid:
-                logging.debug(f"Sending SIGKILL to {child.pid} ")
-                child.kill()
-        logging.info(f"Sending SIGTERM to PID {self.process.pid}")
-        self.process.terminate()
+        # OpenSearch and the script that started it are in the same process group, which gets SIGTERM, then SIGKILL after 10 seconds
         try:
-            logging.info("Waiting for process to terminate")
-            self.process.wait(10)
-        except subprocess.TimeoutExpired:
-            logging.info("Process did not terminate after 10 seconds. Sending SIGKILL")
-            self.process.kill()
-            try:
-                logging.info("Waiting for process to terminate")
-                self.process.wait(10)
-            except subprocess.TimeoutExpired:
-                logging.info("Process failed to terminate even after SIGKILL")
-                raise
+            self.process.terminate(10)
         finally:
             logging.info(f"Process terminated with exit code {self.process.returncode}")
-            with open(os.path.join(os.path.realpath(self.work_dir), self.stdout.name), "r") as stdout:
-                self.local_cluster_stdout = stdout.read()
-            with open(os.path.join(os.path.realpath(self.work_dir), self.stderr.name), "r") as stderr:
-                self.local_cluster_stderr = stderr.read()
-            self.return_code = self.process.returncode
+            # the pipes are closed once the process group has exited, which may not have happened if terminating it failed
+            for reader in self.readers:
+                reader.join(ProcessRunner.KILL_TIMEOUT)
             self.stdout.close()
             self.stderr.close()
+            self.local_cluster_stdout = self.stdout
+            self.local_cluster_stderr = self.stderr
+            self.return_code = self.process.returncode
             self.process = None
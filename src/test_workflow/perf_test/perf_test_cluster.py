@@ -1,8 +1,8 @@
 import json
 import logging
 import os
-import subprocess
 
+from system.process_runner import ProcessRunner
 from test_workflow.test_cluster import TestCluster
 
 
@@ -42,7 +42,7 @@ class PerfTestCluster(TestCluster):
         os.chdir(self.work_dir)
         command = f'cdk deploy {self.params} --outputs-file {self.output_file}'
         logging.info(f'Executing "{command}" in {os.getcwd()}')
-        subprocess.check_call(command, cwd=os.getcwd(), shell=True)
+        ProcessRunner.call(command, os.getcwd())
         with open(self.output_file, 'r') as read_file:
             load_output = json.load(read_file)
         self.ip_address = load_output[self.stack_name]['PrivateIp']
@@ -60,4 +60,4 @@ class PerfTestCluster(TestCluster):
         os.chdir(os.path.join(self.current_workspace, self.work_dir))
         command = f'cdk destroy {self.params} --force'
         logging.info(f'Executing "{command}" in {os.getcwd()}')
-        subprocess.check_call(command, cwd=os.getcwd(), shell=True)
+        ProcessRunner.call(command, os.getcwd())
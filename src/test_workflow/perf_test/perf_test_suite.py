@@ -1,6 +1,6 @@
 import os
-import subprocess
 
+from system.process_runner import ProcessRunner
 from system.working_directory import WorkingDirectory
 
 
@@ -22,12 +22,12 @@ class PerfTestSuite:
         try:
             with WorkingDirectory(self.work_dir):
                 dir = os.getcwd()
-                subprocess.check_call('python3 -m pipenv install', cwd=dir, shell=True)
-                subprocess.check_call('pipenv install', cwd=dir, shell=True)
+                ProcessRunner.call('python3 -m pipenv install', dir)
+                ProcessRunner.call('pipenv install', dir)
 
                 if self.security:
-                    subprocess.check_call(f'{self.command} -s', cwd=dir, shell=True)
+                    ProcessRunner.call(f'{self.command} -s', dir)
                 else:
-                    subprocess.check_call(f'{self.command}', cwd=dir, shell=True)
+                    ProcessRunner.call(f'{self.command}', dir)
         finally:
             os.chdir(self.current_workspace)
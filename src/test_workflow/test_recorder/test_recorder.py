@@ -34,10 +34,27 @@ class TestRecorder:
         return os.path.realpath(dest_directory)
 
     def _generate_std_files(self, stdout, stderr, output_path):
-        with open(os.path.join(output_path, "stdout.txt"), "w") as stdout_file:
-            stdout_file.write(stdout)
-        with open(os.path.join(output_path, "stderr.txt"), "w") as stderr_file:
-            stderr_file.write(stderr)
+        self.__write_std_file(stdout, os.path.join(output_path, "stdout.txt"))
+        self.__write_std_file(stderr, os.path.join(output_path, "stderr.txt"))
+
+    @staticmethod
+    def __write_std_file(output, path):
+        if isinstance(output, str):
+            with open(path, "w") as std_file:
+                std_file.write(output)
+            return
+        # a StreamedOutput, its finished files are hard-linked rather than written again, keeping the rotation suffixes
+        for part in output.paths:
+            dest = path + part[len(output.path):]
+            if os.path.lexists(dest):
+                if os.path.samefile(part, dest):
+                    continue
+                os.remove(dest)
+            try:
+                os.link(part, dest)
+            except OSError:
+                # e.g. on another file system
+                shutil.move(part, dest)
 
     def _generate_yml(self, test_result_data: TestResultData, output_path):
         outcome = {
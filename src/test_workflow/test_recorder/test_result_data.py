@@ -5,7 +5,9 @@
 # compatible open source license.
 
 from dataclasses import dataclass
-from typing import Iterator
+from typing import Iterator, Union
+
+from system.execute import StreamedOutput
 
 
 @dataclass
@@ -16,13 +18,13 @@ class TestResultData:
     component_name: Name of the component that is being tested.
     component_test_config: component_config under consideration for test eg: with/without-security.
     exit_code: An exit code in the form of an integer
-    stdout: A string containing the stdout stream from the test process.
-    stderr: A string containing the stderr stream from the test process.
+    stdout: A string, or a StreamedOutput on disk, containing the stdout stream from the test process.
+    stderr: A string, or a StreamedOutput on disk, containing the stderr stream from the test process.
     log_files: A generator that yields tuples containing test cluster log files, in the form (absolute_path, relative_path).
     """
     component_name: str
     component_test_config: str
     exit_code: int
-    stdout: str
-    stderr: str
+    stdout: Union[str, StreamedOutput]
+    stderr: Union[str, StreamedOutput]
     log_files: Iterator[str]
@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from aws.assumed_role_session import AssumedRoleSession
+
+
+class TestAssumedRoleSession(unittest.TestCase):
+    def setUp(self):
+        AssumedRoleSession.clear()
+
+    def tearDown(self):
+        AssumedRoleSession.clear()
+
+    def __credentials(self, key, expires_in):
+        return {
+            "Credentials": {
+                "AccessKeyId": key,
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.now(timezone.utc) + expires_in,
+            }
+        }
+
+    @patch("boto3.client")
+    def test_get_assumes_role_once(self, mock_boto_client):
+        mock_boto_client.return_value.assume_role.return_value = self.__credentials("key", timedelta(hours=1))
+
+        session = AssumedRoleSession.get("role", "session")
+        self.assertIs(AssumedRoleSession.get("role", "session"), session)
+        self.assertIsNot(AssumedRoleSession.get("other-role", "session"), session)
+
+        self.assertEqual(mock_boto_client.return_value.assume_role.call_count, 2)
+        mock_boto_client.return_value.assume_role.assert_any_call(
+            RoleArn="role", RoleSessionName="session", DurationSeconds=3600
+        )
+
+    @patch("boto3.client")
+    def test_credentials_refresh_before_expiry(self, mock_boto_client):
+        mock_boto_client.return_value.assume_role.side_effect = [
+            self.__credentials("expiring", timedelta(minutes=2)),
+            self.__credentials("refreshed", timedelta(hours=1)),
+        ]
+
+        session = AssumedRoleSession.get("role", "session")
+        credentials = session.session.get_credentials().get_frozen_credentials()
+
+        self.assertEqual(credentials.access_key, "refreshed")
+        self.assertEqual(mock_boto_client.return_value.assume_role.call_count, 2)
+
+    @patch("boto3.client")
+    def test_client_is_shared(self, mock_boto_client):
+        mock_boto_client.return_value.assume_role.return_value = self.__credentials("key", timedelta(hours=1))
+        session = AssumedRoleSession.get("role", "session")
+
+        with patch.object(session.session, "client", side_effect=lambda *args, **kwargs: MagicMock()) as mock_client:
+            client = session.client("s3", max_pool_connections=16)
+            self.assertIs(session.client("s3", max_pool_connections=16), client)
+            self.assertIsNot(session.client("s3", max_pool_connections=4), client)
+
+        self.assertEqual(mock_client.call_count, 2)
+        self.assertEqual(mock_client.call_args_list[0][1]["config"].max_pool_connections, 16)
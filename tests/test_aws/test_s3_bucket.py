@@ -4,40 +4,47 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import hashlib
+import io
+import os
+import tempfile
 import unittest
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
+import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
 
-from aws.s3_bucket import S3Bucket, S3DownloadError, STSError
+from aws.assumed_role_session import AssumedRoleSession
+from aws.s3_bucket import S3Bucket, S3DownloadError, S3UploadError, STSError
+from aws.s3_cache import S3Cache
 
 mock_sts = MagicMock()
-mock_s3_resource = MagicMock()
 mock_s3_client = MagicMock()
 bucket_name = "unitTestBucket"
 
 
 class MockS3Response:
-    class ObjectSummary:
-        def __init__(self, bucket_name, key):
-            self.bucket_name = bucket_name
-            self.key = key
-
     @staticmethod
-    def mock_list_objects_response(*args, **kwargs):
-        response = [
-            MockS3Response.ObjectSummary(bucket_name, "tests/"),
-            MockS3Response.ObjectSummary(bucket_name, "tests/1.1.0/"),
-            MockS3Response.ObjectSummary(bucket_name, "tests/1.1.0/x64/"),
-            MockS3Response.ObjectSummary(
-                bucket_name, "tests/1.1.0/x64/opensearch-1.1.0-linux-x64.tar.gz"
-            ),
-            MockS3Response.ObjectSummary(
-                bucket_name, "maven/org/opensearch/xyz-1.1.0.tar.gz"
-            ),
+    def list_objects_v2_pages():
+        return [
+            {
+                "Contents": [
+                    {"Key": "tests/"},
+                    {"Key": "tests/1.1.0/"},
+                    {"Key": "tests/1.1.0/x64/"},
+                    {"Key": "tests/1.1.0/x64/opensearch-1.1.0-linux-x64.tar.gz"},
+                ]
+            },
+            {
+                "Contents": [
+                    {"Key": "maven/org/opensearch/xyz-1.1.0.tar.gz"},
+                ]
+            },
+            {},
         ]
-        mock_s3_resource.Bucket(bucket_name).objects.filter.return_value = response
-        return mock_s3_resource
 
 
 class MockSTSResponse:
@@ -70,7 +77,12 @@ class MockSTSResponse:
 
 class TestS3Bucket(unittest.TestCase):
     def setUp(self):
-        pass
+        AssumedRoleSession.clear()
+        # clients of the assumed role session are created with the (mocked) boto3.client
+        session_patcher = patch("boto3.Session")
+        mock_session = session_patcher.start()
+        mock_session.return_value.client.side_effect = lambda *args, **kwargs: boto3.client(*args, **kwargs)
+        self.addCleanup(session_patcher.stop)
 
     def get_mock_boto_client(*args, **kwargs):
         mock_sts.reset_mock()
@@ -80,32 +92,34 @@ class TestS3Bucket(unittest.TestCase):
         else:
             return mock_s3_client
 
-    @patch("boto3.resource")
     @patch("boto3.client", side_effect=get_mock_boto_client)
-    def test_s3_bucket_obj(self, mock_boto_client, mock_boto_resource):
+    def test_s3_bucket_obj(self, mock_boto_client):
         expected_sts_response = MockSTSResponse.successful_response()
         mock_sts.assume_role.return_value = expected_sts_response
         S3Bucket(bucket_name)
         calls = [
             call("sts"),
-            call(
-                "s3",
-                aws_access_key_id=expected_sts_response["Credentials"]["AccessKeyId"],
-                aws_secret_access_key=expected_sts_response["Credentials"][
-                    "SecretAccessKey"
-                ],
-                aws_session_token=expected_sts_response["Credentials"]["SessionToken"],
-            ),
+            call("s3", config=ANY),
         ]
         mock_boto_client.assert_has_calls(calls)
-        mock_boto_resource.assert_called_once_with(
-            "s3",
-            aws_access_key_id=expected_sts_response["Credentials"]["AccessKeyId"],
-            aws_secret_access_key=expected_sts_response["Credentials"][
-                "SecretAccessKey"
-            ],
-            aws_session_token=expected_sts_response["Credentials"]["SessionToken"],
+        self.assertEqual(
+            mock_boto_client.call_args[1]["config"].max_pool_connections, S3Bucket.PARALLEL
+        )
+
+    @patch.dict(os.environ, {"AWS_ROLE_ARN": "arn:aws:iam::123456789012:role/opensearch-test", "AWS_ROLE_SESSION_NAME": "dummy-session"})
+    @patch("boto3.client")
+    def test_s3_bucket_obj_reuses_session(self, mock_boto_client):
+        mock_boto_client("sts").assume_role.return_value = MockSTSResponse.successful_response()
+        mock_boto_client.reset_mock()
+        S3Bucket(bucket_name)
+        S3Bucket("otherBucket")
+        mock_boto_client.return_value.assume_role.assert_called_once_with(
+            RoleArn="arn:aws:iam::123456789012:role/opensearch-test",
+            RoleSessionName="dummy-session",
+            DurationSeconds=3600,
         )
+        # one sts client to assume the role, and one s3 client shared by both buckets
+        self.assertEqual(mock_boto_client.call_args_list, [call("sts"), call("s3", config=ANY)])
 
     @patch("boto3.client")
     def test_s3_bucket_obj_sts_error(self, mock_boto_client):
@@ -133,57 +147,209 @@ class TestS3Bucket(unittest.TestCase):
             "tests/1.1.0/x64/opensearch-1.1.0-linux-x64.tar.gz",
         )
 
+    @patch("pathlib.Path.mkdir")
     @patch("boto3.client")
-    @patch("boto3.resource", side_effect=MockS3Response.mock_list_objects_response)
-    def test_download_folder(self, mock_boto_resource, mock_boto_client):
+    def test_download_folder(self, mock_boto_client, mock_mkdir):
         expected_sts_response = MockSTSResponse.successful_response()
         mock_boto_client("sts").assume_role.return_value = expected_sts_response
+        mock_boto_client("s3").get_paginator.return_value.paginate.return_value = MockS3Response.list_objects_v2_pages()
         folder_path = "/"
         s3bucket = S3Bucket(bucket_name)
         s3bucket.download_folder(folder_path, "/tmp")
+        mock_boto_client("s3").get_paginator.assert_called_with("list_objects_v2")
+        mock_boto_client("s3").get_paginator.return_value.paginate.assert_called_with(
+            Bucket=bucket_name, Prefix=""
+        )
         calls = [
             call(
+                bucket_name,
                 "tests/1.1.0/x64/opensearch-1.1.0-linux-x64.tar.gz",
                 "/tmp/tests/1.1.0/x64/opensearch-1.1.0-linux-x64.tar.gz",
+                Config=S3Bucket.FOLDER_TRANSFER_CONFIG,
             ),
             call(
+                bucket_name,
                 "maven/org/opensearch/xyz-1.1.0.tar.gz",
                 "/tmp/maven/org/opensearch/xyz-1.1.0.tar.gz",
+                Config=S3Bucket.FOLDER_TRANSFER_CONFIG,
             ),
         ]
-        mock_s3_resource.Bucket(bucket_name).download_file.assert_has_calls(calls)
-        self.assertTrue(
-            mock_s3_resource.Bucket(bucket_name).download_file.call_count, 2
+        mock_boto_client("s3").download_file.assert_has_calls(calls, any_order=True)
+        self.assertEqual(mock_boto_client("s3").download_file.call_count, 2)
+
+    @patch("pathlib.Path.mkdir")
+    @patch("boto3.client")
+    def test_download_folder_failure(self, mock_boto_client, mock_mkdir):
+        mock_boto_client("sts").assume_role.return_value = MockSTSResponse.successful_response()
+        mock_boto_client("s3").get_paginator.return_value.paginate.return_value = MockS3Response.list_objects_v2_pages()
+        mock_boto_client("s3").download_file.side_effect = ClientError(
+            error_response={"Error": {"Code": "403"}}, operation_name="GetObject"
         )
+        s3bucket = S3Bucket(bucket_name)
+        with self.assertRaises(S3DownloadError):
+            s3bucket.download_folder("/", "/tmp")
 
     @patch("boto3.client")
-    @patch("boto3.resource", side_effect=MockS3Response.mock_list_objects_response)
-    def test_download_file(self, mock_boto_resource, mock_boto_client):
+    def test_download_file(self, mock_boto_client):
         expected_sts_response = MockSTSResponse.successful_response()
         mock_boto_client("sts").assume_role.return_value = expected_sts_response
         file_path = "tests/1.1.0/x64/opensearch-1.1.0-linux-x64.tar.gz"
         s3bucket = S3Bucket(bucket_name)
         s3bucket.download_file(file_path, "/tmp")
-        calls = [
-            call(file_path, "/tmp/opensearch-1.1.0-linux-x64.tar.gz"),
-        ]
-        mock_s3_resource.Bucket(bucket_name).download_file.assert_has_calls(calls)
-        self.assertTrue(
-            mock_s3_resource.Bucket(bucket_name).download_file.call_count, 1
+        mock_boto_client("s3").download_file.assert_called_once_with(
+            bucket_name, file_path, "/tmp/opensearch-1.1.0-linux-x64.tar.gz", Config=None
         )
 
     @patch("boto3.client")
-    @patch("boto3.resource")
-    def test_download_file_failure(self, mock_boto_resource, mock_boto_client):
+    def test_download_file_failure(self, mock_boto_client):
         mock_boto_client(
             "sts"
         ).assume_role.return_value = MockSTSResponse.successful_response()
         file_path = "tests/1.1.0/x64/opensearch-1.1.0-linux-x64.tar.gz"
-        mock_boto_resource("s3").Bucket(
-            bucket_name
-        ).download_file.side_effect = ClientError(
+        mock_boto_client("s3").download_file.side_effect = ClientError(
             error_response={"Error": {"Code": "403"}}, operation_name="GetObject"
         )
         s3bucket = S3Bucket(bucket_name)
         with self.assertRaises(S3DownloadError):
             s3bucket.download_file(file_path, "/tmp")
+
+    def __stubbed_s3_bucket(self, cache_dir):
+        # a real boto3 client, so that requests and transfer arguments are validated, with stubbed responses
+        s3_client = boto3.session.Session().client(
+            "s3", region_name="us-east-1", aws_access_key_id="key", aws_secret_access_key="secret"
+        )
+        with patch.object(AssumedRoleSession, "get") as mock_session:
+            mock_session.return_value.client.return_value = s3_client
+            s3bucket = S3Bucket(bucket_name, cache=S3Cache(cache_dir))
+        return (s3bucket, Stubber(s3_client))
+
+    def __add_get_object(self, stubber, key, etag, contents):
+        stubber.add_response(
+            "get_object",
+            {"Body": StreamingBody(io.BytesIO(contents), len(contents)), "ETag": etag},
+            {"Bucket": bucket_name, "Key": key, "IfMatch": etag},
+        )
+
+    def test_download_file_cached(self):
+        file_path = "tests/1.1.0/x64/opensearch-1.1.0-linux-x64.tar.gz"
+        with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as dest:
+            (s3bucket, stubber) = self.__stubbed_s3_bucket(cache_dir)
+            stubber.add_response("head_object", {"ETag": '"etag"'}, {"Bucket": bucket_name, "Key": file_path})
+            self.__add_get_object(stubber, file_path, '"etag"', b"tarball")
+            # validated again, then used from the cache
+            stubber.add_response("head_object", {"ETag": '"etag"'}, {"Bucket": bucket_name, "Key": file_path})
+            with stubber:
+                s3bucket.download_file(file_path, dest)
+                s3bucket.download_file(file_path, dest)
+                stubber.assert_no_pending_responses()
+            with open(os.path.join(dest, "opensearch-1.1.0-linux-x64.tar.gz")) as f:
+                self.assertEqual(f.read(), "tarball")
+
+    def test_download_file_cached_changed(self):
+        file_path = "tests/1.1.0/x64/opensearch-1.1.0-linux-x64.tar.gz"
+        with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as dest:
+            (s3bucket, stubber) = self.__stubbed_s3_bucket(cache_dir)
+            stubber.add_response("head_object", {"ETag": '"etag"'}, {"Bucket": bucket_name, "Key": file_path})
+            # the object changed between head_object and get_object
+            stubber.add_client_error(
+                "get_object",
+                service_error_code="PreconditionFailed",
+                http_status_code=412,
+                expected_params={"Bucket": bucket_name, "Key": file_path, "IfMatch": '"etag"'},
+            )
+            with stubber, self.assertRaises(S3DownloadError):
+                s3bucket.download_file(file_path, dest)
+            self.assertEqual(os.listdir(dest), [])
+            self.assertEqual(s3bucket.cache.get(bucket_name, file_path, '"etag"'), None)
+
+    def test_download_file_cached_immutable(self):
+        file_path = "builds/1.1.0/1234/x64/manifest.yml"
+        with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as dest:
+            (s3bucket, stubber) = self.__stubbed_s3_bucket(cache_dir)
+            # validated once, when first downloaded
+            stubber.add_response("head_object", {"ETag": '"etag"'}, {"Bucket": bucket_name, "Key": file_path})
+            self.__add_get_object(stubber, file_path, '"etag"', b"manifest")
+            with stubber:
+                s3bucket.download_file(file_path, dest)
+                s3bucket.download_file(file_path, dest)
+                stubber.assert_no_pending_responses()
+
+    @patch.dict(os.environ, {"S3_CACHE_PATH": "cache", "S3_CACHE_SIZE": "1024"})
+    @patch("os.makedirs")
+    @patch("boto3.client")
+    def test_s3_bucket_cache_from_environment(self, mock_boto_client, *mocks):
+        mock_boto_client("sts").assume_role.return_value = MockSTSResponse.successful_response()
+        s3bucket = S3Bucket(bucket_name)
+        self.assertEqual(s3bucket.cache.path, "cache")
+        self.assertEqual(s3bucket.cache.max_size, 1024)
+
+    @patch("boto3.client")
+    def test_upload_folder(self, mock_boto_client):
+        mock_boto_client("sts").assume_role.return_value = MockSTSResponse.successful_response()
+        with tempfile.TemporaryDirectory() as source:
+            os.makedirs(os.path.join(source, "maven", "org"))
+            for name, contents in [("unchanged.jar", b"unchanged"), ("changed.jar", b"changed"), ("new.jar", b"new")]:
+                with open(os.path.join(source, "maven", "org", name), "wb") as f:
+                    f.write(contents)
+            mock_boto_client("s3").get_paginator.return_value.paginate.return_value = [
+                {
+                    "Contents": [
+                        {"Key": "builds/maven/org/unchanged.jar", "Size": 9, "ETag": f'"{hashlib.md5(b"unchanged").hexdigest()}"'},
+                        {"Key": "builds/maven/org/changed.jar", "Size": 7, "ETag": f'"{hashlib.md5(b"CHANGED").hexdigest()}"'},
+                    ]
+                }
+            ]
+
+            s3bucket = S3Bucket(bucket_name)
+            uploaded = s3bucket.upload_folder(source, "/builds/")
+
+            self.assertEqual(sorted(uploaded), ["builds/maven/org/changed.jar", "builds/maven/org/new.jar"])
+            mock_boto_client("s3").get_paginator.return_value.paginate.assert_called_with(Bucket=bucket_name, Prefix="builds")
+            mock_boto_client("s3").upload_file.assert_has_calls(
+                [
+                    call(
+                        os.path.join(source, "maven", "org", "changed.jar"),
+                        bucket_name,
+                        "builds/maven/org/changed.jar",
+                        Config=S3Bucket.UPLOAD_TRANSFER_CONFIG,
+                    ),
+                    call(
+                        os.path.join(source, "maven", "org", "new.jar"),
+                        bucket_name,
+                        "builds/maven/org/new.jar",
+                        Config=S3Bucket.UPLOAD_TRANSFER_CONFIG,
+                    ),
+                ],
+                any_order=True,
+            )
+            self.assertEqual(mock_boto_client("s3").upload_file.call_count, 2)
+
+    @patch("boto3.client")
+    def test_upload_folder_multipart_etag(self, mock_boto_client):
+        mock_boto_client("sts").assume_role.return_value = MockSTSResponse.successful_response()
+        transfer_config = TransferConfig(multipart_threshold=4, multipart_chunksize=4)
+        with tempfile.TemporaryDirectory() as source:
+            with open(os.path.join(source, "bundle.tar.gz"), "wb") as f:
+                f.write(b"0123456789")
+            parts = [hashlib.md5(b"0123").digest(), hashlib.md5(b"4567").digest(), hashlib.md5(b"89").digest()]
+            mock_boto_client("s3").get_paginator.return_value.paginate.return_value = [
+                {"Contents": [{"Key": "bundle.tar.gz", "Size": 10, "ETag": f'"{hashlib.md5(b"".join(parts)).hexdigest()}-3"'}]}
+            ]
+
+            s3bucket = S3Bucket(bucket_name)
+            self.assertEqual(s3bucket.upload_folder(source, "", transfer_config), [])
+            mock_boto_client("s3").upload_file.assert_not_called()
+
+    @patch("boto3.client")
+    def test_upload_folder_failure(self, mock_boto_client):
+        mock_boto_client("sts").assume_role.return_value = MockSTSResponse.successful_response()
+        mock_boto_client("s3").get_paginator.return_value.paginate.return_value = [{}]
+        mock_boto_client("s3").upload_file.side_effect = ClientError(
+            error_response={"Error": {"Code": "403"}}, operation_name="PutObject"
+        )
+        with tempfile.TemporaryDirectory() as source:
+            with open(os.path.join(source, "file.jar"), "w") as f:
+                f.write("jar")
+            s3bucket = S3Bucket(bucket_name)
+            with self.assertRaises(S3UploadError):
+                s3bucket.upload_folder(source, "maven")
@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from aws.s3_cache import S3Cache
+
+
+class TestS3Cache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = S3Cache(self.temp_dir.name, max_size=10)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def __put(self, key, etag, data):
+        def download(path):
+            with open(path, "w") as f:
+                f.write(data)
+
+        return self.cache.put("bucket", key, etag, download)
+
+    def __read(self, path):
+        with open(path) as f:
+            return f.read()
+
+    def test_is_immutable(self):
+        self.assertTrue(S3Cache.is_immutable("builds/1.1.0/1234/x64/manifest.yml"))
+        self.assertFalse(S3Cache.is_immutable("builds/1.1.0/manifest.yml"))
+        self.assertFalse(S3Cache.is_immutable("tests/1.1.0/x64/opensearch-1.1.0-linux-x64.tar.gz"))
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get("bucket", "key", '"etag"'))
+        self.assertIsNone(self.cache.get("bucket", "key"))
+
+    def test_put_and_get(self):
+        path = self.__put("key", '"etag"', "data")
+        self.assertEqual(self.cache.get("bucket", "key", '"etag"'), path)
+        self.assertEqual(self.cache.get("bucket", "key"), path)
+        self.assertEqual(self.__read(path), "data")
+        self.assertEqual(os.path.basename(path), "etag")
+
+    def test_get_other_etag(self):
+        self.__put("key", '"etag"', "data")
+        self.assertIsNone(self.cache.get("bucket", "key", '"other"'))
+        self.assertIsNone(self.cache.get("other-bucket", "key", '"etag"'))
+
+    def test_put_replaces_previous_version(self):
+        self.__put("key", '"etag1"', "data1")
+        path = self.__put("key", '"etag2"', "data2")
+        self.assertIsNone(self.cache.get("bucket", "key", '"etag1"'))
+        self.assertEqual(self.cache.get("bucket", "key"), path)
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["etag2"])
+
+    def test_put_previous_version_already_removed(self):
+        path1 = self.__put("key", '"etag1"', "data1")
+        remove = os.remove
+
+        def remove_twice(path):
+            # another agent sharing the cache removed it first
+            remove(path)
+            remove(path)
+
+        with patch("os.remove", side_effect=remove_twice):
+            path2 = self.__put("key", '"etag2"', "data2")
+        self.assertFalse(os.path.exists(path1))
+        self.assertEqual(self.cache.get("bucket", "key"), path2)
+
+    def test_put_failure(self):
+        def download(path):
+            raise ValueError("download failed")
+
+        with self.assertRaises(ValueError):
+            self.cache.put("bucket", "key", '"etag"', download)
+
+        self.assertIsNone(self.cache.get("bucket", "key"))
+
+    def test_evict_least_recently_used(self):
+        path1 = self.__put("key1", '"etag"', "12345")
+        path2 = self.__put("key2", '"etag"', "12345")
+        path3 = self.__put("key3", '"etag"', "12345")
+        os.utime(path1, (1, 1))
+        os.utime(path2, (3, 3))
+        os.utime(path3, (2, 2))
+
+        self.cache.evict()
+
+        self.assertFalse(os.path.exists(path1))
+        self.assertTrue(os.path.exists(path2))
+        self.assertTrue(os.path.exists(path3))
+
+    def test_evict_removed_concurrently(self):
+        path1 = self.__put("key1", '"etag"', "12345")
+        path2 = self.__put("key2", '"etag"', "123456")
+        os.utime(path1, (1, 1))
+        stat = os.stat
+
+        def stat_removed(path, *args, **kwargs):
+            # another agent replaced key1 after it was listed
+            if path == path1:
+                raise FileNotFoundError(path)
+            return stat(path, *args, **kwargs)
+
+        with patch("os.stat", side_effect=stat_removed):
+            self.cache.evict()
+        self.assertTrue(os.path.exists(path2))
+
+    def test_evict_under_max_size(self):
+        path = self.__put("key", '"etag"', "12345")
+        self.cache.evict()
+        self.assertTrue(os.path.exists(path))
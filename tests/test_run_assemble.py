@@ -58,7 +58,7 @@ class TestRunAssemble(unittest.TestCase):
             "path/opensearch-tar-install.sh",
         )
 
-        mock_bundle.build_tar.assert_called_with("curdir/bundle")
+        mock_bundle.build_tar.assert_called_with("curdir/bundle", 9)
 
         mock_recorder.return_value.write_manifest.assert_has_calls(
             [call("path"), call("curdir/bundle")]  # manifest included in tar
@@ -7,7 +7,7 @@
 import os
 import tempfile
 import unittest
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
 
@@ -36,7 +36,7 @@ class TestRunBuild(unittest.TestCase):
     @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST])
     @patch("run_build.Builder", return_value=MagicMock())
     @patch("run_build.BuildRecorder", return_value=MagicMock())
-    @patch("run_build.GitRepository", return_value=MagicMock(working_directory="dummy"))
+    @patch("git.git_repositories.GitRepository", return_value=MagicMock(working_directory="dummy"))
     @patch("run_build.TemporaryDirectory")
     def test_main(self, mock_temp, mock_repo, mock_recorder, mock_builder, *mocks):
         mock_temp.return_value.__enter__.return_value = tempfile.gettempdir()
@@ -51,18 +51,21 @@ class TestRunBuild(unittest.TestCase):
                     "1.1",
                     os.path.join(tempfile.gettempdir(), "OpenSearch"),
                     None,
+                    cache=None,
                 ),
                 call(
                     "https://github.com/opensearch-project/common-utils.git",
                     "1.1",
                     os.path.join(tempfile.gettempdir(), "common-utils"),
                     None,
+                    cache=None,
                 ),
                 call(
                     "https://github.com/opensearch-project/dashboards-reports.git",
                     "1.1",
                     os.path.join(tempfile.gettempdir(), "dashboards-reports"),
                     "reports-scheduler",
+                    cache=None,
                 ),
             ],
             any_order=True,
@@ -73,14 +76,16 @@ class TestRunBuild(unittest.TestCase):
         # each component is built and its artifacts exported
         mock_builder.assert_has_calls(
             [
-                call("OpenSearch", mock_repo.return_value, mock_recorder.return_value),
+                call("OpenSearch", mock_repo.return_value, mock_recorder.return_value, None, set()),
                 call(
-                    "common-utils", mock_repo.return_value, mock_recorder.return_value
+                    "common-utils", mock_repo.return_value, mock_recorder.return_value, None, {"OpenSearch"}
                 ),
                 call(
                     "dashboards-reports",
                     mock_repo.return_value,
                     mock_recorder.return_value,
+                    None,
+                    ANY,
                 ),
             ],
             any_order=True,
@@ -92,3 +97,19 @@ class TestRunBuild(unittest.TestCase):
 
         # the output manifest is written
         mock_recorder.return_value.write_manifest.assert_called()
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "--component", "common-utils"])
+    @patch("run_build.Builder", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("git.git_repositories.GitRepository", return_value=MagicMock(working_directory="dummy"))
+    @patch("run_build.TemporaryDirectory")
+    def test_main_component(self, mock_temp, mock_repo, mock_recorder, mock_builder, *mocks):
+        mock_temp.return_value.__enter__.return_value = tempfile.gettempdir()
+
+        main()
+
+        # OpenSearch is not built, but is still passed as a dependency so that common-utils is not cached
+        mock_builder.assert_called_once_with(
+            "common-utils", mock_repo.return_value, mock_recorder.return_value, None, {"OpenSearch"}
+        )
+        mock_builder.return_value.build.assert_called_once()
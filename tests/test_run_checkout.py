@@ -35,7 +35,7 @@ class TestRunChecout(unittest.TestCase):
 
     @patch("argparse._sys.argv", ["run_checkout.py", OPENSEARCH_MANIFEST])
     @patch(
-        "run_checkout.GitRepository", return_value=MagicMock(working_directory="dummy")
+        "git.git_repositories.GitRepository", return_value=MagicMock(working_directory="dummy")
     )
     @patch("run_checkout.TemporaryDirectory")
     def test_main(self, mock_temp, mock_repo):
@@ -51,18 +51,21 @@ class TestRunChecout(unittest.TestCase):
                     "1.1",
                     os.path.join(tempfile.gettempdir(), "OpenSearch"),
                     None,
+                    cache=None,
                 ),
                 call(
                     "https://github.com/opensearch-project/common-utils.git",
                     "1.1",
                     os.path.join(tempfile.gettempdir(), "common-utils"),
                     None,
+                    cache=None,
                 ),
                 call(
                     "https://github.com/opensearch-project/dashboards-reports.git",
                     "1.1",
                     os.path.join(tempfile.gettempdir(), "dashboards-reports"),
                     "reports-scheduler",
+                    cache=None,
                 ),
             ],
             any_order=True,
@@ -35,7 +35,7 @@ class TestRunCi(unittest.TestCase):
 
     @patch("argparse._sys.argv", ["run_ci.py", OPENSEARCH_MANIFEST])
     @patch("run_ci.Ci", return_value=MagicMock())
-    @patch("run_ci.GitRepository", return_value=MagicMock(working_directory="dummy"))
+    @patch("git.git_repositories.GitRepository", return_value=MagicMock(working_directory="dummy"))
     @patch("run_ci.TemporaryDirectory")
     def test_main(self, mock_temp, mock_repo, mock_ci, *mocks):
         mock_temp.return_value.__enter__.return_value = tempfile.gettempdir()
@@ -50,12 +50,14 @@ class TestRunCi(unittest.TestCase):
                     "1.1",
                     os.path.join(tempfile.gettempdir(), "OpenSearch"),
                     None,
+                    cache=None,
                 ),
                 call(
                     "https://github.com/opensearch-project/common-utils.git",
                     "1.1",
                     os.path.join(tempfile.gettempdir(), "common-utils"),
                     None,
+                    cache=None,
                 ),
             ]
         )
@@ -6,7 +6,7 @@
 
 import os
 import unittest
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -32,25 +32,36 @@ class TestRunSign(unittest.TestCase):
 
     @patch("os.getcwd", return_value="curdir")
     @patch("argparse._sys.argv", ["run_sign.py", BUILD_MANIFEST])
-    @patch("run_sign.Signer", return_value=MagicMock())
-    def test_main(self, mock_signer, *mocks):
+    @patch("run_sign.SignatureState")
+    @patch("run_sign.Signer", return_value=MagicMock(), PARALLEL=8)
+    def test_main(self, mock_signer, mock_state, *mocks):
         main()
 
-        self.assertEqual(mock_signer.return_value.sign_artifacts.call_count, 21)
-        mock_signer.return_value.sign_artifacts.assert_has_calls(
-            [
-                call(
-                    [
-                        "maven/org/opensearch/common-utils/maven-metadata-local.xml",
-                        "maven/org/opensearch/common-utils/1.1.0.0/common-utils-1.1.0.0-javadoc.jar",
-                        "maven/org/opensearch/common-utils/1.1.0.0/common-utils-1.1.0.0-sources.jar",
-                        "maven/org/opensearch/common-utils/1.1.0.0/common-utils-1.1.0.0.pom",
-                        "maven/org/opensearch/common-utils/1.1.0.0/common-utils-1.1.0.0.jar",
-                    ],
-                    self.DATA_PATH,
-                )
-            ]
-        )
-        mock_signer.return_value.sign_artifacts.assert_has_calls(
-            [call(["plugins/opensearch-index-management-1.1.0.0.zip"], self.DATA_PATH)]
+        mock_signer.assert_called_once_with(8, None)
+        mock_state.assert_called_once_with(os.path.join(self.DATA_PATH, "signatures.yml"), reset=False)
+        self.assertEqual(mock_signer.return_value.sign_artifacts.call_count, 1)
+        artifacts, basepath, state = mock_signer.return_value.sign_artifacts.call_args[0]
+        self.assertEqual(basepath, self.DATA_PATH)
+        self.assertEqual(state, mock_state.return_value)
+        for artifact in [
+            "bundle/opensearch-min-1.1.0-linux-x64.tar.gz",
+            "maven/org/opensearch/common-utils/1.1.0.0/common-utils-1.1.0.0.jar",
+            "maven/org/opensearch/common-utils/1.1.0.0/common-utils-1.1.0.0.pom",
+        ]:
+            self.assertIn(artifact, artifacts)
+        self.assertIn("plugins/opensearch-index-management-1.1.0.0.zip", artifacts)
+
+    @patch(
+        "argparse._sys.argv",
+        ["run_sign.py", BUILD_MANIFEST, "--component", "index-management", "--type", "plugins", "--parallel", "2", "--force", "--signer-cache", "cache"],
+    )
+    @patch("run_sign.SignatureState")
+    @patch("run_sign.Signer", return_value=MagicMock(), PARALLEL=8)
+    def test_main_component_type(self, mock_signer, mock_state, *mocks):
+        main()
+
+        mock_signer.assert_called_once_with(2, "cache")
+        mock_state.assert_called_once_with(os.path.join(self.DATA_PATH, "signatures.yml"), reset=True)
+        mock_signer.return_value.sign_artifacts.assert_called_once_with(
+            ["plugins/opensearch-index-management-1.1.0.0.zip"], self.DATA_PATH, mock_state.return_value
         )
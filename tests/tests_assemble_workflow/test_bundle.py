@@ -5,8 +5,10 @@
 # compatible open source license.
 
 import os
+import subprocess
+import tempfile
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from assemble_workflow.bundle import Bundle
 from manifests.build_manifest import BuildManifest
@@ -30,11 +32,35 @@ class TestBundle(unittest.TestCase):
         self.assertEqual(bundle.artifacts_dir, artifacts_path)
         self.assertIsNotNone(bundle.bundle_recorder)
         self.assertEqual(bundle.installed_plugins, [])
-        self.assertTrue(
-            bundle.min_tarball_path.endswith("/opensearch-min-1.1.0-linux-x64.tar.gz")
+        self.assertEqual(
+            bundle.min_tarball_path,
+            os.path.join(artifacts_path, "bundle", "opensearch-min-1.1.0-linux-x64.tar.gz"),
         )
         self.assertIsNotNone(bundle.archive_path)
 
+    def test_bundle_unpacks_with_pigz(self):
+        manifest_path = os.path.join(
+            os.path.dirname(__file__), "data/opensearch-build-1.1.0.yml"
+        )
+        artifacts_path = os.path.join(os.path.dirname(__file__), "data/artifacts")
+        with tempfile.TemporaryDirectory() as bin_dir:
+            pigz = os.path.join(bin_dir, "pigz")
+            with open(pigz, "w") as f:
+                f.write('#!/bin/sh\nexec gzip "$@"\n')
+            os.chmod(pigz, 0o755)
+
+            with patch("shutil.which", return_value=pigz) as mock_which:
+                with patch("subprocess.Popen", wraps=subprocess.Popen) as mock_popen:
+                    bundle = self.DummyBundle(
+                        BuildManifest.from_path(manifest_path), artifacts_path, MagicMock()
+                    )
+                    mock_which.assert_called_with("pigz")
+                    mock_popen.assert_called_with(
+                        [pigz, "-dc", bundle.min_tarball_path], cwd=None, shell=False, start_new_session=True, stdout=subprocess.PIPE
+                    )
+
+        self.assertTrue(os.path.isdir(bundle.archive_path))
+
     def test_bundle_does_not_exist_raises_error(self):
         manifest_path = os.path.join(
             os.path.dirname(__file__), "data/opensearch-build-1.1.0.yml"
@@ -5,12 +5,14 @@
 # compatible open source license.
 
 import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, call, patch
 
 from assemble_workflow.bundle_opensearch import BundleOpenSearch
 from manifests.build_manifest import BuildManifest
 from paths.script_finder import ScriptFinder
+from system.process_runner import ProcessRunner
 
 
 class TestBundleOpenSearch(unittest.TestCase):
@@ -32,8 +34,39 @@ class TestBundleOpenSearch(unittest.TestCase):
         )
         self.assertIsNotNone(bundle.archive_path)
 
+    @patch("os.path.isfile", return_value=True)
+    def test_bundle_install_plugins(self, *mocks):
+        manifest_path = os.path.join(
+            os.path.dirname(__file__), "data/opensearch-build-1.1.0.yml"
+        )
+        bundle = BundleOpenSearch(
+            BuildManifest.from_path(manifest_path),
+            os.path.join(os.path.dirname(__file__), "data/artifacts"),
+            MagicMock(),
+        )
+
+        with patch("shutil.copyfile") as mock_copyfile:
+            with patch.object(ProcessRunner, "call") as mock_check_call:
+                bundle.install_plugins()
+
+                self.assertEqual(mock_copyfile.call_count, 12)
+                # one opensearch-plugin call for all plugins, and one post-install script per plugin
+                self.assertEqual(mock_check_call.call_count, 13)
+
+                install_plugin_bin = os.path.join(bundle.archive_path, "bin/opensearch-plugin")
+                plugin_files = " ".join(
+                    map(lambda plugin: f"file:{os.path.join(bundle.tmp_dir.name, os.path.basename(plugin.artifacts['plugins'][0]))}", bundle.plugins)
+                )
+                self.assertEqual(
+                    mock_check_call.call_args_list[0],
+                    call(
+                        f"{install_plugin_bin} install --batch {plugin_files}",
+                        bundle.archive_path,
+                    ),
+                )
+
     @patch.object(BundleOpenSearch, "install_plugin")
-    def test_bundle_install_plugins(self, mocks_bundle):
+    def test_bundle_install_plugins_none(self, mock_install_plugin):
         manifest_path = os.path.join(
             os.path.dirname(__file__), "data/opensearch-build-1.1.0.yml"
         )
@@ -42,9 +75,12 @@ class TestBundleOpenSearch(unittest.TestCase):
             os.path.join(os.path.dirname(__file__), "data/artifacts"),
             MagicMock(),
         )
+        bundle.plugins = []
 
-        bundle.install_plugins()
-        self.assertEqual(mocks_bundle.call_count, 12)
+        with patch.object(ProcessRunner, "call") as mock_check_call:
+            bundle.install_plugins()
+            mock_check_call.assert_not_called()
+            mock_install_plugin.assert_not_called()
 
     @patch("os.path.isfile", return_value=True)
     def test_bundle_install_plugin(self, *mocks):
@@ -59,7 +95,7 @@ class TestBundleOpenSearch(unittest.TestCase):
         plugin = bundle.plugins[0]  # job-scheduler
 
         with patch("shutil.copyfile") as mock_copyfile:
-            with patch("subprocess.check_call") as mock_check_call:
+            with patch.object(ProcessRunner, "call") as mock_check_call:
                 bundle.install_plugin(plugin)
 
                 self.assertEqual(mock_copyfile.call_count, 1)
@@ -72,13 +108,11 @@ class TestBundleOpenSearch(unittest.TestCase):
                     [
                         call(
                             f'{install_plugin_bin} install --batch file:{os.path.join(bundle.tmp_dir.name, "opensearch-job-scheduler-1.1.0.0.zip")}',
-                            cwd=bundle.archive_path,
-                            shell=True,
+                            bundle.archive_path,
                         ),
                         call(
                             f'{ScriptFinder.find_install_script("opensearch-job-scheduler")} -a "{artifacts_path}" -o "{bundle.archive_path}"',
-                            cwd=bundle.archive_path,
-                            shell=True,
+                            bundle.archive_path,
                         ),
                     ]
                 )
@@ -97,10 +131,31 @@ class TestBundleOpenSearch(unittest.TestCase):
         with patch("tarfile.open") as mock_tarfile_open:
             mock_tarfile_add = MagicMock()
             mock_tarfile_open.return_value.__enter__.return_value.add = mock_tarfile_add
-            with patch("shutil.copyfile") as mock_copyfile:
+            with patch("assemble_workflow.bundle.ParallelGzipFile") as mock_gzip, patch("os.replace") as mock_replace:
                 bundle.build_tar(os.path.dirname(__file__))
-                mock_tarfile_open.assert_called_with("opensearch.tar", "w:gz")
+                tar_path = os.path.join(os.path.dirname(__file__), "opensearch.tar")
+                mock_gzip.assert_called_with(tar_path + ".tmp", compresslevel=9)
+                mock_replace.assert_called_with(tar_path + ".tmp", tar_path)
+                mock_tarfile_open.assert_called_with(
+                    fileobj=mock_gzip.return_value.__enter__.return_value, mode="w|"
+                )
                 mock_tarfile_add.assert_called_with(
                     os.path.join(bundle.tmp_dir.name, "bundle"), arcname="bundle"
                 )
-                self.assertEqual(mock_copyfile.call_count, 1)
+
+    def test_bundle_build_tar_failure(self):
+        manifest_path = os.path.join(
+            os.path.dirname(__file__), "data/opensearch-build-1.1.0.yml"
+        )
+        artifacts_path = os.path.join(os.path.dirname(__file__), "data/artifacts")
+        bundle = BundleOpenSearch(
+            BuildManifest.from_path(manifest_path),
+            artifacts_path,
+            MagicMock(tar_name="opensearch.tar.gz"),
+        )
+
+        with tempfile.TemporaryDirectory() as dest:
+            with patch("tarfile.TarFile.add", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    bundle.build_tar(dest)
+            self.assertEqual(os.listdir(dest), [])
@@ -12,6 +12,7 @@ from assemble_workflow.bundle_opensearch_dashboards import \
     BundleOpenSearchDashboards
 from manifests.build_manifest import BuildManifest
 from paths.script_finder import ScriptFinder
+from system.process_runner import ProcessRunner
 
 
 class TestBundleOpenSearchDashboards(unittest.TestCase):
@@ -48,7 +49,7 @@ class TestBundleOpenSearchDashboards(unittest.TestCase):
         plugin = bundle.plugins[0]  # alertingDashboards
 
         with patch("shutil.copyfile") as mock_copyfile:
-            with patch("subprocess.check_call") as mock_check_call:
+            with patch.object(ProcessRunner, "call") as mock_check_call:
                 bundle.install_plugin(plugin)
 
                 self.assertEqual(mock_copyfile.call_count, 1)
@@ -61,13 +62,11 @@ class TestBundleOpenSearchDashboards(unittest.TestCase):
                     [
                         call(
                             f'{install_plugin_bin} --allow-root install file:{os.path.join(bundle.tmp_dir.name, "alertingDashboards-1.1.0.zip")}',
-                            cwd=bundle.archive_path,
-                            shell=True,
+                            bundle.archive_path,
                         ),
                         call(
                             f'{ScriptFinder.find_install_script("alertingDashboards-1.1.0.zip")} -a "{artifacts_path}" -o "{bundle.archive_path}"',
-                            cwd=bundle.archive_path,
-                            shell=True,
+                            bundle.archive_path,
                         ),
                     ]
                 )
@@ -32,6 +32,14 @@ class TestBuildArgs(unittest.TestCase):
     def test_manifest(self):
         self.assertEqual(BuildArgs().manifest.name, TestBuildArgs.OPENSEARCH_MANIFEST)
 
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_git_cache_default(self):
+        self.assertIsNone(BuildArgs().git_cache)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--git-cache", "/tmp/git"])
+    def test_git_cache(self):
+        self.assertEqual(BuildArgs().git_cache, "/tmp/git")
+
     @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
     def test_keep_default(self):
         self.assertFalse(BuildArgs().keep)
@@ -64,6 +72,30 @@ class TestBuildArgs(unittest.TestCase):
     def test_component(self):
         self.assertEqual(BuildArgs().component, "xyz")
 
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_build_cache_default(self):
+        self.assertIsNone(BuildArgs().build_cache)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--build-cache", "/tmp/builds"])
+    def test_build_cache(self):
+        self.assertEqual(BuildArgs().build_cache, "/tmp/builds")
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_link_artifacts_default(self):
+        self.assertFalse(BuildArgs().link_artifacts)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--link-artifacts"])
+    def test_link_artifacts(self):
+        self.assertTrue(BuildArgs().link_artifacts)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_parallel_default(self):
+        self.assertEqual(BuildArgs().parallel, 1)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--parallel", "4"])
+    def test_parallel(self):
+        self.assertEqual(BuildArgs().parallel, 4)
+
     @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--component", "xyz"])
     def test_script_path(self):
         self.assertTrue(os.path.isfile(self.BUILD_PY))
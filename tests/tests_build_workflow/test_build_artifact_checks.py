@@ -5,8 +5,9 @@
 # compatible open source license.
 
 import unittest
-from unittest.mock import patch
+from unittest.mock import call, patch
 
+from build_workflow.build_artifact_check import BuildArtifactCheck
 from build_workflow.build_artifact_checks import BuildArtifactChecks
 from build_workflow.build_target import BuildTarget
 from build_workflow.opensearch.build_artifact_check_maven import \
@@ -58,3 +59,32 @@ class TestBuildArtifactChecks(unittest.TestCase):
         target = self.__mock_target(name="OpenSearch")
         BuildArtifactChecks.check(target, "plugins", "artifact.zip")
         mock_check.assert_called_with("artifact.zip")
+
+    @patch.object(BuildArtifactOpenSearchCheckPlugin, "check")
+    def test_check_all(self, mock_check):
+        target = self.__mock_target(name="OpenSearch")
+        BuildArtifactChecks.check_all(target, "plugins", ["artifact1.zip", "artifact2.zip"])
+        mock_check.assert_has_calls([call("artifact1.zip"), call("artifact2.zip")], any_order=True)
+
+    def test_check_all_invalid(self):
+        target = self.__mock_target(name="OpenSearch")
+
+        def check(path):
+            if path != "valid.zip":
+                raise BuildArtifactCheck.BuildArtifactInvalidError(path, "invalid")
+
+        with patch.object(BuildArtifactOpenSearchCheckPlugin, "check", side_effect=check):
+            with self.assertRaises(BuildArtifactChecks.BuildArtifactsInvalidError) as ctx:
+                BuildArtifactChecks.check_all(target, "plugins", ["invalid1.zip", "valid.zip", "invalid2.zip"])
+
+        self.assertEqual(
+            list(map(lambda error: error.path, ctx.exception.errors)),
+            ["invalid1.zip", "invalid2.zip"],
+        )
+        self.assertTrue(str(ctx.exception).startswith("2 artifact(s) are invalid."))
+
+    @patch.object(BuildArtifactOpenSearchCheckPlugin, "check")
+    def test_check_all_other(self, mock_check):
+        target = self.__mock_target(name="OpenSearch")
+        BuildArtifactChecks.check_all(target, "other", ["artifact.zip"])
+        mock_check.assert_not_called()
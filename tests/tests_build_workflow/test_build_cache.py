@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from build_workflow.build_cache import BuildCache
+from build_workflow.build_target import BuildTarget
+
+
+class TestBuildCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.maven_local = os.path.join(self.temp_dir.name, "m2", "repository")
+        self.cache = BuildCache(os.path.join(self.temp_dir.name, "cache"), self.maven_local)
+        self.git_repo = MagicMock(
+            url="https://github.com/opensearch-project/common-utils.git",
+            sha="3913d7097934cbfe1fdcf919347f22a597d00b76",
+            working_subdirectory=None,
+        )
+        self.target = BuildTarget(name="OpenSearch", version="1.1.0", arch="x64", snapshot=False)
+        self.build_script = os.path.join(self.temp_dir.name, "build.sh")
+        with open(self.build_script, "w") as f:
+            f.write("./gradlew assemble")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def __key(self, **kwargs):
+        return self.cache.key(
+            kwargs.get("name", "common-utils"),
+            kwargs.get("git_repo", self.git_repo),
+            self.build_script,
+            kwargs.get("target", self.target),
+            kwargs.get("dependencies", []),
+        )
+
+    def test_key_is_stable(self):
+        self.assertEqual(self.__key(), self.__key())
+
+    def test_key_changes_with_inputs(self):
+        key = self.__key()
+        self.assertNotEqual(key, self.__key(name="job-scheduler"))
+        self.assertNotEqual(key, self.__key(git_repo=MagicMock(url=self.git_repo.url, sha="0" * 40, working_subdirectory=None)))
+        self.assertNotEqual(key, self.__key(target=BuildTarget(name="OpenSearch", version="1.1.0", arch="x64", snapshot=True)))
+        self.assertNotEqual(key, self.__key(target=BuildTarget(name="OpenSearch", version="1.1.0", arch="arm64", snapshot=False)))
+        with open(self.build_script, "a") as f:
+            f.write(" --info")
+        self.assertNotEqual(key, self.__key())
+
+    def test_key_changes_with_dependencies(self):
+        self.cache.keys["OpenSearch"] = "a"
+        key = self.__key(dependencies=["OpenSearch"])
+        self.cache.keys["OpenSearch"] = "b"
+        self.assertNotEqual(key, self.__key(dependencies=["OpenSearch"]))
+
+    def test_key_with_unknown_dependency(self):
+        self.assertIsNone(self.__key(dependencies=["OpenSearch"]))
+
+    def test_store_and_restore(self):
+        artifacts_path = os.path.join(self.temp_dir.name, "checkout", "artifacts")
+        os.makedirs(os.path.join(artifacts_path, "maven"))
+        with open(os.path.join(artifacts_path, "maven", "common-utils.jar"), "w") as f:
+            f.write("jar")
+
+        self.assertFalse(self.cache.restore("common-utils", "key", artifacts_path))
+        self.cache.store("common-utils", "key", artifacts_path)
+        self.assertEqual(self.cache.keys, {"common-utils": "key"})
+
+        restored_path = os.path.join(self.temp_dir.name, "other", "artifacts")
+        cache = BuildCache(self.cache.path, self.maven_local)
+        self.assertTrue(cache.restore("common-utils", "key", restored_path))
+        with open(os.path.join(restored_path, "maven", "common-utils.jar")) as f:
+            self.assertEqual(f.read(), "jar")
+        self.assertEqual(cache.keys, {"common-utils": "key"})
+
+    def test_restore_installs_maven(self):
+        artifacts_path = os.path.join(self.temp_dir.name, "artifacts")
+        version_path = os.path.join(artifacts_path, "maven", "org", "opensearch", "opensearch", "1.1.0-SNAPSHOT")
+        os.makedirs(version_path)
+        for file_name in [
+            "opensearch-1.1.0-20211015.123456-1.jar",
+            "opensearch-1.1.0-20211015.123456-1-sources.jar",
+            "opensearch-1.1.0-20211015.123456-1.pom",
+            "maven-metadata.xml",
+        ]:
+            with open(os.path.join(version_path, file_name), "w") as f:
+                f.write(file_name)
+        self.cache.store("OpenSearch", "key", artifacts_path)
+
+        self.assertTrue(self.cache.restore("OpenSearch", "key", os.path.join(self.temp_dir.name, "other", "artifacts")))
+
+        installed_path = os.path.join(self.maven_local, "org", "opensearch", "opensearch", "1.1.0-SNAPSHOT")
+        self.assertEqual(
+            sorted(os.listdir(installed_path)),
+            [
+                "maven-metadata.xml",
+                "opensearch-1.1.0-20211015.123456-1-sources.jar",
+                "opensearch-1.1.0-20211015.123456-1.jar",
+                "opensearch-1.1.0-20211015.123456-1.pom",
+                "opensearch-1.1.0-SNAPSHOT-sources.jar",
+                "opensearch-1.1.0-SNAPSHOT.jar",
+                "opensearch-1.1.0-SNAPSHOT.pom",
+            ],
+        )
+        with open(os.path.join(installed_path, "opensearch-1.1.0-SNAPSHOT.jar")) as f:
+            self.assertEqual(f.read(), "opensearch-1.1.0-20211015.123456-1.jar")
+
+    def test_store_existing(self):
+        artifacts_path = os.path.join(self.temp_dir.name, "artifacts")
+        self.cache.store("common-utils", "key", artifacts_path)
+        self.cache.store("common-utils", "key", artifacts_path)
+        self.assertEqual(os.listdir(self.cache.path), ["key"])
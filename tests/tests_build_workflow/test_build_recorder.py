@@ -11,6 +11,8 @@ from unittest.mock import MagicMock, patch
 
 import yaml
 
+from build_workflow.build_artifact_check import BuildArtifactCheck
+from build_workflow.build_artifact_checks import BuildArtifactChecks
 from build_workflow.build_recorder import BuildRecorder
 from build_workflow.build_target import BuildTarget
 from build_workflow.opensearch.build_artifact_check_maven import \
@@ -96,6 +98,78 @@ class TestBuildRecorder(unittest.TestCase):
         mock_makedirs.assert_called_with("output_dir/..", exist_ok=True)
         mock_copyfile.assert_called_with(__file__, "output_dir/../file1.jar")
 
+    @patch("shutil.copyfile")
+    @patch("os.makedirs")
+    def test_record_artifact_creates_dirs_once(self, mock_makedirs, mock_copyfile):
+        recorder = self.__mock(snapshot=False)
+        recorder.record_component("common-utils", MagicMock())
+
+        recorder.record_artifact("common-utils", "files", "libs/file1.jar", __file__)
+        recorder.record_artifact("common-utils", "files", "libs/file2.jar", __file__)
+
+        mock_makedirs.assert_called_once_with("output_dir/libs", exist_ok=True)
+        self.assertEqual(mock_copyfile.call_count, 2)
+
+    @patch("shutil.copyfile")
+    @patch("os.makedirs")
+    def test_record_artifacts(self, mock_makedirs, mock_copyfile):
+        recorder = self.__mock(snapshot=False)
+        recorder.record_component(
+            "common-utils",
+            MagicMock(
+                url="https://github.com/opensearch-project/common-utils",
+                ref="main",
+                sha="3913d7097934cbfe1fdcf919347f22a597d00b76",
+            ),
+        )
+
+        recorder.record_artifacts(
+            "common-utils",
+            "libs",
+            [("libs/file1.jar", __file__), ("libs/file2.jar", __file__)],
+        )
+
+        mock_makedirs.assert_called_with("output_dir/libs", exist_ok=True)
+        self.assertEqual(mock_copyfile.call_count, 2)
+        self.assertEqual(
+            recorder.get_manifest().to_dict()["components"][0]["artifacts"],
+            {"libs": ["libs/file1.jar", "libs/file2.jar"]},
+        )
+
+    @patch("shutil.copyfile")
+    @patch("os.makedirs")
+    @patch.object(BuildArtifactOpenSearchCheckPlugin, "check")
+    def test_record_artifacts_invalid(self, mock_check, mock_makedirs, mock_copyfile):
+        mock_check.side_effect = BuildArtifactCheck.BuildArtifactInvalidError("plugin.zip", "invalid")
+        recorder = self.__mock(snapshot=False)
+        recorder.record_component("common-utils", MagicMock())
+
+        with self.assertRaises(BuildArtifactChecks.BuildArtifactsInvalidError) as ctx:
+            recorder.record_artifacts(
+                "common-utils",
+                "plugins",
+                [("plugins/plugin1.zip", "plugin1.zip"), ("plugins/plugin2.zip", "plugin2.zip")],
+            )
+
+        self.assertEqual(len(ctx.exception.errors), 2)
+        mock_copyfile.assert_not_called()
+
+    def test_record_artifact_link(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            recorder = BuildRecorder(
+                BuildTarget(build_id="1", output_dir=output_dir, name="OpenSearch", version="1.1.0", arch="x64"),
+                link_artifacts=True,
+            )
+            recorder.record_component("common-utils", MagicMock())
+            source = os.path.join(output_dir, "source.jar")
+            with open(source, "w") as f:
+                f.write("jar")
+
+            recorder.record_artifact("common-utils", "files", "libs/file1.jar", source)
+
+            dest = os.path.join(output_dir, "libs", "file1.jar")
+            self.assertEqual(os.stat(source).st_ino, os.stat(dest).st_ino)
+
     @patch("shutil.copyfile")
     @patch("os.makedirs")
     def test_record_artifact_check_plugin(self, *mocks):
@@ -138,6 +212,20 @@ class TestBuildRecorder(unittest.TestCase):
             },
         )
 
+    def test_get_manifest_component_order(self):
+        recorder = BuildRecorder(
+            BuildTarget(build_id="1", output_dir="output_dir", name="OpenSearch", version="1.1.0", arch="x64", snapshot=False),
+            component_names=["OpenSearch", "common-utils", "job-scheduler"],
+        )
+        # in the order concurrent builds finished
+        for name in ["job-scheduler", "other", "OpenSearch", "common-utils"]:
+            recorder.record_component(name, MagicMock(url=f"https://github.com/opensearch-project/{name}", ref="main", sha="sha"))
+
+        self.assertEqual(
+            [component.name for component in recorder.get_manifest().components],
+            ["OpenSearch", "common-utils", "job-scheduler", "other"],
+        )
+
     def test_write_manifest(self):
         with tempfile.TemporaryDirectory() as dest_dir:
             mock = self.__mock(snapshot=False)
@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from build_workflow.build_scheduler import BuildScheduler
+
+
+class TestBuildScheduler(unittest.TestCase):
+    def __component(self, name, depends_on=None):
+        component = MagicMock(depends_on=depends_on)
+        component.name = name
+        return component
+
+    def __components(self):
+        return [
+            self.__component("OpenSearch", []),
+            self.__component("common-utils", ["OpenSearch"]),
+            self.__component("job-scheduler", ["OpenSearch"]),
+            self.__component("alerting", ["common-utils"]),
+        ]
+
+    def test_dependencies(self):
+        scheduler = BuildScheduler(self.__components())
+        self.assertEqual(
+            scheduler.dependencies,
+            {
+                "OpenSearch": set(),
+                "common-utils": {"OpenSearch"},
+                "job-scheduler": {"OpenSearch"},
+                "alerting": {"common-utils"},
+            },
+        )
+
+    def test_dependencies_inferred_from_order(self):
+        scheduler = BuildScheduler(
+            [
+                self.__component("OpenSearch"),
+                self.__component("common-utils"),
+                self.__component("job-scheduler"),
+            ]
+        )
+        self.assertEqual(
+            scheduler.dependencies,
+            {
+                "OpenSearch": set(),
+                "common-utils": {"OpenSearch"},
+                "job-scheduler": {"OpenSearch", "common-utils"},
+            },
+        )
+
+    def test_dependencies_not_built_are_skipped(self):
+        components = self.__components()
+        scheduler = BuildScheduler(components[3:], manifest_components=components)
+        self.assertEqual(scheduler.dependencies, {"alerting": set()})
+        self.assertEqual(scheduler.skipped_dependencies, {"alerting": {"common-utils"}})
+
+    def test_dependencies_inferred_not_built_are_skipped(self):
+        components = [
+            self.__component("OpenSearch"),
+            self.__component("common-utils"),
+            self.__component("job-scheduler"),
+        ]
+        scheduler = BuildScheduler(components[2:], manifest_components=components)
+        self.assertEqual(scheduler.dependencies, {"job-scheduler": set()})
+        self.assertEqual(scheduler.skipped_dependencies, {"job-scheduler": {"OpenSearch", "common-utils"}})
+
+    def test_run_sequential(self):
+        built = []
+        BuildScheduler(self.__components()).run(lambda component: built.append(component.name))
+        self.assertEqual(built, ["OpenSearch", "common-utils", "job-scheduler", "alerting"])
+
+    def test_run_parallel_respects_dependencies(self):
+        lock = threading.Lock()
+        started = {}
+        finished = {}
+        counter = iter(range(100))
+
+        def build(component):
+            with lock:
+                started[component.name] = next(counter)
+            with lock:
+                finished[component.name] = next(counter)
+
+        BuildScheduler(self.__components(), parallel=4).run(build)
+
+        self.assertEqual(len(finished), 4)
+        self.assertLess(finished["OpenSearch"], started["common-utils"])
+        self.assertLess(finished["OpenSearch"], started["job-scheduler"])
+        self.assertLess(finished["common-utils"], started["alerting"])
+
+    def test_run_parallel_overlaps_independent_builds(self):
+        barrier = threading.Barrier(2, timeout=10)
+
+        def build(component):
+            if component.name in ["common-utils", "job-scheduler"]:
+                # both wait for each other, which deadlocks unless they run at the same time
+                barrier.wait()
+
+        BuildScheduler(self.__components(), parallel=2).run(build)
+
+    def test_run_stops_on_error(self):
+        built = []
+
+        def build(component):
+            if component.name == "common-utils":
+                raise ValueError("failed")
+            built.append(component.name)
+
+        with self.assertRaises(ValueError) as context:
+            BuildScheduler(self.__components()).run(build)
+
+        self.assertEqual(str(context.exception), "failed")
+        self.assertEqual(built, ["OpenSearch"])
+
+    def test_run_cyclic(self):
+        scheduler = BuildScheduler(
+            [
+                self.__component("a", ["b"]),
+                self.__component("b", ["a"]),
+            ]
+        )
+        with self.assertRaises(BuildScheduler.CyclicDependencyError) as context:
+            scheduler.run(MagicMock())
+        self.assertEqual(str(context.exception), "Cyclic dependency between components: a, b")
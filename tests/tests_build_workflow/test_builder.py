@@ -62,6 +62,50 @@ class TestBuilder(unittest.TestCase):
             "component", self.builder.git_repo
         )
 
+    def test_build_cache_miss(self):
+        build_cache = MagicMock()
+        build_cache.key.return_value = "key"
+        build_cache.restore.return_value = False
+        builder = Builder("component", self.builder.git_repo, MagicMock(), build_cache, ["OpenSearch"])
+        target = BuildTarget(name="OpenSearch", version="1.0.0", arch="x64", snapshot=False)
+
+        builder.build(target)
+
+        build_cache.key.assert_called_with(
+            "component",
+            builder.git_repo,
+            os.path.realpath(os.path.join(ScriptFinder.default_scripts_path, "opensearch", "build.sh")),
+            target,
+            ["OpenSearch"],
+        )
+        builder.git_repo.execute.assert_called()
+        build_cache.store.assert_called_with("component", "key", builder.artifacts_path)
+        builder.build_recorder.record_component.assert_called_with("component", builder.git_repo)
+
+    def test_build_cache_hit(self):
+        build_cache = MagicMock()
+        build_cache.key.return_value = "key"
+        build_cache.restore.return_value = True
+        builder = Builder("component", self.builder.git_repo, MagicMock(), build_cache)
+
+        builder.build(BuildTarget(name="OpenSearch", version="1.0.0", arch="x64", snapshot=False))
+
+        build_cache.restore.assert_called_with("component", "key", builder.artifacts_path)
+        builder.git_repo.execute.assert_not_called()
+        build_cache.store.assert_not_called()
+        builder.build_recorder.record_component.assert_called_with("component", builder.git_repo)
+
+    def test_build_cache_not_cacheable(self):
+        build_cache = MagicMock()
+        build_cache.key.return_value = None
+        builder = Builder("component", self.builder.git_repo, MagicMock(), build_cache)
+
+        builder.build(BuildTarget(name="OpenSearch", version="1.0.0", arch="x64", snapshot=False))
+
+        build_cache.restore.assert_not_called()
+        build_cache.store.assert_not_called()
+        builder.git_repo.execute.assert_called()
+
     def mock_os_walk(self, artifact_path):
         if artifact_path.endswith("/checked-out-component/artifacts/core-plugins"):
             return [["/core-plugins", [], ["plugin1.zip"]]]
@@ -74,18 +118,26 @@ class TestBuilder(unittest.TestCase):
     def test_export_artifacts(self, mock_walk):
         mock_walk.side_effect = self.mock_os_walk
         self.builder.export_artifacts()
-        self.assertEqual(self.builder.build_recorder.record_artifact.call_count, 2)
-        self.builder.build_recorder.record_artifact.assert_has_calls([
+        self.assertEqual(self.builder.build_recorder.record_artifacts.call_count, 2)
+        self.builder.build_recorder.record_artifacts.assert_has_calls([
             call(
                 "component",
                 "maven",
-                os.path.relpath("/maven/artifact1.jar", self.builder.artifacts_path),
-                "/maven/artifact1.jar",
+                [
+                    (
+                        os.path.relpath("/maven/artifact1.jar", self.builder.artifacts_path),
+                        "/maven/artifact1.jar",
+                    )
+                ],
             ),
             call(
                 "component",
                 "core-plugins",
-                os.path.relpath("/core-plugins/plugin1.zip", self.builder.artifacts_path),
-                "/core-plugins/plugin1.zip",
+                [
+                    (
+                        os.path.relpath("/core-plugins/plugin1.zip", self.builder.artifacts_path),
+                        "/core-plugins/plugin1.zip",
+                    )
+                ],
             ),
         ])
@@ -28,6 +28,14 @@ class TestCheckoutArgs(unittest.TestCase):
     def test_manifest(self):
         self.assertEqual(CheckoutArgs().manifest.name, TestCheckoutArgs.OPENSEARCH_MANIFEST)
 
+    @patch("argparse._sys.argv", [CHECKOUT_PY, OPENSEARCH_MANIFEST])
+    def test_git_cache_default(self):
+        self.assertIsNone(CheckoutArgs().git_cache)
+
+    @patch("argparse._sys.argv", [CHECKOUT_PY, OPENSEARCH_MANIFEST, "--git-cache", "/tmp/git"])
+    def test_git_cache(self):
+        self.assertEqual(CheckoutArgs().git_cache, "/tmp/git")
+
     @patch("argparse._sys.argv", [CHECKOUT_PY, OPENSEARCH_MANIFEST, "--verbose"])
     def test_verbose_true(self):
         self.assertTrue(CheckoutArgs().logging_level, logging.DEBUG)
@@ -8,6 +8,8 @@ import unittest
 from unittest.mock import MagicMock
 
 from ci_workflow.ci import Ci
+from ci_workflow.ci_target import CiTarget
+from manifests.input_manifest import InputManifest
 
 
 class TestCi(unittest.TestCase):
@@ -20,4 +22,58 @@ class TestCi(unittest.TestCase):
         self.assertEqual(self.ci.component, "component")
 
     def test_check(self):
-        pass
+        component = InputManifest.Component(
+            {
+                "name": "common-utils",
+                "repository": "url",
+                "ref": "ref",
+                "checks": ["gradle:properties:version", "gradle:properties:version", "gradle:publish"],
+            }
+        )
+        git_repo = MagicMock()
+        git_repo.output.return_value = "version=1.1.0.0"
+        Ci(component, git_repo, CiTarget(version="1.1.0", snapshot=False)).check()
+        git_repo.output.assert_called_once_with(
+            "./gradlew properties --console=plain -Dopensearch.version=1.1.0 -Dbuild.snapshot=false"
+        )
+        git_repo.execute.assert_called_once_with(
+            "./gradlew publishToMavenLocal -Dopensearch.version=1.1.0 -Dbuild.snapshot=false"
+        )
+
+    def test_check_introspects_once(self):
+        component = InputManifest.Component(
+            {
+                "name": "common-utils",
+                "repository": "url",
+                "ref": "ref",
+                "checks": [
+                    "gradle:properties:version",
+                    {"gradle:dependencies:opensearch.version": "plugin"},
+                    "gradle:dependencies:opensearch.version",
+                ],
+            }
+        )
+        git_repo = MagicMock()
+        git_repo.output.return_value = "\n".join(
+            [
+                "> Task :properties",
+                "version: 1.1.0.0",
+                "> Task :plugin:dependencies",
+                "\\--- org.opensearch:opensearch:1.1.0",
+                "> Task :dependencies",
+                "\\--- org.opensearch:opensearch:1.1.0",
+                "BUILD SUCCESSFUL in 1s",
+            ]
+        )
+        Ci(component, git_repo, CiTarget(version="1.1.0", snapshot=False)).check()
+        git_repo.output.assert_called_once_with(
+            "./gradlew properties plugin:dependencies --configuration compileOnly :dependencies --configuration compileOnly --console=plain"
+            " -Dopensearch.version=1.1.0 -Dbuild.snapshot=false"
+        )
+
+    def test_check_invalid(self):
+        component = InputManifest.Component(
+            {"name": "common-utils", "repository": "url", "ref": "ref", "checks": ["invalid"]}
+        )
+        with self.assertRaises(Ci.InvalidCheckError):
+            Ci(component, MagicMock(), MagicMock()).check()
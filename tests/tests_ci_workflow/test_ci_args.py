@@ -29,6 +29,30 @@ class TestCiArgs(unittest.TestCase):
     def test_manifest(self):
         self.assertEqual(CiArgs().manifest.name, TestCiArgs.OPENSEARCH_MANIFEST)
 
+    @patch("argparse._sys.argv", [CI_PY, OPENSEARCH_MANIFEST])
+    def test_git_cache_default(self):
+        self.assertIsNone(CiArgs().git_cache)
+
+    @patch("argparse._sys.argv", [CI_PY, OPENSEARCH_MANIFEST, "--git-cache", "/tmp/git"])
+    def test_git_cache(self):
+        self.assertEqual(CiArgs().git_cache, "/tmp/git")
+
+    @patch("argparse._sys.argv", [CI_PY, OPENSEARCH_MANIFEST])
+    def test_gradle_cache_default(self):
+        self.assertIsNone(CiArgs().gradle_cache)
+
+    @patch("argparse._sys.argv", [CI_PY, OPENSEARCH_MANIFEST, "--gradle-cache", "/tmp/gradle"])
+    def test_gradle_cache(self):
+        self.assertEqual(CiArgs().gradle_cache, "/tmp/gradle")
+
+    @patch("argparse._sys.argv", [CI_PY, OPENSEARCH_MANIFEST])
+    def test_parallel_default(self):
+        self.assertEqual(CiArgs().parallel, 1)
+
+    @patch("argparse._sys.argv", [CI_PY, OPENSEARCH_MANIFEST, "--parallel", "4"])
+    def test_parallel(self):
+        self.assertEqual(CiArgs().parallel, 4)
+
     @patch("argparse._sys.argv", [CI_PY, OPENSEARCH_MANIFEST])
     def test_keep_default(self):
         self.assertFalse(CiArgs().keep)
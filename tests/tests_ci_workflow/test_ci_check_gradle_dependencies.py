@@ -31,19 +31,19 @@ class TestCiCheckGradleDependencies(unittest.TestCase):
     def test_executes_gradle_dependencies(self):
         check = self.__mock_dependencies()
         check.git_repo.output.assert_called_once_with(
-            './gradlew :dependencies -Dopensearch.version=1.1.0 -Dbuild.snapshot=false --configuration compileOnly | grep -e "---"'
+            "./gradlew properties :dependencies --configuration compileOnly --console=plain -Dopensearch.version=1.1.0 -Dbuild.snapshot=false"
         )
 
     def test_executes_gradle_dependencies_snapshot(self):
         check = self.__mock_dependencies(snapshot=True)
         check.git_repo.output.assert_called_once_with(
-            './gradlew :dependencies -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true --configuration compileOnly | grep -e "---"'
+            "./gradlew properties :dependencies --configuration compileOnly --console=plain -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true"
         )
 
     def test_executes_gradle_dependencies_project(self):
         check = self.__mock_dependencies(snapshot=True, gradle_project="project")
         check.git_repo.output.assert_called_once_with(
-            './gradlew project:dependencies -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true --configuration compileOnly | grep -e "---"'
+            "./gradlew properties project:dependencies --configuration compileOnly --console=plain -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true"
         )
 
     def test_loads_tree(self):
@@ -51,7 +51,7 @@ class TestCiCheckGradleDependencies(unittest.TestCase):
             os.path.dirname(__file__), "data/job_scheduler_dependencies.txt"
         )
         with open(data_path) as f:
-            check = self.__mock_dependencies(props=f.read())
+            check = self.__mock_dependencies(props="> Task :dependencies\n" + f.read())
             self.assertEqual(
                 check.dependencies.get_value("org.opensearch:opensearch"),
                 "1.1.0-SNAPSHOT",
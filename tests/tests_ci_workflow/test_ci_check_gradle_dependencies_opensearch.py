@@ -57,7 +57,7 @@ class TestCiCheckGradleDependenciesOpenSearchVersion(unittest.TestCase):
             args=None,
         )
         check.git_repo.output.assert_called_once_with(
-            './gradlew :dependencies -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true --configuration compileOnly | grep -e "---"'
+            "./gradlew properties :dependencies --configuration compileOnly --console=plain -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true"
         )
 
     def test_executes_gradle_command_with_arg(self):
@@ -68,5 +68,5 @@ class TestCiCheckGradleDependenciesOpenSearchVersion(unittest.TestCase):
             args="plugin",
         )
         check.git_repo.output.assert_called_once_with(
-            './gradlew plugin:dependencies -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true --configuration compileOnly | grep -e "---"'
+            "./gradlew properties plugin:dependencies --configuration compileOnly --console=plain -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true"
         )
@@ -27,7 +27,7 @@ class TestCiCheckGradleProperties(unittest.TestCase):
         )
 
         git_repo.output.assert_called_once_with(
-            "./gradlew properties -Dopensearch.version=1.1.0 -Dbuild.snapshot=false"
+            "./gradlew properties --console=plain -Dopensearch.version=1.1.0 -Dbuild.snapshot=false"
         )
 
     def test_executes_gradle_properties_snapshot(self):
@@ -41,5 +41,5 @@ class TestCiCheckGradleProperties(unittest.TestCase):
         )
 
         git_repo.output.assert_called_once_with(
-            "./gradlew properties -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true"
+            "./gradlew properties --console=plain -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true"
         )
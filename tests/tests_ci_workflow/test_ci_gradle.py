@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ci_workflow.ci_gradle import CiGradle
+from ci_workflow.ci_target import CiTarget
+
+
+class TestCiGradle(unittest.TestCase):
+    OUTPUT = "\n".join(
+        [
+            "> Configure project :",
+            "> Task :properties",
+            "",
+            "------------------------------------------------------------",
+            "Root project 'job-scheduler'",
+            "------------------------------------------------------------",
+            "",
+            "version: 1.1.0.0-SNAPSHOT",
+            "",
+            "> Task :dependencies",
+            "compileOnly - Compile only dependencies for source set 'main'. (n)",
+            "\\--- org.opensearch:opensearch:1.1.0-SNAPSHOT (n)",
+            "",
+            "> Task :spi:dependencies",
+            "\\--- org.opensearch:opensearch-core:1.1.0-SNAPSHOT (n)",
+            "",
+            "BUILD SUCCESSFUL in 3s",
+            "2 actionable tasks: 2 executed",
+        ]
+    )
+
+    def setUp(self):
+        self.git_repo = MagicMock(url="url", sha="sha", working_subdirectory=None)
+        self.git_repo.output.return_value = self.OUTPUT
+        self.target = CiTarget(version="1.1.0", snapshot=True)
+
+    def test_command(self):
+        gradle = CiGradle(self.git_repo, self.target)
+        self.assertEqual(
+            gradle.command("properties"),
+            "./gradlew properties -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true",
+        )
+
+    @patch.dict(os.environ, {"PROCESS_REPORT_PATH": "processes.jsonl"})
+    def test_command_measured(self):
+        gradle = CiGradle(self.git_repo, self.target)
+        self.assertEqual(
+            gradle.command("properties"),
+            "./gradlew --no-daemon properties -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true",
+        )
+
+    def test_execute(self):
+        CiGradle(self.git_repo, self.target).execute("publishToMavenLocal")
+        self.git_repo.execute.assert_called_with(
+            "./gradlew publishToMavenLocal -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true"
+        )
+
+    def test_introspects_once(self):
+        gradle = CiGradle(self.git_repo, self.target, ["", "spi"])
+        self.assertEqual(gradle.properties().get_value("version"), "1.1.0.0-SNAPSHOT")
+        self.assertIn("org.opensearch:opensearch:1.1.0-SNAPSHOT", gradle.dependencies())
+        self.assertNotIn("opensearch-core", gradle.dependencies())
+        self.assertIn("org.opensearch:opensearch-core:1.1.0-SNAPSHOT", gradle.dependencies("spi"))
+        self.git_repo.output.assert_called_once_with(
+            "./gradlew properties :dependencies --configuration compileOnly spi:dependencies --configuration compileOnly --console=plain"
+            " -Dopensearch.version=1.1.0-SNAPSHOT -Dbuild.snapshot=true"
+        )
+
+    def test_introspects_new_project(self):
+        gradle = CiGradle(self.git_repo, self.target)
+        gradle.properties()
+        gradle.dependencies("spi")
+        self.assertEqual(self.git_repo.output.call_count, 2)
+
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            gradle = CiGradle(self.git_repo, self.target, [""], cache_dir)
+            self.assertEqual(gradle.properties().get_value("version"), "1.1.0.0-SNAPSHOT")
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            gradle = CiGradle(self.git_repo, self.target, [""], cache_dir)
+            self.assertEqual(gradle.properties().get_value("version"), "1.1.0.0-SNAPSHOT")
+            self.assertIn("org.opensearch:opensearch:1.1.0-SNAPSHOT", gradle.dependencies())
+            self.git_repo.output.assert_called_once()
+
+            # a different target does not hit the cache
+            CiGradle(self.git_repo, CiTarget(version="1.1.0", snapshot=False), [""], cache_dir).properties()
+            self.assertEqual(self.git_repo.output.call_count, 2)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import time
+import unittest
+
+from ci_workflow.gradle_dependency_tree import GradleDependencyTree
+from system.properties_file import PropertiesFile
+
+
+class TestGradleDependencyTree(unittest.TestCase):
+    TREE = "\n".join(
+        [
+            "compileOnly - Compile only dependencies for source set 'main'.",
+            "+--- org.opensearch:opensearch:1.1.0-SNAPSHOT",
+            "|    +--- org.opensearch:opensearch-core:1.1.0-SNAPSHOT",
+            "|    |    \\--- org.apache.lucene:lucene-core:8.9.0 -> 8.10.1",
+            "|    \\--- org.apache.lucene:lucene-core:8.9.0 -> 8.10.1 (*)",
+            "+--- project :spi",
+            "|    \\--- org.opensearch:opensearch-core:1.1.0-SNAPSHOT (*)",
+            "+--- com.google.guava:guava:{strictly 30.1-jre} -> 30.1-jre",
+            "+--- org.opensearch:opensearch:1.0.0 (c)",
+            "\\--- org.slf4j:slf4j-api -> 1.7.30",
+            "",
+            "(*) - dependencies omitted (listed previously)",
+        ]
+    )
+
+    def setUp(self):
+        self.tree = GradleDependencyTree(self.TREE)
+
+    def test_roots(self):
+        self.assertEqual(
+            list(map(lambda dependency: dependency.name, self.tree.dependencies)),
+            [
+                "org.opensearch:opensearch",
+                "project :spi",
+                "com.google.guava:guava",
+                "org.opensearch:opensearch",
+                "org.slf4j:slf4j-api",
+            ],
+        )
+
+    def test_get(self):
+        dependency = self.tree.get("org.opensearch:opensearch/org.opensearch:opensearch-core/org.apache.lucene:lucene-core")
+        self.assertEqual(dependency.requested, "8.9.0")
+        self.assertEqual(dependency.version, "8.10.1")
+        self.assertEqual(dependency.path, "org.opensearch:opensearch/org.opensearch:opensearch-core/org.apache.lucene:lucene-core")
+        self.assertIsNone(self.tree.get("org.apache.lucene:lucene-core"))
+
+    def test_omitted(self):
+        dependency = self.tree.get("project :spi/org.opensearch:opensearch-core")
+        self.assertTrue(dependency.omitted)
+        self.assertEqual(dependency.version, "1.1.0-SNAPSHOT")
+        self.assertEqual(dependency.children, [])
+
+    def test_constraint_does_not_hide_dependency(self):
+        self.assertEqual(self.tree.get_value("org.opensearch:opensearch"), "1.1.0-SNAPSHOT")
+        self.assertEqual([dependency.constraint for dependency in self.tree.find("org.opensearch:opensearch")], [False, True])
+
+    def test_version_overrides(self):
+        self.assertEqual(self.tree.get("com.google.guava:guava").requested, "{strictly 30.1-jre}")
+        self.assertEqual(self.tree.get_value("com.google.guava:guava"), "30.1-jre")
+        self.assertIsNone(self.tree.get("org.slf4j:slf4j-api").requested)
+        self.assertEqual(self.tree.get_value("org.slf4j:slf4j-api"), "1.7.30")
+
+    def test_find(self):
+        self.assertEqual(len(self.tree.find("org.opensearch:opensearch-core")), 2)
+        self.assertEqual(self.tree.find("invalid:invalid"), [])
+
+    def test_check_value(self):
+        self.tree.check_value("org.opensearch:opensearch", "1.1.0-SNAPSHOT")
+        with self.assertRaises(PropertiesFile.UnexpectedKeyValueError):
+            self.tree.check_value("org.opensearch:opensearch", "1.2.0-SNAPSHOT")
+        with self.assertRaises(PropertiesFile.UnexpectedKeyValueError):
+            self.tree.check_value("invalid:invalid", "1.1.0")
+
+    def test_job_scheduler(self):
+        with open(os.path.join(os.path.dirname(__file__), "data/job_scheduler_dependencies.txt")) as f:
+            tree = GradleDependencyTree(f)
+        self.assertEqual(tree.get_value("org.opensearch:opensearch/org.opensearch:opensearch-core"), "1.1.0-SNAPSHOT")
+        self.assertEqual(
+            tree.get_value("com.puppycrawl.tools:checkstyle/commons-beanutils:commons-beanutils/commons-collections:commons-collections"),
+            "3.2.2",
+        )
+
+    def test_large_multi_project_tree(self):
+        lines = []
+        for project in range(50):
+            lines.append(f"+--- project :project-{project}")
+            for dependency in range(100):
+                lines.append(f"|    +--- org.example:library-{dependency}:1.0 -> 1.1")
+                for transitive in range(20):
+                    lines.append(f"|    |    +--- org.example:transitive-{transitive}:2.0 (*)")
+        start = time.time()
+        tree = GradleDependencyTree(lines)
+        elapsed = time.time() - start
+
+        self.assertEqual(len(tree), 50 * 100 * 21 + 50)
+        self.assertEqual(len(tree.find("org.example:library-99")), 50)
+        self.assertEqual(tree.get_value("project :project-49/org.example:library-99/org.example:transitive-19"), "2.0")
+        self.assertLess(elapsed, 10)
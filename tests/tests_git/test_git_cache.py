@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import subprocess
+import tempfile
+import unittest
+
+from git.git_cache import GitCache
+from git.git_repository import GitRepository
+
+
+class TestGitCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.origin = os.path.join(self.temp_dir.name, "origin")
+        self.url = f"file://{self.origin}"
+        os.makedirs(self.origin)
+        self.__git("init")
+        self.first = self.__commit("first.txt")
+        self.second = self.__commit("second.txt")
+        self.cache = GitCache(os.path.join(self.temp_dir.name, "cache"))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def __git(self, command):
+        return subprocess.check_output(
+            f"git -c user.name=test -c user.email=test@example.com {command}",
+            cwd=self.origin,
+            shell=True,
+        ).decode().strip()
+
+    def __commit(self, name):
+        with open(os.path.join(self.origin, name), "w") as f:
+            f.write(name)
+        self.__git(f"add {name}")
+        self.__git(f"commit -m {name}")
+        return self.__git("rev-parse HEAD")
+
+    def __checkout(self, ref, name):
+        return GitRepository(self.url, ref, os.path.join(self.temp_dir.name, name), cache=self.cache)
+
+    def test_mirror_path(self):
+        self.assertEqual(os.path.dirname(self.cache.mirror_path(self.url)), self.cache.path)
+        self.assertTrue(self.cache.mirror_path(self.url).endswith(".git"))
+        self.assertNotEqual(self.cache.mirror_path(self.url), self.cache.mirror_path(self.url + "x"))
+
+    def test_checkout(self):
+        repo = self.__checkout("HEAD", "checkout")
+        self.assertEqual(repo.sha, self.second)
+        self.assertTrue(os.path.isfile(os.path.join(repo.dir, "first.txt")))
+        self.assertTrue(os.path.isfile(os.path.join(repo.dir, "second.txt")))
+        # objects are borrowed from the mirror
+        with open(os.path.join(repo.dir, ".git", "objects", "info", "alternates")) as f:
+            self.assertEqual(f.read().strip(), os.path.join(self.cache.mirror_path(self.url), "objects"))
+        self.assertEqual(repo.output("git log --format=%H"), self.second)
+
+    def test_checkout_keeps_refs(self):
+        self.__checkout(self.first, "first")
+        self.__checkout("HEAD", "second")
+        refs = subprocess.check_output(
+            "git for-each-ref --format='%(objectname)' refs/cache", cwd=self.cache.mirror_path(self.url), shell=True
+        ).decode().split()
+        self.assertEqual(sorted(refs), sorted([self.first, self.second]))
+
+    def test_checkout_reuses_mirror(self):
+        self.__checkout("HEAD", "before")
+        third = self.__commit("third.txt")
+        repo = self.__checkout("HEAD", "after")
+        self.assertEqual(repo.sha, third)
+        self.assertTrue(os.path.isfile(os.path.join(repo.dir, "third.txt")))
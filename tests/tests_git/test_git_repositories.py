@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import threading
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from git.git_repositories import GitRepositories
+
+
+class TestGitRepositories(unittest.TestCase):
+    def __component(self, name, working_directory=None):
+        component = MagicMock(
+            repository=f"https://github.com/opensearch-project/{name}.git",
+            ref="main",
+            working_directory=working_directory,
+        )
+        component.name = name
+        return component
+
+    @patch("git.git_repositories.GitRepository")
+    def test_checkout(self, mock_repo):
+        cache = MagicMock()
+        components = [self.__component("OpenSearch"), self.__component("dashboards-reports", "reports-scheduler")]
+
+        repos = GitRepositories("work", cache=cache).checkout(components)
+
+        self.assertEqual(list(repos.keys()), ["OpenSearch", "dashboards-reports"])
+        mock_repo.assert_has_calls(
+            [
+                call("https://github.com/opensearch-project/OpenSearch.git", "main", "work/OpenSearch", None, cache=cache),
+                call(
+                    "https://github.com/opensearch-project/dashboards-reports.git",
+                    "main",
+                    "work/dashboards-reports",
+                    "reports-scheduler",
+                    cache=cache,
+                ),
+            ],
+            any_order=True,
+        )
+
+    @patch("git.git_repositories.GitRepository")
+    def test_checkout_concurrently(self, mock_repo):
+        barrier = threading.Barrier(2, timeout=10)
+        mock_repo.side_effect = lambda *args, **kwargs: barrier.wait()
+        GitRepositories("work", parallel=2).checkout([self.__component("a"), self.__component("b")])
+        self.assertEqual(mock_repo.call_count, 2)
+
+    @patch("git.git_repositories.GitRepository", side_effect=ValueError("failed"))
+    def test_checkout_error(self, mock_repo):
+        with self.assertRaises(ValueError):
+            GitRepositories("work").checkout([self.__component("OpenSearch")])
@@ -11,6 +11,7 @@ import unittest
 from unittest.mock import patch
 
 from git.git_repository import GitRepository
+from system.process_runner import ProcessRunner
 
 
 class TestGitRepository(unittest.TestCase):
@@ -45,23 +46,20 @@ class TestGitRepository(unittest.TestCase):
             os.path.isfile(os.path.join(self.repo.dir, "ISSUE_TEMPLATE/created.txt"))
         )
 
-    @patch("subprocess.check_call")
-    def test_execute_silent(self, mock_subprocess):
+    @patch.object(ProcessRunner, "call")
+    def test_execute_silent(self, mock_call):
         self.repo.execute_silent("echo .")
-        subprocess.check_call.assert_called_with(
+        mock_call.assert_called_with(
             "echo .",
-            cwd=self.repo.dir,
-            shell=True,
+            self.repo.dir,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
 
-    @patch("subprocess.check_output")
-    def test_output(self, mock_subprocess):
-        self.repo.output("echo hello")
-        subprocess.check_output.assert_called_with(
-            "echo hello", cwd=self.repo.dir, shell=True
-        )
+    @patch.object(ProcessRunner, "output", return_value="hello\n")
+    def test_output(self, mock_output):
+        self.assertEqual(self.repo.output("echo hello"), "hello")
+        mock_output.assert_called_with("echo hello", self.repo.dir)
 
 
 class TestGitRepositoryDir(unittest.TestCase):
@@ -96,3 +94,54 @@ class TestGitRepositoryWithWorkingDir(unittest.TestCase):
 
         pwd = repo.output("pwd")
         self.assertEqual(pwd, os.path.join(repo.dir, "ISSUE_TEMPLATE"))
+
+
+class TestGitRepositoryFromDirectory(unittest.TestCase):
+    def test_from_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            subprocess.check_call("git init", cwd=directory, shell=True, stdout=subprocess.DEVNULL)
+            os.makedirs(os.path.join(directory, "src"))
+            subprocess.check_call(
+                "git -c user.name=test -c user.email=test@example.com commit --allow-empty -m first",
+                cwd=directory,
+                shell=True,
+                stdout=subprocess.DEVNULL,
+            )
+            sha = subprocess.check_output("git rev-parse HEAD", cwd=directory, shell=True).decode().strip()
+
+            repo = GitRepository.from_directory("https://github.com/opensearch-project/.github", directory, "src")
+
+            self.assertEqual(repo.sha, sha)
+            self.assertEqual(repo.dir, directory)
+            self.assertIsNone(repo.temp_dir)
+            self.assertEqual(repo.output("pwd"), os.path.join(directory, "src"))
+
+    def test_ls_remote(self):
+        with tempfile.TemporaryDirectory() as directory:
+            subprocess.check_call("git init -b main", cwd=directory, shell=True, stdout=subprocess.DEVNULL)
+            subprocess.check_call(
+                "git -c user.name=test -c user.email=test@example.com commit --allow-empty -m first && git branch 1.x",
+                cwd=directory,
+                shell=True,
+                stdout=subprocess.DEVNULL,
+            )
+            sha = subprocess.check_output("git rev-parse HEAD", cwd=directory, shell=True).decode().strip()
+
+            self.assertEqual(GitRepository.ls_remote(directory, "HEAD"), {"HEAD": sha})
+            self.assertEqual(GitRepository.ls_remote(directory, "refs/heads/*"), {"refs/heads/1.x": sha, "refs/heads/main": sha})
+
+    @patch.object(ProcessRunner, "output", return_value="abc\tHEAD\n")
+    def test_ls_remote_timeout(self, mock_output):
+        self.assertEqual(GitRepository.ls_remote("https://github.com/opensearch-project/.github", "HEAD"), {"HEAD": "abc"})
+        mock_output.assert_called_with(
+            ["git", "ls-remote", "https://github.com/opensearch-project/.github", "HEAD"], timeout=GitRepository.LS_REMOTE_TIMEOUT
+        )
+
+    @patch.dict(os.environ, {"GITHUB_TOKEN": "token"})
+    @patch.object(ProcessRunner, "output", return_value="abc\tHEAD\n")
+    def test_ls_remote_expands_token(self, mock_output):
+        GitRepository.ls_remote("https://${GITHUB_TOKEN}@github.com/opensearch-project/opensearch-signer-client.git", "HEAD")
+        mock_output.assert_called_with(
+            ["git", "ls-remote", "https://token@github.com/opensearch-project/opensearch-signer-client.git", "HEAD"],
+            timeout=GitRepository.LS_REMOTE_TIMEOUT,
+        )
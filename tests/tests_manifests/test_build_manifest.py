@@ -67,6 +67,33 @@ class TestBuildManifest(unittest.TestCase):
         with self.assertRaises(BuildManifest.ComponentNotFoundError):
             self.manifest.get_component(component_name)
 
+    def test_components_by_name(self):
+        self.assertEqual(len(self.manifest.components_by_name), 15)
+        self.assertIs(
+            self.manifest.components_by_name["OpenSearch"], self.manifest.components[0]
+        )
+
+    def test_artifacts_by_type(self):
+        self.assertIn(
+            "core-plugins/discovery-ec2-1.1.0.zip",
+            self.manifest.artifacts_by_type["core-plugins"],
+        )
+        self.assertIn(
+            "plugins/opensearch-index-management-1.1.0.0.zip",
+            self.manifest.artifacts_by_type["plugins"],
+        )
+
+    def test_components_by_artifact(self):
+        component = self.manifest.components_by_artifact[
+            "plugins/opensearch-index-management-1.1.0.0.zip"
+        ]
+        self.assertEqual(component.name, "index-management")
+        self.assertIsNone(self.manifest.components_by_artifact.get("invalid.zip"))
+
+    def test_component_slots(self):
+        with self.assertRaises(AttributeError):
+            self.manifest.components[0].invalid = True
+
     @patch("os.remove")
     @patch("builtins.open", mock_open())
     @patch("manifests.build_manifest.BuildManifest.from_path")
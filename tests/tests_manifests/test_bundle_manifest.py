@@ -50,6 +50,13 @@ class TestBundleManifest(unittest.TestCase):
         )
         self.assertEqual(opensearch_min_component.ref, "1.1")
 
+    def test_components_by_location(self):
+        component = self.manifest.components_by_location[
+            "artifacts/plugins/opensearch-job-scheduler-1.1.0.0.zip"
+        ]
+        self.assertEqual(component.name, "job-scheduler")
+        self.assertIs(self.manifest.components_by_name["job-scheduler"], component)
+
     def test_to_dict(self):
         data = self.manifest.to_dict()
         with open(self.manifest_filename) as f:
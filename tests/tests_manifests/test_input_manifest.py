@@ -43,6 +43,7 @@ class TestInputManifest(unittest.TestCase):
         self.assertEqual(manifest.build.name, "OpenSearch")
         self.assertEqual(manifest.build.version, "1.1.0")
         self.assertEqual(len(manifest.components), 15)
+        self.assertIs(manifest.components_by_name["OpenSearch"], manifest.components[0])
         # opensearch component
         opensearch_component = manifest.components[0]
         self.assertEqual(opensearch_component.name, "OpenSearch")
@@ -65,6 +66,29 @@ class TestInputManifest(unittest.TestCase):
         self.assertIsNone(alerting_component.checks[0].args)
         self.assertEqual(alerting_component.checks[1].args, "alerting")
 
+    def test_1_2_depends_on(self):
+        path = os.path.join(self.manifests_path, "1.2.0/opensearch-1.2.0.yml")
+        manifest = InputManifest.from_path(path)
+        opensearch_component = manifest.components[0]
+        self.assertIsNone(opensearch_component.depends_on)
+        alerting_component = next(
+            c for c in manifest.components if c.name == "alerting"
+        )
+        self.assertEqual(alerting_component.depends_on, ["common-utils"])
+        with open(path) as f:
+            self.assertEqual(yaml.safe_load(f), manifest.to_dict())
+
+    def test_invalid_depends_on(self):
+        data_path = os.path.join(os.path.dirname(__file__), "data")
+        manifest_path = os.path.join(data_path, "invalid-depends-on.yml")
+
+        with self.assertRaises(ValueError) as context:
+            InputManifest.from_path(manifest_path)
+        self.assertEqual(
+            "Invalid dependency of common-utils: job-scheduler is not a component",
+            str(context.exception),
+        )
+
     def test_to_dict(self):
         path = os.path.join(self.manifests_path, "1.1.0/opensearch-1.1.0.yml")
         manifest = InputManifest.from_path(path)
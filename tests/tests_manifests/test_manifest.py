@@ -7,9 +7,12 @@
 import os
 import tempfile
 import unittest
+from unittest.mock import patch
 
 import yaml
+from cerberus import Validator  # type:ignore
 
+from manifests.build_manifest import BuildManifest
 from manifests.manifest import Manifest
 
 
@@ -60,3 +63,46 @@ class TestManifest(unittest.TestCase):
             self.assertTrue(os.path.isfile(manifest_path))
             with open(output_path) as f:
                 self.assertEqual(yaml.safe_load(f), manifest.to_dict())
+
+    @patch("manifests.manifest.Validator", wraps=Validator)
+    def test_validator_is_cached(self, mock_validator):
+        class OtherManifest(TestManifest.SampleManifest):
+            pass
+
+        manifest_path = os.path.join(self.data_path, "min.yml")
+        OtherManifest.from_path(manifest_path)
+        OtherManifest.from_path(manifest_path)
+        mock_validator.assert_called_once_with(OtherManifest.SCHEMA)
+
+        with self.assertRaises(ValueError):
+            OtherManifest({"schema-version": "invalid"})
+        self.assertEqual(OtherManifest.from_path(manifest_path).version, "1.0")
+
+    def test_large_build_manifest(self):
+        maven = [f"maven/org/opensearch/artifact-{i}/1.1.0/artifact-{i}-1.1.0.jar" for i in range(20000)]
+        data = {
+            "schema-version": "1.0",
+            "build": {"name": "OpenSearch", "version": "1.1.0", "architecture": "x64", "id": "1"},
+            "components": [
+                {
+                    "name": "OpenSearch",
+                    "repository": "https://github.com/opensearch-project/OpenSearch.git",
+                    "ref": "1.x",
+                    "commit_id": "b7334f49d530ffd1a3f7bd0e5832b9b2a9caa583",
+                    "version": "1.1.0",
+                    "artifacts": {"maven": maven},
+                }
+            ],
+        }
+
+        with tempfile.TemporaryDirectory() as path:
+            manifest_path = os.path.join(path, "manifest.yml")
+            with open(manifest_path, "w") as f:
+                yaml.safe_dump(data, f)
+
+            manifest = BuildManifest.from_path(manifest_path)
+            self.assertEqual(len(manifest.artifacts_by_type["maven"]), 20000)
+
+            manifest.to_file(manifest_path)
+            with open(manifest_path) as f:
+                self.assertEqual(yaml.safe_load(f), data)
@@ -7,6 +7,7 @@
 import glob
 import os
 import unittest
+from unittest.mock import patch
 
 from manifests.build_manifest import BuildManifest
 from manifests.manifests import Manifests
@@ -54,3 +55,27 @@ class TestManifests(unittest.TestCase):
         versions = manifests.versions
         self.assertTrue("1.1.0" in versions)
         self.assertTrue("1.2.0" in versions)
+
+    def test_versions_do_not_load_manifests(self):
+        with patch.object(BuildManifest, "from_path") as mock_from_path:
+            manifests = TestManifests.WildcardManifests(
+                BuildManifest, "opensearch-build-*.yml"
+            )
+            self.assertTrue("1.1.0" in manifests.versions)
+            mock_from_path.assert_not_called()
+
+    def test_manifests_are_loaded_once(self):
+        manifests = TestManifests.WildcardManifests(
+            BuildManifest, "opensearch-build-*.yml"
+        )
+        with patch.object(
+            BuildManifest, "from_path", wraps=BuildManifest.from_path
+        ) as mock_from_path:
+            manifest = manifests["1.1.0"]
+            self.assertIs(manifests["1.1.0"], manifest)
+            self.assertIs(manifests.get("1.1.0"), manifest)
+            self.assertIsNone(manifests.get("0.0.0"))
+            mock_from_path.assert_called_once()
+        self.assertEqual(manifest.build.version, "1.1.0")
+        self.assertEqual(manifests.values()[0].build.version, "1.1.0")
+        self.assertEqual(manifests.items()[-1][1], manifests.latest)
@@ -50,6 +50,11 @@ class TestTestManifest(unittest.TestCase):
             component.bwc_test, {"test-configs": ["without-security"]}
         )
 
+    def test_components_by_name(self):
+        component = self.manifest.components_by_name["dashboards-reports"]
+        self.assertEqual(component.working_directory, "reports-scheduler")
+        self.assertIsNone(self.manifest.components_by_name.get("invalid-component"))
+
     def test_to_dict(self):
         data = self.manifest.to_dict()
         with open(self.manifest_filename) as f:
@@ -4,6 +4,7 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import os
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -58,3 +59,30 @@ class TestComponentOpenSearch(unittest.TestCase):
             ),
             "./gradlew properties -Dbuild.snapshot=false -Dopensearch.version=1.0",
         )
+
+    def test_gradle_cmd_maven_local(self):
+        self.assertEqual(
+            ComponentOpenSearch.gradle_cmd(
+                "properties", {"build.snapshot": "false"}, "/tmp/maven"
+            ),
+            "./gradlew properties -Dbuild.snapshot=false -Dmaven.repo.local=/tmp/maven",
+        )
+
+    def test_version_publishes_opensearch_min(self):
+        repo = MagicMock()
+        repo.output.return_value = "version=2.1"
+        opensearch_min = MagicMock(maven_local="/tmp/maven")
+        component = ComponentOpenSearch("common-utils", repo, "1.1.0", opensearch_min=opensearch_min)
+        self.assertEqual(component.version, "2.1")
+        opensearch_min.publish_to_maven_local.assert_called_once()
+        repo.output.assert_called_with(
+            "./gradlew properties -Dopensearch.version=1.1.0 -Dbuild.snapshot=false -Dmaven.repo.local=/tmp/maven"
+        )
+
+    def test_static_version(self):
+        repo = MagicMock(working_directory=os.path.join(os.path.dirname(__file__), "data", "static_version", "job-scheduler"))
+        opensearch_min = MagicMock()
+        component = ComponentOpenSearch("job-scheduler", repo, "1.3.0", opensearch_min=opensearch_min)
+        self.assertEqual(component.version, "1.3.0.0")
+        repo.output.assert_not_called()
+        opensearch_min.publish_to_maven_local.assert_not_called()
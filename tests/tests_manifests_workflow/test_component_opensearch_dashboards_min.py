@@ -14,18 +14,15 @@ from system.config_file import ConfigFile
 
 
 class TestComponentOpenSearchDashboardsMin(unittest.TestCase):
-    @patch("subprocess.check_output")
-    def test_branches(self, mock):
-        mock.return_value = "\n".join(
-            ["main", "1.x", "1.21", "20.1", "something", "else"]
-        ).encode()
+    @patch.object(GitRepository, "ls_remote")
+    def test_branches(self, mock_ls_remote):
+        mock_ls_remote.return_value = {
+            f"refs/heads/{branch}": "sha" for branch in ["main", "1.x", "1.21", "20.1", "something", "else"]
+        }
         self.assertEqual(
             ComponentOpenSearchDashboardsMin.branches(), ["main", "1.x", "1.21", "20.1"]
         )
-        mock.assert_called_with(
-            "git ls-remote https://github.com/opensearch-project/OpenSearch-Dashboards.git refs/heads/* | cut -f2 | cut -d/ -f3",
-            shell=True,
-        )
+        mock_ls_remote.assert_called_with("https://github.com/opensearch-project/OpenSearch-Dashboards.git", "refs/heads/*")
 
     @patch("os.makedirs")
     @patch.object(GitRepository, "__checkout__")
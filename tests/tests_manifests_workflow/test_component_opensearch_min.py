@@ -4,6 +4,7 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import os
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -12,18 +13,15 @@ from manifests_workflow.component_opensearch_min import ComponentOpenSearchMin
 
 
 class TestComponentOpenSearchMin(unittest.TestCase):
-    @patch("subprocess.check_output")
-    def test_branches(self, mock):
-        mock.return_value = "\n".join(
-            ["main", "1.x", "1.21", "20.1", "something", "else"]
-        ).encode()
+    @patch.object(GitRepository, "ls_remote")
+    def test_branches(self, mock_ls_remote):
+        mock_ls_remote.return_value = {
+            f"refs/heads/{branch}": "sha" for branch in ["main", "1.x", "1.21", "20.1", "something", "else"]
+        }
         self.assertEqual(
             ComponentOpenSearchMin.branches(), ["main", "1.x", "1.21", "20.1"]
         )
-        mock.assert_called_with(
-            "git ls-remote https://github.com/opensearch-project/OpenSearch.git refs/heads/* | cut -f2 | cut -d/ -f3",
-            shell=True,
-        )
+        mock_ls_remote.assert_called_with("https://github.com/opensearch-project/OpenSearch.git", "refs/heads/*")
 
     @patch("os.makedirs")
     @patch.object(GitRepository, "__checkout__")
@@ -31,6 +29,7 @@ class TestComponentOpenSearchMin(unittest.TestCase):
         component = ComponentOpenSearchMin.checkout("path")
         self.assertEqual(component.name, "OpenSearch")
         self.assertFalse(component.snapshot)
+        self.assertEqual(component.maven_local, os.path.realpath("path") + "-maven")
 
     def test_publish_to_maven_local(self):
         component = ComponentOpenSearchMin(MagicMock())
@@ -39,12 +38,40 @@ class TestComponentOpenSearchMin(unittest.TestCase):
             "./gradlew publishToMavenLocal -Dbuild.snapshot=false"
         )
 
+    def test_publish_to_isolated_maven_local(self):
+        repo = MagicMock()
+        repo.output.return_value = "version=2.1"
+        component = ComponentOpenSearchMin(repo, maven_local="/tmp/maven")
+        component.publish_to_maven_local()
+        component.git_repo.execute_silent.assert_called_with(
+            "./gradlew publishToMavenLocal -Dbuild.snapshot=false -Dmaven.repo.local=/tmp/maven"
+        )
+        self.assertEqual(component.properties.get_value("version"), "2.1")
+        component.git_repo.output.assert_called_with(
+            "./gradlew properties -Dbuild.snapshot=false -Dmaven.repo.local=/tmp/maven"
+        )
+
     def test_version(self):
         repo = MagicMock()
         repo.output.return_value = "version=2.1"
         component = ComponentOpenSearchMin(repo)
         self.assertEqual(component.version, "2.1")
 
+    def test_version_publishes_once(self):
+        repo = MagicMock()
+        repo.output.return_value = "version=2.1"
+        component = ComponentOpenSearchMin(repo)
+        self.assertEqual(component.version, "2.1")
+        self.assertEqual(component.version, "2.1")
+        repo.execute_silent.assert_called_once()
+
+    def test_static_version(self):
+        repo = MagicMock(working_directory=os.path.join(os.path.dirname(__file__), "data", "static_version", "OpenSearch"))
+        component = ComponentOpenSearchMin(repo)
+        self.assertEqual(component.version, "1.2.0")
+        repo.execute_silent.assert_not_called()
+        repo.output.assert_not_called()
+
     def test_properties(self):
         repo = MagicMock()
         repo.output.return_value = "version=2.1"
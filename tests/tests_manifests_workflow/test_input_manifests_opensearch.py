@@ -6,7 +6,7 @@
 
 import os
 import unittest
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 from manifests.input_manifest import InputManifest
 from manifests_workflow.input_manifests_opensearch import \
@@ -71,3 +71,10 @@ class TestInputManifestsOpenSearch(unittest.TestCase):
             ),
         ]
         mock_input_manifest().to_file.assert_has_calls(calls)
+        mock_component_opensearch.checkout.assert_called_with(
+            name="common-utils",
+            path=ANY,
+            opensearch_version=mock_input_manifest_from_path.return_value.build.version,
+            branch="main",
+            opensearch_min=None,
+        )
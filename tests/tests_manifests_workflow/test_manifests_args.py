@@ -46,3 +46,11 @@ class TestManifestsArgs(unittest.TestCase):
     @patch("argparse._sys.argv", [MANIFESTS_PY, "list", "--keep"])
     def test_keep_true(self):
         self.assertTrue(ManifestsArgs().keep)
+
+    @patch("argparse._sys.argv", [MANIFESTS_PY, "update"])
+    def test_parallel_default(self):
+        self.assertEqual(ManifestsArgs().parallel, 4)
+
+    @patch("argparse._sys.argv", [MANIFESTS_PY, "update", "--parallel", "2"])
+    def test_parallel(self):
+        self.assertEqual(ManifestsArgs().parallel, 2)
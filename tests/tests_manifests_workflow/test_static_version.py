@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+
+from manifests_workflow.static_version import StaticVersion
+
+
+class TestStaticVersion(unittest.TestCase):
+    DATA = os.path.join(os.path.dirname(__file__), "data", "static_version")
+
+    def __static_version(self, name):
+        return StaticVersion(os.path.join(self.DATA, name))
+
+    def test_opensearch(self):
+        self.assertEqual(self.__static_version("OpenSearch").opensearch(), "1.2.0")
+
+    def test_opensearch_snapshot(self):
+        self.assertEqual(self.__static_version("OpenSearch").opensearch(snapshot=True), "1.2.0-SNAPSHOT")
+
+    def test_opensearch_missing(self):
+        self.assertIsNone(self.__static_version("job-scheduler").opensearch())
+
+    def test_plugin_opensearch_build(self):
+        static_version = self.__static_version("index-management")
+        self.assertEqual(static_version.plugin("1.3.0"), "1.3.0.0")
+        self.assertEqual(static_version.plugin("1.3.0-SNAPSHOT", snapshot=True), "1.3.0.0-SNAPSHOT")
+
+    def test_plugin_opensearch_version_default(self):
+        self.assertEqual(self.__static_version("index-management").plugin(), "1.2.0.0")
+
+    def test_plugin_tokenize(self):
+        static_version = self.__static_version("job-scheduler")
+        self.assertEqual(static_version.plugin("1.3.0"), "1.3.0.0")
+        self.assertEqual(static_version.plugin("1.3.0", snapshot=True), "1.3.0.0-SNAPSHOT")
+
+    def test_plugin_gradle_properties(self):
+        self.assertEqual(self.__static_version("performance-analyzer").plugin("1.3.0"), "1.2.0.0")
+
+    def test_plugin_ambiguous(self):
+        self.assertIsNone(self.__static_version("ambiguous").plugin("1.3.0"))
+
+    def test_plugin_missing(self):
+        self.assertIsNone(self.__static_version("OpenSearch").plugin("1.3.0"))
@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import tempfile
+import unittest
+
+import yaml
+
+from sign_workflow.signature_state import SignatureState
+
+
+class TestSignatureState(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "signatures.yml")
+        self.artifact = os.path.join(self.temp_dir.name, "maven", "the-jar.jar")
+        os.makedirs(os.path.dirname(self.artifact))
+        self.__write(self.artifact, "jar")
+        self.__write(self.artifact + ".asc", "signature")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def __write(self, path, contents):
+        with open(path, "w") as f:
+            f.write(contents)
+
+    def test_not_signed(self):
+        state = SignatureState(self.path)
+        self.assertFalse(state.is_signed(self.artifact))
+
+    def test_record_and_write(self):
+        state = SignatureState(self.path)
+        state.record(self.artifact)
+        self.assertTrue(state.is_signed(self.artifact))
+        state.write()
+
+        with open(self.path) as f:
+            data = yaml.safe_load(f)
+        self.assertEqual(list(data.keys()), ["maven/the-jar.jar"])
+        self.assertEqual(set(data["maven/the-jar.jar"].keys()), {"sha256", "signature_sha256"})
+        self.assertTrue(SignatureState(self.path).is_signed(self.artifact))
+
+    def test_reset(self):
+        state = SignatureState(self.path)
+        state.record(self.artifact)
+        state.write()
+        self.assertFalse(SignatureState(self.path, reset=True).is_signed(self.artifact))
+
+    def test_changed_artifact(self):
+        state = SignatureState(self.path)
+        state.record(self.artifact)
+        self.__write(self.artifact, "changed")
+        self.assertFalse(state.is_signed(self.artifact))
+
+    def test_changed_signature(self):
+        state = SignatureState(self.path)
+        state.record(self.artifact)
+        self.__write(self.artifact + ".asc", "changed")
+        self.assertFalse(state.is_signed(self.artifact))
+
+    def test_missing_signature(self):
+        state = SignatureState(self.path)
+        state.record(self.artifact)
+        os.remove(self.artifact + ".asc")
+        self.assertFalse(state.is_signed(self.artifact))
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, call, patch
 
@@ -30,7 +32,7 @@ class TestSigner(unittest.TestCase):
         signer = Signer()
         signer.sign = MagicMock()
         signer.sign_artifacts(artifacts, "/path")
-        self.assertEqual(signer.sign.call_args_list, expected)
+        self.assertCountEqual(signer.sign.call_args_list, expected)
 
     @patch(
         "sign_workflow.signer.Signer.get_repo_url",
@@ -61,3 +63,146 @@ class TestSigner(unittest.TestCase):
                 )
             ]
         )
+
+    @patch("sign_workflow.signer.GitRepository")
+    def test_signer_verify_files(self, mock_repo):
+        signer = Signer()
+        signer.verify_files(["/path/the-jar.jar.asc", "/path/the-pom.pom.asc"])
+        mock_repo.assert_has_calls(
+            [call().execute("gpg --verify-files /path/the-jar.jar.asc /path/the-pom.pom.asc")]
+        )
+
+    @patch("sign_workflow.signer.GitRepository")
+    def test_sign_artifacts_verifies_in_batches(self, mock_repo):
+        signer = Signer(parallel=2)
+        signer.VERIFY_BATCH_SIZE = 2
+        signer.sign = MagicMock()
+        signer.verify_files = MagicMock()
+        signer.sign_artifacts(["a.jar", "b.jar", "c.jar"], "/path")
+
+        self.assertEqual(signer.sign.call_count, 3)
+        self.assertEqual(signer.verify_files.call_count, 2)
+        verified = [signature for args in signer.verify_files.call_args_list for signature in args[0][0]]
+        self.assertCountEqual(verified, ["/path/a.jar.asc", "/path/b.jar.asc", "/path/c.jar.asc"])
+
+    @patch("sign_workflow.signer.GitRepository")
+    def test_sign_artifacts_sign_failure(self, mock_repo):
+        signer = Signer(parallel=1)
+        signer.sign = MagicMock(side_effect=[None, ValueError("signing failed"), None])
+        signer.verify_files = MagicMock()
+
+        with self.assertRaises(Signer.SigningError) as ctx:
+            signer.sign_artifacts(["a.jar", "b.jar", "c.jar"], "/path")
+
+        self.assertEqual(list(ctx.exception.failures.keys()), ["/path/b.jar"])
+        self.assertIn("/path/b.jar: signing failed", str(ctx.exception))
+        # no artifacts are signed after a failure
+        self.assertEqual(signer.sign.call_count, 2)
+
+    @patch("sign_workflow.signer.GitRepository")
+    def test_sign_artifacts_verify_failure(self, mock_repo):
+        signer = Signer()
+        signer.sign = MagicMock()
+        signer.verify_files = MagicMock(side_effect=ValueError("batch failed"))
+        signer.verify = MagicMock(side_effect=lambda signature: signature.endswith("b.jar.asc") and signer.fail())
+        signer.fail = MagicMock(side_effect=ValueError("bad signature"))
+
+        with self.assertRaises(Signer.SigningError) as ctx:
+            signer.sign_artifacts(["a.jar", "b.jar", "c.jar"], "/path")
+
+        self.assertEqual(list(ctx.exception.failures.keys()), ["/path/b.jar.asc"])
+        self.assertEqual(signer.verify.call_count, 3)
+
+    @patch("sign_workflow.signer.GitRepository")
+    def test_sign_artifacts_state(self, mock_repo):
+        state = MagicMock()
+        state.is_signed.side_effect = lambda location: location == "/path/a.jar"
+        signer = Signer()
+        signer.sign = MagicMock()
+        signer.verify_files = MagicMock()
+        signer.sign_artifacts(["a.jar", "b.jar"], "/path", state)
+
+        signer.sign.assert_called_once_with("/path/b.jar")
+        signer.verify_files.assert_called_once_with(["/path/b.jar.asc"])
+        state.record.assert_called_once_with("/path/b.jar")
+        state.write.assert_called_once_with()
+
+    @patch("sign_workflow.signer.GitRepository")
+    def test_sign_artifacts_state_written_on_failure(self, mock_repo):
+        state = MagicMock()
+        state.is_signed.return_value = False
+        signer = Signer(parallel=1)
+        signer.sign = MagicMock(side_effect=[None, ValueError("signing failed")])
+        signer.verify_files = MagicMock()
+
+        with self.assertRaises(Signer.SigningError):
+            signer.sign_artifacts(["a.jar", "b.jar"], "/path", state)
+
+        state.record.assert_called_once_with("/path/a.jar")
+        state.write.assert_called_once_with()
+
+    def __mock_checkout(self, mock_repo):
+        def checkout(url, ref, directory, working_subdirectory):
+            os.makedirs(directory)
+            return mock_repo.return_value
+
+        mock_repo.side_effect = checkout
+        mock_repo.ls_remote.return_value = {"HEAD": "abc123"}
+
+    @patch("sign_workflow.signer.GitRepository")
+    def test_signer_cache(self, mock_repo):
+        self.__mock_checkout(mock_repo)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client_dir = os.path.join(cache_dir, "abc123")
+            signer = Signer(cache_dir=cache_dir)
+
+            mock_repo.ls_remote.assert_called_with("https://github.com/opensearch-project/opensearch-signer-client.git", "HEAD")
+            mock_repo.assert_called_once_with(
+                "https://github.com/opensearch-project/opensearch-signer-client.git",
+                "abc123",
+                directory=client_dir,
+                working_subdirectory="src",
+            )
+            mock_repo.return_value.execute_silent.assert_called_once_with("git remote remove origin", client_dir)
+            mock_repo.return_value.execute.assert_has_calls([call("./bootstrap"), call("rm config.cfg")])
+            self.assertEqual(signer.git_repo, mock_repo.return_value)
+            self.assertTrue(os.path.isfile(os.path.join(client_dir, ".bootstrapped")))
+
+            mock_repo.reset_mock()
+            signer = Signer(cache_dir=cache_dir)
+
+            mock_repo.assert_not_called()
+            mock_repo.from_directory.assert_called_once_with(
+                "https://github.com/opensearch-project/opensearch-signer-client.git", client_dir, working_subdirectory="src"
+            )
+            self.assertEqual(signer.git_repo, mock_repo.from_directory.return_value)
+
+    @patch.dict(os.environ, {"GITHUB_TOKEN": "token"})
+    @patch("git.git_repository.ProcessRunner.output", return_value="abc123\tHEAD\n")
+    @patch("sign_workflow.signer.GitRepository.from_directory")
+    def test_signer_cache_github_token(self, mock_from_directory, mock_output):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            os.makedirs(os.path.join(cache_dir, "abc123"))
+            open(os.path.join(cache_dir, "abc123", ".bootstrapped"), "w").close()
+            Signer(cache_dir=cache_dir)
+
+        mock_output.assert_called_with(
+            ["git", "ls-remote", "https://token@github.com/opensearch-project/opensearch-signer-client.git", "HEAD"], timeout=60
+        )
+
+    @patch("sign_workflow.signer.GitRepository")
+    def test_signer_cache_failed_bootstrap(self, mock_repo):
+        self.__mock_checkout(mock_repo)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client_dir = os.path.join(cache_dir, "abc123")
+            mock_repo.return_value.execute.side_effect = ValueError("bootstrap failed")
+            with self.assertRaises(ValueError):
+                Signer(cache_dir=cache_dir)
+            self.assertFalse(os.path.isfile(os.path.join(client_dir, ".bootstrapped")))
+
+            # the partial client is removed and bootstrapped again
+            mock_repo.return_value.execute.side_effect = None
+            Signer(cache_dir=cache_dir)
+            self.assertEqual(mock_repo.call_count, 2)
+            self.assertEqual(os.listdir(client_dir), [".bootstrapped"])
+            mock_repo.from_directory.assert_not_called()
@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import errno
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from system.copy_file import copy_file
+
+
+class TestCopyFile(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.temp_dir.name, "source.jar")
+        self.dest = os.path.join(self.temp_dir.name, "dest.jar")
+        with open(self.source, "w") as f:
+            f.write("contents")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def __read(self, path):
+        with open(path) as f:
+            return f.read()
+
+    def test_copy(self):
+        self.assertEqual(copy_file(self.source, self.dest), "copy")
+        self.assertEqual(self.__read(self.dest), "contents")
+        self.assertNotEqual(os.stat(self.source).st_ino, os.stat(self.dest).st_ino)
+
+    def test_link(self):
+        self.assertEqual(copy_file(self.source, self.dest, link=True), "link")
+        self.assertEqual(self.__read(self.dest), "contents")
+        self.assertEqual(os.stat(self.source).st_ino, os.stat(self.dest).st_ino)
+
+    def test_link_replaces_existing(self):
+        with open(self.dest, "w") as f:
+            f.write("old")
+        self.assertEqual(copy_file(self.source, self.dest, link=True), "link")
+        self.assertEqual(self.__read(self.dest), "contents")
+
+    @patch("os.link", side_effect=OSError(errno.EXDEV, "Invalid cross-device link"))
+    def test_link_across_devices(self, *mocks):
+        method = copy_file(self.source, self.dest, link=True)
+        self.assertIn(method, ["clone", "copy"])
+        self.assertEqual(self.__read(self.dest), "contents")
+
+    @patch("os.link", side_effect=OSError(errno.EXDEV, "Invalid cross-device link"))
+    @patch("system.copy_file._clone", return_value=False)
+    def test_link_falls_back_to_copy(self, *mocks):
+        self.assertEqual(copy_file(self.source, self.dest, link=True), "copy")
+        self.assertEqual(self.__read(self.dest), "contents")
+
+    @patch("os.link", side_effect=OSError(errno.ENOENT, "No such file or directory"))
+    def test_link_error(self, *mocks):
+        with self.assertRaises(OSError):
+            copy_file(self.source, self.dest, link=True)
@@ -4,10 +4,14 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import io
+import os
 import subprocess
+import tempfile
 import unittest
+from unittest.mock import patch
 
-from system.execute import execute
+from system.execute import StreamedOutput, execute, execute_streaming
 
 
 class TestExecute(unittest.TestCase):
@@ -43,8 +47,94 @@ class TestExecute(unittest.TestCase):
         self.assertEqual(stdout.strip(), "success")
         self.assertEqual(stderr.strip(), "")
 
+    def test_execute_timeout(self):
+        with self.assertRaises(subprocess.TimeoutExpired):
+            execute("sleep 60", "/", timeout=0.5)
+
     def test_execute_stderr(self):
         (status, stdout, stderr) = execute(">&2 echo error", "/")  # (0, '', 'error\n')
         self.assertEqual(status, 0)
         self.assertEqual(stdout.strip(), "")
         self.assertEqual(stderr.strip(), "error")
+
+
+class TestExecuteStreaming(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = os.path.join(self.temp_dir.name, "output")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def __read(self, path):
+        with open(path, "r") as f:
+            return f.read()
+
+    def test_execute_streaming(self):
+        (status, stdout, stderr) = execute_streaming(
+            "echo output && >&2 echo error", "/", self.output_dir, console=False
+        )
+        self.assertEqual(status, 0)
+        self.assertEqual(stdout.tail, "output\n")
+        self.assertEqual(stderr.tail, "error\n")
+        self.assertEqual(stdout.paths, [os.path.join(self.output_dir, "stdout.txt")])
+        self.assertEqual(self.__read(stdout.path), "output\n")
+        self.assertEqual(self.__read(stderr.path), "error\n")
+
+    def test_execute_streaming_console(self):
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            execute_streaming("echo output", "/", self.output_dir)
+        self.assertEqual(mock_stdout.getvalue(), "output\n")
+
+    def test_execute_streaming_raise(self):
+        with self.assertRaises(subprocess.CalledProcessError) as context:
+            execute_streaming("echo output && exit 128", "/", self.output_dir, console=False)
+        self.assertEqual(
+            "Command 'echo output && exit 128' returned non-zero exit status 128.",
+            str(context.exception),
+        )
+        self.assertEqual(context.exception.stdout, "output\n")
+
+    def test_execute_streaming_status(self):
+        (status, stdout, stderr) = execute_streaming("exit 3", "/", self.output_dir, False, console=False)
+        self.assertEqual(status, 3)
+        self.assertEqual(stdout.tail, "")
+
+    def test_execute_streaming_bounded(self):
+        (status, stdout, stderr) = execute_streaming(
+            "seq 1 10000", "/", self.output_dir, console=False, tail_lines=3, max_bytes=10000, backup_count=2
+        )
+        self.assertEqual(stdout.tail, "9998\n9999\n10000\n")
+        self.assertEqual(len(stdout.paths), 3)
+        for path in stdout.paths:
+            self.assertLessEqual(os.path.getsize(path), 10000)
+        # the oldest lines were rotated out, the rest is in order
+        lines = "".join(self.__read(path) for path in stdout.paths).split()
+        self.assertEqual(lines[-1], "10000")
+        self.assertEqual([int(line) for line in lines], list(range(int(lines[0]), 10001)))
+
+
+class TestStreamedOutput(unittest.TestCase):
+    def test_rotate(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = StreamedOutput(os.path.join(temp_dir, "stdout.txt"), tail_lines=2, max_bytes=4, backup_count=1)
+            for line in ["one\n", "two\n", "three\n"]:
+                output.write(line)
+            output.close()
+            self.assertEqual(output.tail, "two\nthree\n")
+            self.assertEqual(output.paths, [os.path.join(temp_dir, "stdout.txt.1"), os.path.join(temp_dir, "stdout.txt")])
+            with open(output.paths[0], "r") as f:
+                self.assertEqual(f.read(), "two\n")
+
+    def test_rotate_counts_bytes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = StreamedOutput(os.path.join(temp_dir, "stdout.txt"), max_bytes=6, backup_count=1)
+            # 3 characters, but 6 bytes
+            for line in ["é€\n", "a\n"]:
+                output.write(line)
+            output.close()
+            with open(output.paths[0], "r") as f:
+                self.assertEqual(f.read(), "é€\n")
+            with open(output.paths[1], "r") as f:
+                self.assertEqual(f.read(), "a\n")
+            self.assertEqual(output.size, 2)
@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import tempfile
+import threading
+import unittest
+
+from system.file_lock import FileLock
+
+
+class TestFileLock(unittest.TestCase):
+    def test_lock(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "subdir", "file.lock")
+            with FileLock(path) as locked:
+                self.assertEqual(locked, path)
+                self.assertTrue(os.path.isfile(path))
+            self.assertTrue(os.path.isfile(path))
+
+    def test_lock_is_exclusive(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "file.lock")
+            events = []
+
+            def locker():
+                with FileLock(path):
+                    events.append("thread")
+
+            with FileLock(path):
+                thread = threading.Thread(target=locker)
+                thread.start()
+                thread.join(0.5)
+                events.append("main")
+            thread.join()
+
+            self.assertEqual(events, ["main", "thread"])
@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import gzip
+import os
+import tarfile
+import tempfile
+import unittest
+
+from system.parallel_gzip import ParallelGzipFile
+
+
+class TestParallelGzipFile(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "file.gz")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_write_blocks(self):
+        data = os.urandom(1000) * 100
+        with ParallelGzipFile(self.path, block_size=4096, workers=2) as f:
+            f.write(data[:50000])
+            f.write(data[50000:])
+
+        with gzip.open(self.path) as f:
+            self.assertEqual(f.read(), data)
+
+    def test_write_empty(self):
+        with ParallelGzipFile(self.path):
+            pass
+
+        with gzip.open(self.path) as f:
+            self.assertEqual(f.read(), b"")
+
+    def test_compresslevel(self):
+        data = b"opensearch" * 100000
+        fast = os.path.join(self.temp_dir.name, "fast.gz")
+        with ParallelGzipFile(fast, compresslevel=1) as f:
+            f.write(data)
+        with ParallelGzipFile(self.path, compresslevel=9) as f:
+            f.write(data)
+
+        self.assertGreater(os.path.getsize(fast), os.path.getsize(self.path))
+
+    def test_tar(self):
+        source = os.path.join(self.temp_dir.name, "bundle")
+        os.makedirs(os.path.join(source, "bin"))
+        with open(os.path.join(source, "bin", "opensearch"), "w") as f:
+            f.write("#!/bin/bash")
+
+        with ParallelGzipFile(self.path, block_size=1024) as gz:
+            with tarfile.open(fileobj=gz, mode="w|") as tar:
+                tar.add(source, arcname="bundle")
+
+        with tarfile.open(self.path) as tar:
+            self.assertEqual(sorted(tar.getnames()), ["bundle", "bundle/bin", "bundle/bin/opensearch"])
+            self.assertEqual(tar.extractfile("bundle/bin/opensearch").read(), b"#!/bin/bash")
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from system.process_runner import ProcessRunner
+
+
+class TestProcessRunner(unittest.TestCase):
+    def test_run(self):
+        (status, stdout, stderr) = ProcessRunner.run("echo output && >&2 echo error", "/", stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        self.assertEqual(status, 0)
+        self.assertEqual(stdout, "output\n")
+        self.assertEqual(stderr, "error\n")
+
+    def test_run_check(self):
+        with self.assertRaises(subprocess.CalledProcessError) as context:
+            ProcessRunner.run("exit 3")
+        self.assertEqual(context.exception.returncode, 3)
+        self.assertEqual(ProcessRunner.run("exit 3", check=False), (3, None, None))
+
+    def test_call(self):
+        self.assertEqual(ProcessRunner.call(["true"]), 0)
+
+    def test_output(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertEqual(ProcessRunner.output("pwd", temp_dir).strip(), os.path.realpath(temp_dir))
+
+    def test_measurement(self):
+        runner = ProcessRunner([sys.executable, "-c", "data = bytearray(64 * 1024 * 1024); sum(range(10 ** 6))"])
+        self.assertEqual(runner.wait(), 0)
+        measurement = runner.measurement
+        self.assertEqual(measurement.returncode, 0)
+        self.assertFalse(measurement.timed_out)
+        self.assertGreater(measurement.wall_time, 0)
+        self.assertGreater(measurement.cpu_time, 0)
+        self.assertGreater(measurement.max_rss, 64 * 1024 * 1024)
+        self.assertEqual(measurement.to_dict()["command"], f"{sys.executable} -c {runner.command[2]}")
+
+    def test_timeout_kills_process_group(self):
+        start = time.monotonic()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            # the background sleep holds stdout open, reading it would block if it were not killed with the group
+            ProcessRunner.run("sleep 60 & sleep 60", timeout=0.5, stdout=subprocess.PIPE)
+        self.assertLess(time.monotonic() - start, 30)
+
+    @patch.dict(os.environ, {ProcessRunner.PROCESS_TIMEOUT: "0.5"})
+    def test_default_timeout(self):
+        runner = ProcessRunner("sleep 60")
+        self.assertEqual(runner.timeout, 0.5)
+        with self.assertRaises(subprocess.TimeoutExpired):
+            runner.wait()
+        self.assertTrue(runner.measurement.timed_out)
+        self.assertEqual(runner.returncode, -9)
+
+    @patch.dict(os.environ, {ProcessRunner.PROCESS_TIMEOUT: "0.2"})
+    def test_no_timeout(self):
+        runner = ProcessRunner("sleep 0.5", timeout=0)
+        self.assertEqual(runner.wait(), 0)
+        self.assertFalse(runner.measurement.timed_out)
+
+    def test_wait_timeout(self):
+        runner = ProcessRunner("sleep 60")
+        with self.assertRaises(subprocess.TimeoutExpired):
+            runner.wait(0.2)
+        self.assertIsNone(runner.measurement)
+        runner.kill()
+        self.assertEqual(runner.wait(), -9)
+
+    def test_terminate(self):
+        runner = ProcessRunner("sleep 60")
+        self.assertEqual(runner.terminate(), -15)
+
+    def test_terminate_kills(self):
+        # SIGTERM is ignored by the shell and inherited as ignored by sleep
+        runner = ProcessRunner("trap '' TERM; while true; do sleep 0.1; done")
+        time.sleep(0.2)
+        self.assertEqual(runner.terminate(0.5), -9)
+
+    def test_gradlew(self):
+        with patch.dict(os.environ, {ProcessRunner.PROCESS_REPORT_PATH: ""}):
+            self.assertEqual(ProcessRunner.gradlew(), "./gradlew")
+        with patch.dict(os.environ, {ProcessRunner.PROCESS_REPORT_PATH: "processes.jsonl"}):
+            self.assertEqual(ProcessRunner.gradlew(), "./gradlew --no-daemon")
+
+    def test_report(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "processes.jsonl")
+            with patch.dict(os.environ, {ProcessRunner.PROCESS_REPORT_PATH: path}):
+                ProcessRunner.call("true", temp_dir)
+                ProcessRunner.call("exit 1", temp_dir, check=False)
+            with open(path, "r") as f:
+                measurements = [json.loads(line) for line in f]
+        self.assertEqual([measurement["command"] for measurement in measurements], ["true", "exit 1"])
+        self.assertEqual([measurement["returncode"] for measurement in measurements], [0, 1])
+        self.assertEqual(measurements[0]["cwd"], temp_dir)
+        self.assertEqual(
+            sorted(measurements[0].keys()), ["command", "cpu_time", "cwd", "max_rss", "returncode", "timed_out", "wall_time"]
+        )
@@ -5,6 +5,7 @@
 # compatible open source license.
 
 import os
+import shutil
 import unittest
 from unittest.mock import MagicMock, call, patch
 
@@ -32,8 +33,9 @@ class TestBwcSuite(unittest.TestCase):
 
     def test_run_bwctest(self):
         response = self.bwc_test_suite.run_tests(".", self.manifest.components[1].name)
+        self.addCleanup(shutil.rmtree, "bwc-test-output")
         # could find the script but the script exited because `./gradlew` doesn't exist
-        self.assertTrue("default/bwctest.sh" in response[2])  # stderr
+        self.assertTrue("default/bwctest.sh" in response[2].tail)  # stderr
 
     @patch("test_workflow.bwc_test.bwc_test_suite.TestComponent")
     def test_component_bwctest(self, test_component_mock):
@@ -6,7 +6,7 @@
 
 import os
 import unittest
-from unittest.mock import call, patch
+from unittest.mock import MagicMock, call, patch
 
 from git.git_repository import GitRepository
 from manifests.build_manifest import BuildManifest
@@ -31,7 +31,7 @@ class TestIntegSuite(unittest.TestCase):
     @patch.object(DependencyInstaller, "install_build_dependencies")
     @patch("os.path.exists", return_value=True)
     @patch.object(ScriptFinder, "find_integ_test_script")
-    @patch("test_workflow.integ_test.integ_test_suite.execute")
+    @patch("test_workflow.integ_test.integ_test_suite.execute_streaming")
     @patch("test_workflow.integ_test.integ_test_suite.LocalTestCluster")
     @patch("test_workflow.test_recorder.test_recorder.TestRecorder")
     def test_execute_with_multiple_test_configs(
@@ -49,7 +49,7 @@ class TestIntegSuite(unittest.TestCase):
             "s3_bucket_name",
             mock_test_recorder
         )
-        mock_system_execute.return_value = 200, "success", "failure"
+        mock_system_execute.return_value = 200, MagicMock(tail="success"), MagicMock(tail="failure")
         mock_local_test_cluster.create().__enter__.return_value = "localhost", "9200"
         mock_script_finder.return_value = "integtest.sh"
         test_results = integ_test_suite.execute()
@@ -60,13 +60,13 @@ class TestIntegSuite(unittest.TestCase):
                 call(
                     "integtest.sh -b localhost -p 9200 -s true -v 1.1.0",
                     "/tmpdir/job-scheduler",
-                    True,
+                    "/tmpdir/integ-test-output/job-scheduler/with-security",
                     False,
                 ),
                 call(
                     "integtest.sh -b localhost -p 9200 -s false -v 1.1.0",
                     "/tmpdir/job-scheduler",
-                    True,
+                    "/tmpdir/integ-test-output/job-scheduler/without-security",
                     False,
                 )
             ]
@@ -183,7 +183,7 @@ class TestIntegSuite(unittest.TestCase):
     @patch.object(DependencyInstaller, "install_build_dependencies")
     @patch("os.path.exists", return_value=True)
     @patch.object(ScriptFinder, "find_integ_test_script")
-    @patch("test_workflow.integ_test.integ_test_suite.execute")
+    @patch("test_workflow.integ_test.integ_test_suite.execute_streaming")
     @patch("test_workflow.integ_test.integ_test_suite.LocalTestCluster")
     @patch("test_workflow.test_recorder.test_recorder.TestRecorder")
     def test_execute_with_working_directory(
@@ -201,7 +201,7 @@ class TestIntegSuite(unittest.TestCase):
             "s3_bucket_name",
             mock_test_recorder
         )
-        mock_system_execute.return_value = 200, "success", "failure"
+        mock_system_execute.return_value = 200, MagicMock(tail="success"), MagicMock(tail="failure")
         mock_local_test_cluster.create().__enter__.return_value = "localhost", "9200"
         mock_script_finder.return_value = "integtest.sh"
         integ_test_suite.execute()
@@ -6,7 +6,6 @@
 
 import os
 import subprocess
-import sys
 import tempfile
 import unittest
 from unittest.mock import MagicMock, call, mock_open, patch
@@ -15,6 +14,8 @@ import requests
 import yaml
 
 from manifests.bundle_manifest import BundleManifest
+from system.execute import StreamedOutput
+from system.process_runner import ProcessRunner
 from test_workflow.integ_test.local_test_cluster import LocalTestCluster
 from test_workflow.test_cluster import ClusterCreationException
 
@@ -52,44 +53,33 @@ class LocalTestClusterTests(unittest.TestCase):
             self.text = text
             self.status_code = status_code
 
-    class MockProcess:
-        def __init__(self, pid):
-            self.pid = pid
-
-        def children(self, recursive):
-            return []
-
     def __mock_response(*args, **kwargs):
         if args[0] == "https://localhost:9200/_cluster/health":
             return LocalTestClusterTests.MockResponse({"status": "green"}, 200)
         else:
             return LocalTestClusterTests.MockResponse({"status": "red"}, 404)
 
-    def __mock_process(*args, **kwargs):
-        return LocalTestClusterTests.MockProcess(12)
-
     def __get_process(self):
-        return subprocess.Popen(
-            (sys.executable, "-c", "pass"),
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        return MagicMock(spec=ProcessRunner, pid=12)
 
-    @patch("subprocess.Popen")
+    @patch("test_workflow.integ_test.local_test_cluster.ProcessRunner")
     @patch("yaml.dump")
     @patch("builtins.open", mock_open())
-    def test_create_cluster(self, *mocks):
+    def test_create_cluster(self, mock_dump, mock_process_runner):
         self.local_test_cluster.download = MagicMock()
         self.local_test_cluster.wait_for_service = MagicMock()
         self.local_test_cluster.create_cluster()
-        subprocess.Popen.assert_called_with(
+        mock_process_runner.assert_called_with(
             "./opensearch-tar-install.sh",
-            cwd=f"opensearch-{self.manifest.build.version}",
-            shell=True,
-            stdout=self.local_test_cluster.stdout,
-            stderr=self.local_test_cluster.stderr,
+            f"opensearch-{self.manifest.build.version}",
+            0,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
         )
+        self.assertEqual(self.local_test_cluster.stdout.path, os.path.join(self.local_test_cluster.work_dir, "stdout.txt"))
+        self.assertEqual(self.local_test_cluster.stderr.path, os.path.join(self.local_test_cluster.work_dir, "stderr.txt"))
         yaml.dump.assert_called_once_with(
             {"script.context.field.max_compilations_rate": "1000/1m"}
         )
@@ -107,9 +97,9 @@ class LocalTestClusterTests(unittest.TestCase):
         )
 
     @patch("os.chdir")
-    @patch("subprocess.check_call")
+    @patch.object(ProcessRunner, "call")
     @patch("test_workflow.integ_test.local_test_cluster.S3Bucket")
-    def test_download(self, mock_s3_bucket, *mocks):
+    def test_download(self, mock_s3_bucket, mock_call, *mocks):
         s3_bucket = mock_s3_bucket.return_value
         s3_path = BundleManifest.get_tarball_relative_location(
             self.manifest.build.id,
@@ -123,9 +113,7 @@ class LocalTestClusterTests(unittest.TestCase):
         self.local_test_cluster.download()
         os.chdir.assert_called_once_with(work_dir_path)
         s3_bucket.download_file.assert_called_once_with(s3_path, work_dir_path)
-        subprocess.check_call.assert_called_once_with(
-            f"tar -xzf {bundle_name}", shell=True
-        )
+        mock_call.assert_called_once_with(f"tar -xzf {bundle_name}")
 
     @patch("requests.get", side_effect=__mock_response)
     def test_wait_for_service(self, mock_requests):
@@ -162,48 +150,27 @@ class LocalTestClusterTests(unittest.TestCase):
             "Cluster is not available after 10 attempts",
         )
 
-    @patch("test_workflow.integ_test.local_test_cluster.psutil.Process", side_effect=__mock_process)
-    @patch("test_workflow.integ_test.local_test_cluster.subprocess.Popen.wait")
-    @patch("test_workflow.integ_test.local_test_cluster.subprocess.Popen.terminate")
     @patch("test_workflow.integ_test.local_test_cluster.logging", return_value=MagicMock())
-    def test_terminate_process(self, mock_logging, mock_terminate, mock_wait, mock_process):
-        self.local_test_cluster.stdout = tempfile.NamedTemporaryFile(dir=self.local_test_cluster.work_dir)
-        self.local_test_cluster.stderr = tempfile.NamedTemporaryFile(dir=self.local_test_cluster.work_dir)
+    def test_terminate_process(self, mock_logging):
+        self.local_test_cluster.stdout = StreamedOutput(os.path.join(self.local_test_cluster.work_dir, "stdout.txt"))
+        self.local_test_cluster.stderr = StreamedOutput(os.path.join(self.local_test_cluster.work_dir, "stderr.txt"))
         self.local_test_cluster.process = self.process
         self.local_test_cluster.terminate_process()
-        mock_process.assert_called_once_with(self.process.pid)
-        mock_terminate.assert_called_once()
-        mock_wait.assert_called_once_with(10)
-        mock_logging.info.assert_has_calls(
-            [
-                call(f"Sending SIGTERM to PID {self.process.pid}"),
-                call("Waiting for process to terminate"),
-                call("Process terminated with exit code 0"),
-            ]
-        )
-        mock_logging.debug.assert_has_calls([call("Checking for child processes")])
+        self.process.terminate.assert_called_once_with(10)
+        self.assertEqual(self.local_test_cluster.return_code, 0)
+        self.assertIs(self.local_test_cluster.local_cluster_stdout, self.local_test_cluster.stdout)
+        self.assertIs(self.local_test_cluster.local_cluster_stderr, self.local_test_cluster.stderr)
+        self.assertTrue(self.local_test_cluster.stdout.file.closed)
+        self.assertIsNone(self.local_test_cluster.process)
+        mock_logging.info.assert_has_calls([call("Process terminated with exit code 0")])
 
-    @patch("test_workflow.integ_test.local_test_cluster.psutil.Process", side_effect=__mock_process)
-    @patch("test_workflow.integ_test.local_test_cluster.subprocess.Popen.wait")
-    @patch("test_workflow.integ_test.local_test_cluster.subprocess.Popen.terminate")
     @patch("test_workflow.integ_test.local_test_cluster.logging", return_value=MagicMock())
-    def test_terminate_process_timeout(self, mock_logging, mock_terminate, mock_wait, mock_process):
-        self.local_test_cluster.stdout = tempfile.NamedTemporaryFile(dir=self.local_test_cluster.work_dir)
-        self.local_test_cluster.stderr = tempfile.NamedTemporaryFile(dir=self.local_test_cluster.work_dir)
-        mock_wait.side_effect = subprocess.TimeoutExpired(cmd="pass", timeout=1)
+    def test_terminate_process_timeout(self, mock_logging):
+        self.local_test_cluster.stdout = StreamedOutput(os.path.join(self.local_test_cluster.work_dir, "stdout.txt"))
+        self.local_test_cluster.stderr = StreamedOutput(os.path.join(self.local_test_cluster.work_dir, "stderr.txt"))
+        self.process.terminate.side_effect = subprocess.TimeoutExpired(cmd="pass", timeout=10)
         with self.assertRaises(subprocess.TimeoutExpired):
             self.local_test_cluster.process = self.process
             self.local_test_cluster.terminate_process()
-        mock_process.assert_called_once_with(self.process.pid)
-        mock_terminate.assert_called_once()
-        mock_wait.assert_called_with(10)
-        mock_logging.info.assert_has_calls(
-            [
-                call(f"Sending SIGTERM to PID {self.process.pid}"),
-                call("Waiting for process to terminate"),
-                call("Process did not terminate after 10 seconds. Sending SIGKILL"),
-                call("Waiting for process to terminate"),
-                call("Process failed to terminate even after SIGKILL"),
-                call("Process terminated with exit code 0"),
-            ]
-        )
+        self.assertIsNone(self.local_test_cluster.process)
+        mock_logging.info.assert_has_calls([call("Process terminated with exit code 0")])
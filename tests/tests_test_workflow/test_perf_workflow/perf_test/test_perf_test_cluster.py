@@ -9,6 +9,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from manifests.bundle_manifest import BundleManifest
+from system.process_runner import ProcessRunner
 from test_workflow.perf_test.perf_test_cluster import PerfTestCluster
 
 
@@ -41,7 +42,7 @@ class TestPerfTestCluster(unittest.TestCase):
     def test_create(self):
         mock_file = MagicMock(side_effect=[{"stack": {"PrivateIp": "10.10.10.10"}}])
         with patch("test_workflow.perf_test.perf_test_cluster.os.chdir") as mock_chdir:
-            with patch("subprocess.check_call") as mock_check_call:
+            with patch.object(ProcessRunner, "call") as mock_check_call:
                 with patch("builtins.open", MagicMock()):
                     with patch("json.load", mock_file):
                         self.perf_test_cluster.create_cluster()
@@ -58,7 +59,7 @@ class TestPerfTestCluster(unittest.TestCase):
 
     def test_destroy(self):
         with patch("test_workflow.perf_test.perf_test_cluster.os.chdir") as mock_chdir:
-            with patch("subprocess.check_call") as mock_check_call:
+            with patch.object(ProcessRunner, "call") as mock_check_call:
                 self.perf_test_cluster.destroy()
                 mock_chdir.assert_called_once_with("current_workspace/opensearch-cluster/cdk/single-node/")
                 self.assertEqual(mock_check_call.call_count, 1)
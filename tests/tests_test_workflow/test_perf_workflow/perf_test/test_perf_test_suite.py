@@ -9,6 +9,7 @@ import unittest
 from unittest.mock import patch
 
 from manifests.bundle_manifest import BundleManifest
+from system.process_runner import ProcessRunner
 from test_workflow.perf_test.perf_test_suite import PerfTestSuite
 
 
@@ -29,6 +30,6 @@ class TestPerfTestSuite(unittest.TestCase):
 
     def test_execute(self):
         with patch("test_workflow.perf_test.perf_test_suite.os.chdir"):
-            with patch("subprocess.check_call") as mock_check_call:
+            with patch.object(ProcessRunner, "call") as mock_check_call:
                 self.perf_test_suite.execute()
                 self.assertEqual(mock_check_call.call_count, 3)
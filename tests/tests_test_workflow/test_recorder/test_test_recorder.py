@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from system.execute import StreamedOutput
+from test_workflow.test_recorder import test_recorder, test_result_data
+
+
+class TestTestRecorder(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.output_dir = os.path.join(self.temp_dir.name, "output")
+        os.makedirs(self.output_dir)
+        self.test_recorder = test_recorder.TestRecorder("1234", "integ-test", self.temp_dir.name)
+
+    def __streamed_output(self, name, lines):
+        output = StreamedOutput(os.path.join(self.output_dir, name), max_bytes=4, backup_count=1)
+        for line in lines:
+            output.write(line)
+        output.close()
+        return output
+
+    def __read(self, path):
+        with open(path, "r") as f:
+            return f.read()
+
+    def test_save_strings(self):
+        self.test_recorder.test_results_logs.save_test_result_data(
+            test_result_data.TestResultData("sql", "with-security", 0, "output", "error", None)
+        )
+        dest = os.path.join(self.test_recorder.location, "sql", "with-security", "test-results")
+        self.assertEqual(self.__read(os.path.join(dest, "stdout.txt")), "output")
+        self.assertEqual(self.__read(os.path.join(dest, "stderr.txt")), "error")
+
+    def test_save_streamed_output_links(self):
+        stdout = self.__streamed_output("stdout.txt", ["one\n", "two\n"])
+        stderr = self.__streamed_output("stderr.txt", ["error\n"])
+        self.test_recorder.test_results_logs.save_test_result_data(
+            test_result_data.TestResultData("sql", "with-security", 0, stdout, stderr, None)
+        )
+        dest = os.path.join(self.test_recorder.location, "sql", "with-security", "test-results")
+        self.assertEqual(self.__read(os.path.join(dest, "stdout.txt.1")), "one\n")
+        self.assertEqual(self.__read(os.path.join(dest, "stdout.txt")), "two\n")
+        self.assertEqual(self.__read(os.path.join(dest, "stderr.txt")), "error\n")
+        self.assertTrue(os.path.samefile(os.path.join(dest, "stdout.txt"), stdout.path))
+
+    @patch("os.link", side_effect=OSError("Invalid cross-device link"))
+    def test_save_streamed_output_moves(self, *mocks):
+        stdout = self.__streamed_output("stdout.txt", ["output\n"])
+        stderr = self.__streamed_output("stderr.txt", [])
+        self.test_recorder.test_results_logs.save_test_result_data(
+            test_result_data.TestResultData("sql", "with-security", 0, stdout, stderr, None)
+        )
+        dest = os.path.join(self.test_recorder.location, "sql", "with-security", "test-results")
+        self.assertEqual(self.__read(os.path.join(dest, "stdout.txt")), "output\n")
+        self.assertEqual(self.__read(os.path.join(dest, "stderr.txt")), "")
+        self.assertFalse(os.path.exists(stdout.path))